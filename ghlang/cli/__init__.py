@@ -15,6 +15,7 @@ _LAZY_COMMANDS = {
     "config": ("ghlang.cli.config", "config"),
     "github": ("ghlang.cli.github", "github"),
     "local": ("ghlang.cli.local", "local"),
+    "render-batch": ("ghlang.cli.batch", "render_batch"),
     "theme": ("ghlang.cli.theme", "theme"),
 }
 
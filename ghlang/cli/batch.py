@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+import typer
+
+from ghlang import exceptions
+from ghlang import log
+from ghlang import styles
+from ghlang import themes
+from ghlang import utils
+from ghlang.net import linguist
+from ghlang.net import refresh
+from ghlang.styles import utils as style_utils
+
+from . import utils as cli_utils
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One chart to render, read from a line of a batch file.
+
+    Attributes
+    ----------
+    line : int
+        Line number in the batch file, for error messages.
+    stats : dict[str, int]
+        Language name to count mapping.
+    output : Path
+        Destination file; a ``.svg`` suffix writes SVG, ``.png`` writes PNG.
+    style : str
+        Chart style name.
+    theme : str
+        Theme name.
+    title : str | None
+        Chart title, the style's default when *None*.
+    """
+
+    line: int
+    stats: dict[str, int]
+    output: Path
+    style: str = "pixel"
+    theme: str = "light"
+    title: str | None = None
+
+
+def _parse_job(line: int, data: Any) -> BatchJob:
+    """Validate one decoded batch line"""
+    if not isinstance(data, dict):
+        raise exceptions.BatchJobError(f"line {line}: expected a JSON object")
+
+    stats = data.get("stats")
+    if not isinstance(stats, dict) or not all(isinstance(v, int) for v in stats.values()):
+        raise exceptions.BatchJobError(f"line {line}: 'stats' must map languages to counts")
+
+    output = data.get("output")
+    if not isinstance(output, str) or Path(output).suffix.lstrip(".") not in styles.FORMATS:
+        raise exceptions.BatchJobError(
+            f"line {line}: 'output' must be a .{' or .'.join(styles.FORMATS)} path"
+        )
+
+    style = data.get("style", "pixel")
+    if style not in styles.STYLES:
+        raise exceptions.BatchJobError(
+            f"line {line}: unknown style '{style}', available: {', '.join(styles.STYLES)}"
+        )
+
+    title = data.get("title")
+    return BatchJob(
+        line=line,
+        stats=stats,
+        output=Path(output),
+        style=style,
+        theme=str(data.get("theme", "light")),
+        title=str(title) if title is not None else None,
+    )
+
+
+def load_jobs(path: Path) -> list[BatchJob]:
+    """Read chart jobs from a JSONL file.
+
+    Each non-blank line is an object with ``stats`` and ``output`` and
+    optional ``style`` (default ``pixel``), ``theme`` (default ``light``)
+    and ``title``.
+
+    Parameters
+    ----------
+    path : Path
+        JSONL batch file.
+
+    Returns
+    -------
+    list[BatchJob]
+        Jobs in file order.
+
+    Raises
+    ------
+    exceptions.BatchJobError
+        If a line is not valid JSON or not a valid job.
+    """
+    jobs: list[BatchJob] = []
+
+    with path.open(encoding="utf-8") as f:
+        for line, raw in enumerate(f, start=1):
+            if not raw.strip():
+                continue
+
+            try:
+                data = json.loads(raw)
+            except json.JSONDecodeError as e:
+                raise exceptions.BatchJobError(f"line {line}: invalid JSON ({e.msg})")
+
+            jobs.append(_parse_job(line, data))
+
+    return jobs
+
+
+# set once per worker process by _init_worker
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(
+    colors: dict[str, str],
+    theme_colors: dict[str, dict[str, str]],
+    verbose: bool,
+) -> None:
+    """Warm a render worker: Agg backend, pyplot and style imports, shared colors"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    # per-chart messages would break the parent's progress bar
+    log.logger.configure(verbose=verbose, quiet=not verbose)
+    style_utils.reuse_figures()
+
+    _worker["colors"] = colors
+    _worker["themes"] = theme_colors
+    _worker["registry"] = styles.get_style_registry()
+
+
+def _render(job: BatchJob) -> None:
+    """Render one job inside a warm worker"""
+    _worker["registry"][job.style](
+        language_stats=job.stats,
+        colors=_worker["colors"],
+        output=job.output,
+        title=job.title,
+        theme=job.theme,
+        theme_colors=_worker["themes"][job.theme],
+    )
+
+
+def render_jobs(
+    jobs: list[BatchJob],
+    colors: dict[str, str],
+    theme_colors: dict[str, dict[str, str]],
+    workers: int | None = None,
+) -> int:
+    """Render *jobs* in a pool of warm worker processes.
+
+    Each worker imports matplotlib once, on the Agg backend, and reuses one
+    figure per chart size, so the import and setup cost is paid per worker
+    rather than per chart.
+
+    Parameters
+    ----------
+    jobs : list[BatchJob]
+        Charts to render.
+    colors : dict[str, str]
+        Language name to hex color mapping shared by every chart.
+    theme_colors : dict[str, dict[str, str]]
+        Resolved colors for every theme the jobs use.
+    workers : int | None
+        Worker processes, the CPU count when *None*.
+
+    Returns
+    -------
+    int
+        Number of jobs that failed.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    failed = 0
+    start = time.perf_counter()
+
+    # started before the live progress display and its refresh thread
+    pool = cli_utils.process_pool(workers, _init_worker, (colors, theme_colors, log.logger.verbose))
+
+    with pool as executor, log.logger.progress() as progress:
+        task = progress.add_task("Rendering charts...", total=len(jobs))
+        futures = {executor.submit(_render, job): job for job in jobs}
+
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                log.logger.error(f"line {job.line}: couldn't render {job.output}: {e}")
+            progress.advance(task)
+
+    elapsed = time.perf_counter() - start
+    rendered = len(jobs) - failed
+    log.logger.success(
+        f"Rendered {rendered} chart(s) in {elapsed:.1f}s "
+        f"({rendered / elapsed:.1f} charts/s, {workers} worker(s))"
+    )
+    return failed
+
+
+def render_batch(
+    jobs_file: Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        file_okay=True,
+        readable=True,
+        help="JSONL file, one {stats, title, theme, style, output} job per line",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        min=1,
+        help="Render processes (default: CPU count)",
+    ),
+    refresh_colors: bool = typer.Option(
+        False,
+        "--refresh-colors",
+        help="Fetch the full GitHub language color table now (bypass 7-day cache)",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Suppress log output (only show errors)",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Show more details",
+    ),
+) -> None:
+    """Render many charts from a JSONL job file"""
+    log.logger.configure(verbose, quiet=quiet)
+
+    try:
+        jobs = load_jobs(jobs_file)
+    except exceptions.BatchJobError as e:
+        log.logger.error(f"{jobs_file}: {e}")
+        raise typer.Exit(1)
+
+    if not jobs:
+        log.logger.error(f"No jobs in {jobs_file}")
+        raise typer.Exit(1)
+
+    with cli_utils.handle_cli_errors():
+        colors = linguist.load_github_colors(
+            cache_dir=utils.get_config_dir(), force_refresh=refresh_colors
+        )
+        if not colors:
+            log.logger.warning("Couldn't load GitHub colors, charts will be gray")
+            colors = {}
+
+        theme_colors = {name: themes.get_theme(name) for name in {job.theme for job in jobs}}
+        log.logger.info(f"Rendering {len(jobs)} chart(s) from {jobs_file}")
+
+        failed = render_jobs(jobs, colors, theme_colors, workers)
+        refresh.wait_for_refresh()
+
+    if failed:
+        log.logger.error(f"{failed} chart(s) failed")
+        raise typer.Exit(1)
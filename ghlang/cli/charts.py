@@ -2,13 +2,18 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 
 import typer
 
 from ghlang import log
 from ghlang import styles
+from ghlang import themes
+from ghlang import utils
 from ghlang.net import linguist
+from ghlang.net import refresh
 from ghlang.styles import constants as style_constants
+from ghlang.styles import utils as style_utils
 
 
 if TYPE_CHECKING:
@@ -49,16 +54,61 @@ def get_chart_title(items: list | None, custom_title: str | None, source: str) -
     return f"{source} Language Stats"
 
 
+def parse_styles(style: str) -> list[str]:
+    """Split a ``--style`` value into chart style names.
+
+    Parameters
+    ----------
+    style : str
+        A single style, a comma-separated list (``"pixel,pie"``) or ``"all"``.
+
+    Returns
+    -------
+    list[str]
+        Style names in the order given, without duplicates.
+
+    Raises
+    ------
+    typer.Exit
+        If any requested style is unknown.
+    """
+    if style.strip() == "all":
+        return list(styles.STYLES)
+
+    names: list[str] = []
+    for name in (s.strip() for s in style.split(",")):
+        if name and name not in names:
+            names.append(name)
+
+    unknown = [name for name in names if name not in styles.STYLES]
+    if unknown or not names:
+        log.logger.error(
+            f"Unknown style '{', '.join(unknown) or style}', "
+            f"available: {', '.join(styles.STYLES)}, all"
+        )
+        raise typer.Exit(1)
+
+    return names
+
+
 def generate_charts(
     language_stats: dict[str, int],
     cfg: Config,
     title: str | None = None,
     output: Path | None = None,
     style: str = "pixel",
+    *,
+    fmt: str = "png",
     top_n: int = style_constants.TOP_N,
     save_json: bool = False,
+    refresh_colors: bool = False,
 ) -> None:
-    """Load language colors and render a chart in the requested style.
+    """Load language colors once and render every requested chart style.
+
+    Colors, theme and display segments are prepared once and shared by all
+    styles, which render one after another in this process. matplotlib is
+    already imported here, and a worker process would spend longer importing
+    it than rendering its chart.
 
     Parameters
     ----------
@@ -71,35 +121,42 @@ def generate_charts(
     output : Path | None
         Custom output filename or path.
     style : str
-        Chart style name (pixel, pie, bar).
+        Chart style name (pixel, pie, bar), a comma-separated list, or ``all``.
+    fmt : str
+        Output format, ``png`` or ``svg``.
     top_n : int
         Maximum number of languages shown before grouping into "Other".
     save_json : bool
         Also persist the GitHub color map as JSON.
+    refresh_colors : bool
+        Fetch the full language color table now instead of using the cache.
 
     Raises
     ------
     typer.Exit
-        If the requested style is unknown.
+        If a requested style or the format is unknown.
     """
-    style_fn = styles.get_style_registry().get(style)
-    if style_fn is None:
-        log.logger.error(f"Unknown style '{style}', available: {', '.join(styles.STYLES)}")
+    style_names = parse_styles(style)
+    if fmt not in styles.FORMATS:
+        log.logger.error(f"Unknown format '{fmt}', available: {', '.join(styles.FORMATS)}")
         raise typer.Exit(1)
 
     with log.logger.progress() as progress:
-        task = progress.add_task("Generating chart", total=2)
+        task = progress.add_task("Generating charts", total=1 + len(style_names))
 
         progress.update(task, description="Loading language colors...")
         colors_file = cfg.output_dir / "github_colors.json" if save_json else None
-        colors = linguist.load_github_colors(output_file=colors_file)
+        colors = linguist.load_github_colors(
+            output_file=colors_file,
+            cache_dir=utils.get_config_dir(),
+            force_refresh=refresh_colors,
+        )
         progress.advance(task)
 
         if not colors:
             log.logger.warning("Couldn't load GitHub colors, charts will be gray")
             colors = {}
 
-        # all output is PNG for now (SVG support TODO)
         if output:
             if output.is_absolute():
                 parent = output.parent
@@ -112,11 +169,25 @@ def generate_charts(
             parent = cfg.output_dir
             stem = "language"
 
-        chart_output = parent / f"{stem}_{style}.png"
-
-        progress.update(task, description=f"Generating {style} chart...")
-        style_fn(language_stats, colors, chart_output, title, cfg.theme, top_n=top_n)
-        progress.advance(task)
+        # shared by every style, so workers don't recompute or reload them
+        shared: dict[str, Any] = {
+            "language_stats": language_stats,
+            "colors": colors,
+            "title": title,
+            "theme": cfg.theme,
+            "top_n": top_n,
+            "theme_colors": themes.get_theme(cfg.theme),
+            "segments": style_utils.build_display_segments(language_stats, top_n),
+        }
+        jobs = {name: {**shared, "output": parent / f"{stem}_{name}.{fmt}"} for name in style_names}
+
+        for name, kwargs in jobs.items():
+            progress.update(task, description=f"Generating {name} chart...")
+            styles.get_style_registry()[name](**kwargs)
+            progress.advance(task)
+
+    # let stale color and theme caches finish refreshing before the CLI exits
+    refresh.wait_for_refresh()
 
 
 def get_output_path(output_dir: Path, filename: str, save_json: bool, stdout: bool) -> Path | None:
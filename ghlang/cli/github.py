@@ -1,4 +1,9 @@
+import asyncio
 from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Future
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import as_completed
 import json
@@ -11,79 +16,233 @@ from ghlang import exceptions
 from ghlang import log
 from ghlang import utils
 from ghlang.net import github as github_client
+from ghlang.net import snapshot as repo_snapshot
 
 from . import charts
 from . import utils as cli_utils
 
 
-def _fetch_repos(
+def _stream_repos(
     client: github_client.GitHubClient,
     specific_repos: list[str] | None,
-    repos_output: Path | None,
-) -> list[dict]:
-    """Fetch repos from GitHub with progress display"""
+) -> Iterator[list[dict]]:
+    """Yield batches of repos to analyze as soon as they are known"""
     if specific_repos:
         log.logger.info(f"Fetching {len(specific_repos)} specific repos")
-        repos = client.fetch_specific_repos(specific_repos)
+        yield client.fetch_specific_repos(specific_repos)
     else:
         log.logger.info("Fetching repos")
+        yield from client.iter_repo_pages()
 
-        with log.logger.spinner() as progress:
-            progress.add_task("Fetching repos...", total=None)
-            repos = client.list_repos()
 
-        log.logger.info(f"Found {len(repos)} repos")
+_FETCH_ERRORS = (
+    exceptions.HTTPError,
+    exceptions.RequestError,
+    exceptions.GraphQLError,
+    KeyError,
+    ValueError,
+)
 
-    if repos_output and repos:
-        utils.save_json(repos, repos_output)
+_LanguageCallback = Callable[[dict, "dict[str, int] | Exception"], None]
 
-    return repos
 
+def _chunk(batch: list[dict], backend: str) -> Iterator[list[dict]]:
+    """Split a page of repos into the groups one request covers"""
+    size = constants.GRAPHQL_BATCH_SIZE if backend == "graphql" else 1
+    for i in range(0, len(batch), size):
+        yield batch[i : i + size]
 
-def _aggregate_languages(
+
+def _fetch_group(
+    client: github_client.GitHubClient, group: list[dict], backend: str
+) -> dict[str, dict[str, int]]:
+    """Fetch languages for one group of repos, keyed by full name"""
+    if backend == "graphql":
+        return client.get_languages_batch([repo["full_name"] for repo in group])
+
+    full_name = group[0]["full_name"]
+    return {full_name: client.get_repo_languages(full_name)}
+
+
+def _report_group(
+    group: list[dict],
+    results: dict[str, dict[str, int]] | Exception,
+    on_result: _LanguageCallback,
+) -> None:
+    """Hand each repo of a finished group to *on_result*"""
+    for repo in group:
+        if isinstance(results, Exception):
+            on_result(repo, results)
+        elif repo["full_name"] in results:
+            on_result(repo, results[repo["full_name"]])
+        else:
+            on_result(repo, exceptions.GraphQLError("repository could not be resolved"))
+
+
+def _fetch_languages_threaded(
     client: github_client.GitHubClient,
-    repos: list[dict],
-    stats_output: Path | None,
-) -> dict[str, int]:
-    """Fetch and aggregate language stats across repos concurrently"""
-    totals: defaultdict[str, int] = defaultdict(int)
-    processed = 0
-    skipped = 0
+    batches: Iterable[list[dict]],
+    on_result: _LanguageCallback,
+    backend: str = "rest",
+) -> None:
+    """Fetch languages on a thread pool, one persistent connection per worker"""
+    if backend == "graphql":
+        # each query covers a whole group of repos, the controller keeps a few in flight
+        num_workers = client.graphql_concurrency.max_workers
+        log.logger.debug(f"Using up to {num_workers} concurrent GraphQL queries")
+    elif client.concurrency is not None:
+        # the controller decides how many of these are actually sending
+        num_workers = client.concurrency.max_workers
+        log.logger.debug(
+            f"Starting at {client.concurrency.workers} workers, adapting up to {num_workers}"
+        )
+    else:
+        num_workers = constants.API_MAX_WORKERS
+        log.logger.debug(f"Using {num_workers} concurrent workers")
+
+    def report(future: Future[dict[str, dict[str, int]]]) -> None:
+        group = pending.pop(future)
+
+        try:
+            _report_group(group, future.result(), on_result)
+        except _FETCH_ERRORS as e:
+            _report_group(group, e, on_result)
 
-    num_workers = min(constants.API_MAX_WORKERS, len(repos))
-    log.logger.debug(f"Using {num_workers} concurrent workers for {len(repos)} repos")
+    pending: dict[Future[dict[str, dict[str, int]]], list[dict]] = {}
 
     with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        future_to_repo = {
-            executor.submit(client.get_repo_languages, repo["full_name"]): repo for repo in repos
-        }
+        # submit each page as it lands, reporting whatever finished meanwhile
+        for batch in batches:
+            for group in _chunk(batch, backend):
+                pending[executor.submit(_fetch_group, client, group, backend)] = group
 
-        with log.logger.progress() as progress:
-            task = progress.add_task("Processing repos", total=len(repos))
+            for future in [f for f in pending if f.done()]:
+                report(future)
 
-            for future in as_completed(future_to_repo):
-                repo = future_to_repo[future]
-                full_name = repo["full_name"]
+        for future in as_completed(list(pending)):
+            report(future)
+
+
+async def _fetch_languages_async(
+    client: github_client.GitHubClient,
+    batches: Iterable[list[dict]],
+    on_result: _LanguageCallback,
+    backend: str = "rest",
+) -> None:
+    """Fetch languages on one event loop, multiplexed over a keep-alive pool"""
+    log.logger.debug(
+        f"Using {constants.ASYNC_CONCURRENCY} in-flight requests over "
+        f"{constants.ASYNC_MAX_CONNECTIONS} connections"
+    )
+
+    session = client.async_session()
+    semaphore = asyncio.Semaphore(constants.ASYNC_CONCURRENCY)
+
+    async def fetch(group: list[dict]) -> None:
+        async with semaphore:
+            try:
+                if backend == "graphql":
+                    # few, large queries, not worth a second async client
+                    results = await asyncio.to_thread(_fetch_group, client, group, backend)
+                else:
+                    full_name = group[0]["full_name"]
+                    langs = await client.get_repo_languages_async(session, full_name)
+                    results = {full_name: langs}
+            except _FETCH_ERRORS as e:
+                _report_group(group, e, on_result)
+            else:
+                _report_group(group, results, on_result)
+
+    tasks: list[asyncio.Task[None]] = []
+    pages: Iterator[list[dict]] = iter(batches)
+
+    def next_page() -> list[dict] | None:
+        return next(pages, None)
 
-                try:
-                    langs = future.result()
+    try:
+        # listing is blocking, pull pages off-loop and schedule their repos immediately
+        while (batch := await asyncio.to_thread(next_page)) is not None:
+            tasks.extend(asyncio.create_task(fetch(group)) for group in _chunk(batch, backend))
 
-                    for lang, bytes_count in langs.items():
-                        totals[lang] += int(bytes_count)
+        await asyncio.gather(*tasks)
+    finally:
+        await session.aclose()
 
-                    processed += 1
-                    log.logger.debug(f"Processed {full_name}")
 
-                except exceptions.HTTPError as e:
-                    skipped += 1
-                    log.logger.warning(f"Skipped {full_name}: {e}")
-                except (exceptions.RequestError, KeyError, ValueError) as e:
-                    skipped += 1
-                    log.logger.warning(f"Skipped {full_name}: {e}")
+def _aggregate_languages(
+    client: github_client.GitHubClient,
+    batches: Iterable[list[dict]],
+    stats_output: Path | None,
+    engine: str = "thread",
+    backend: str = "rest",
+    snapshot: repo_snapshot.SnapshotStore | None = None,
+) -> dict[str, int]:
+    """Fetch and aggregate language stats, starting on each batch as it arrives"""
+    totals: defaultdict[str, int] = defaultdict(int)
+    processed = 0
+    skipped = 0
+    # filled from the listing thread, merged once fetching is done
+    unchanged: list[dict[str, int]] = []
+
+    with log.logger.progress() as progress:
+        task = progress.add_task("Processing repos", total=None)
+        found = 0
+
+        def feed() -> Iterator[list[dict]]:
+            nonlocal found
+            for batch in batches:
+                found += len(batch)
+                progress.update(task, total=found)
+
+                if snapshot is None:
+                    yield batch
+                    continue
+
+                stale = []
+                for repo in batch:
+                    stored = snapshot.lookup(repo)
+                    if stored is None:
+                        stale.append(repo)
+                    else:
+                        unchanged.append(stored)
+                        progress.advance(task)
+
+                yield stale
+
+        def on_result(repo: dict, result: dict[str, int] | Exception) -> None:
+            nonlocal processed, skipped
+            full_name = repo["full_name"]
+
+            if isinstance(result, Exception):
+                skipped += 1
+                log.logger.warning(f"Skipped {full_name}: {result}")
+            else:
+                for lang, bytes_count in result.items():
+                    totals[lang] += int(bytes_count)
+
+                if snapshot is not None:
+                    snapshot.record(repo, result)
+
+                processed += 1
+                log.logger.debug(f"Processed {full_name}")
+
+            progress.advance(task)
+
+        if engine == "async":
+            asyncio.run(_fetch_languages_async(client, feed(), on_result, backend))
+        else:
+            _fetch_languages_threaded(client, feed(), on_result, backend)
 
-                progress.advance(task)
+    for stored in unchanged:
+        for lang, bytes_count in stored.items():
+            totals[lang] += int(bytes_count)
+    processed += len(unchanged)
 
-    log.logger.success(f"Processed {processed} repositories ({skipped} skipped)")
+    reused = f"{len(unchanged)} unchanged, " if snapshot is not None else ""
+    log.logger.success(
+        f"Processed {processed} repositories "
+        f"({reused}{skipped} skipped, {client.retrier.summary()})"
+    )
 
     result = dict(totals)
     if stats_output:
@@ -168,11 +327,58 @@ def github(
         "pixel",
         "--style",
         "-s",
-        help="Chart style (default: pixel)",
+        help="Chart style, comma-separated list, or 'all' (default: pixel)",
         autocompletion=cli_utils.styles_autocomplete,
     ),
+    fmt: str = typer.Option(
+        "png",
+        "--format",
+        "-f",
+        help="Chart output format: png or svg (default: png)",
+        autocompletion=cli_utils._format_autocomplete,
+    ),
+    refresh_colors: bool = typer.Option(
+        False,
+        "--refresh-colors",
+        help="Fetch the full GitHub language color table now (bypass 7-day cache)",
+    ),
+    engine: str = typer.Option(
+        "thread",
+        "--engine",
+        help="Fetch engine: thread pool or asyncio (default: thread)",
+        autocompletion=cli_utils.engines_autocomplete,
+    ),
+    backend: str = typer.Option(
+        "rest",
+        "--backend",
+        help="Language API: one REST call per repo or batched GraphQL (default: rest)",
+        autocompletion=cli_utils.backends_autocomplete,
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only refetch languages for repos pushed to since the last run",
+    ),
+    max_workers: int = typer.Option(
+        constants.API_MAX_WORKERS_CAP,
+        "--max-workers",
+        min=1,
+        help="Upper bound for the adaptive worker count (thread engine)",
+    ),
 ) -> None:
     """Analyze your GitHub repos"""
+    if engine not in constants.API_ENGINES:
+        log.logger.error(
+            f"Unknown engine '{engine}', available: {', '.join(constants.API_ENGINES)}"
+        )
+        raise typer.Exit(1)
+
+    if backend not in constants.API_BACKENDS:
+        log.logger.error(
+            f"Unknown backend '{backend}', available: {', '.join(constants.API_BACKENDS)}"
+        )
+        raise typer.Exit(1)
+
     try:
         cfg, quiet, json_only = cli_utils.setup_cli_environment(
             config_path=config_path,
@@ -194,27 +400,60 @@ def github(
             affiliation=cfg.affiliation,
             visibility=cfg.visibility,
             ignored_repos=cfg.ignored_repos,
+            cache_dir=utils.get_config_dir() / constants.HTTP_CACHE_DIR,
+            max_workers=max_workers if engine == "thread" else None,
         )
+        snapshot = (
+            repo_snapshot.SnapshotStore(utils.get_config_dir() / constants.SNAPSHOT_FILE)
+            if incremental
+            else None
+        )
+
+        repo_list: list[dict] = []
 
-        repo_list = _fetch_repos(
+        def collect() -> Iterator[list[dict]]:
+            for batch in _stream_repos(client, specific_repos=repos):
+                repo_list.extend(batch)
+                yield batch
+
+        # languages are fetched while later repo pages are still being listed
+        language_stats = _aggregate_languages(
             client,
-            specific_repos=repos,
-            repos_output=charts.get_output_path(
-                cfg.output_dir, "repositories.json", save_json, stdout
+            collect(),
+            stats_output=charts.get_output_path(
+                cfg.output_dir, "language_stats.json", save_json, stdout
             ),
+            engine=engine,
+            backend=backend,
+            snapshot=snapshot,
         )
 
         if not repo_list:
             log.logger.error("No repositories found, nothing to visualize")
             raise typer.Exit(1)
 
-        language_stats = _aggregate_languages(
-            client,
-            repo_list,
-            stats_output=charts.get_output_path(
-                cfg.output_dir, "language_stats.json", save_json, stdout
-            ),
+        log.logger.info(f"Found {len(repo_list)} repos")
+
+        repos_output = charts.get_output_path(
+            cfg.output_dir, "repositories.json", save_json, stdout
         )
+        if repos_output:
+            utils.save_json(repo_list, repos_output)
+
+        if snapshot is not None:
+            if not repos:
+                # full listing, anything missing from it is gone for good
+                snapshot.prune({str(repo["id"]) for repo in repo_list if "id" in repo})
+            snapshot.save()
+            log.logger.debug(snapshot.summary())
+
+        if client.concurrency is not None:
+            log.logger.debug(client.concurrency.summary())
+        if backend == "graphql":
+            log.logger.debug(f"GraphQL {client.graphql_concurrency.summary()}")
+        log.logger.debug(client.limiter.summary())
+        if client.cache:
+            log.logger.debug(client.cache.summary())
 
         if not language_stats:
             log.logger.error("No language statistics found, nothing to visualize")
@@ -231,6 +470,8 @@ def github(
                 title=charts.get_chart_title(repos, title, "GitHub"),
                 output=output,
                 style=style,
+                fmt=fmt,
                 top_n=top_n,
                 save_json=save_json,
+                refresh_colors=refresh_colors,
             )
@@ -120,9 +120,21 @@ def local(
         "pixel",
         "--style",
         "-s",
-        help="Chart style (default: pixel)",
+        help="Chart style, comma-separated list, or 'all' (default: pixel)",
         autocompletion=cli_utils.styles_autocomplete,
     ),
+    fmt: str = typer.Option(
+        "png",
+        "--format",
+        "-f",
+        help="Chart output format: png or svg (default: png)",
+        autocompletion=cli_utils._format_autocomplete,
+    ),
+    refresh_colors: bool = typer.Option(
+        False,
+        "--refresh-colors",
+        help="Fetch the full GitHub language color table now (bypass 7-day cache)",
+    ),
 ) -> None:
     """Analyze local files with tokount"""
     if paths is None:
@@ -200,6 +212,8 @@ def local(
                 title=charts.get_chart_title(paths, title, "Local"),
                 output=output,
                 style=style,
+                fmt=fmt,
                 top_n=top_n,
                 save_json=save_json,
+                refresh_colors=refresh_colors,
             )
@@ -33,6 +33,7 @@ def theme(
 
         if refresh:
             refreshed = themes.load_all_themes(config_dir, force_refresh=True)
+            themes.invalidate_registry()
             remote_count = len(refreshed) - len(static_themes.THEMES)
             console.print(
                 f"[green]Refreshed[/green] remote themes: {remote_count} remote theme(s) loaded"
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 import json
+import multiprocessing
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 
 import typer
 
 from ghlang import config
+from ghlang import constants
 from ghlang import log
 from ghlang import styles
 from ghlang.static import themes as static_themes
@@ -20,7 +25,7 @@ if TYPE_CHECKING:
 
 def _format_autocomplete(incomplete: str) -> list[str]:
     """Return matching output format completions"""
-    return [f for f in ["png", "svg"] if f.startswith(incomplete)]
+    return [f for f in styles.FORMATS if f.startswith(incomplete)]
 
 
 def themes_autocomplete(incomplete: str) -> list[str]:
@@ -43,7 +48,52 @@ def themes_autocomplete(incomplete: str) -> list[str]:
 
 def styles_autocomplete(incomplete: str) -> list[str]:
     """Return matching chart style completions."""
-    return [s for s in styles.STYLES if s.startswith(incomplete)]
+    return [s for s in (*styles.STYLES, "all") if s.startswith(incomplete)]
+
+
+def engines_autocomplete(incomplete: str) -> list[str]:
+    """Return matching fetch engine completions."""
+    return [e for e in constants.API_ENGINES if e.startswith(incomplete)]
+
+
+def backends_autocomplete(incomplete: str) -> list[str]:
+    """Return matching language API backend completions."""
+    return [b for b in constants.API_BACKENDS if b.startswith(incomplete)]
+
+
+def process_pool(
+    workers: int,
+    initializer: Callable[..., object],
+    initargs: tuple[Any, ...],
+) -> ProcessPoolExecutor:
+    """Create a worker process pool that never forks the running CLI.
+
+    Workers start from a forkserver (spawn where that is unavailable), so
+    they don't inherit locks held by the progress display or background
+    refresh threads.
+
+    Parameters
+    ----------
+    workers : int
+        Maximum number of worker processes.
+    initializer : Callable[..., object]
+        Called in each worker before it takes jobs.
+    initargs : tuple[Any, ...]
+        Arguments for *initializer*.
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        The pool; workers start on the first submitted job.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    )
 
 
 def setup_cli_environment(
@@ -18,7 +18,37 @@ API_URL: Final = "https://api.github.com"
 API_VERSION: Final = "2022-11-28"
 API_PER_PAGE: Final = 100
 API_MAX_WORKERS: Final = 10
+API_MAX_WORKERS_CAP: Final = 64
+API_ENGINES: Final[tuple[str, ...]] = ("thread", "async")
+API_BACKENDS: Final[tuple[str, ...]] = ("rest", "graphql")
+GRAPHQL_BATCH_SIZE: Final = 50
+GRAPHQL_LANGUAGES_PER_REPO: Final = 100
+GRAPHQL_MAX_WORKERS: Final = 4  # large queries, kept few to stay clear of secondary limits
+ASYNC_CONCURRENCY: Final = 256
+ASYNC_MAX_CONNECTIONS: Final = 32
 REQUEST_TIMEOUT: Final = 10
+RATE_LIMIT_MAX_RETRIES: Final = 3
+RATE_LIMIT_SECONDARY_WAIT: Final = 60
+
+# retries for transient failures
+RETRY_MAX_ATTEMPTS: Final = 4
+RETRY_BASE_DELAY: Final = 0.5
+RETRY_MAX_DELAY: Final = 8.0
+RETRY_JITTER: Final = 0.5
+RETRY_STATUSES: Final[tuple[int, ...]] = (500, 502, 503, 504)
+
+# adaptive (AIMD) worker count
+ADAPTIVE_MIN_WORKERS: Final = 1
+ADAPTIVE_DECREASE: Final = 0.5
+ADAPTIVE_LATENCY_TOLERANCE: Final = 2.0
+ADAPTIVE_LATENCY_SMOOTHING: Final = 0.2
+
+# HTTP response cache
+HTTP_CACHE_DIR: Final = "http_cache"
+HTTP_CACHE_MAX_BYTES: Final = 64 * 1024 * 1024
+
+# per-repo language snapshots for --incremental
+SNAPSHOT_FILE: Final = "repo_snapshot.json"
 
 # remote URLs
 LINGUIST_URL: Final = (
@@ -28,5 +58,12 @@ MANIFEST_URL: Final = (
     "https://raw.githubusercontent.com/velox-sh/ghlang/master/themes/manifest.json"
 )
 
+# linguist color cache
+LINGUIST_CACHE_FILE: Final = "linguist_colors.json"
+LINGUIST_CACHE_TTL: Final = timedelta(days=7)
+
 # themes
 THEME_CACHE_TTL: Final = timedelta(days=1)
+
+# seconds a one-shot run waits for background cache refreshes before exiting
+REFRESH_WAIT: Final = 5.0
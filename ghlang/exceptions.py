@@ -98,3 +98,11 @@ class HTTPError(GhlangError):
 
 class RequestError(GhlangError):
     """Network-level error (DNS, connection refused, timeout, etc.)."""
+
+
+class GraphQLError(GhlangError):
+    """GraphQL request that returned errors instead of data."""
+
+
+class BatchJobError(GhlangError):
+    """Raised when a ``render-batch`` job file has an invalid line."""
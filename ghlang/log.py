@@ -30,6 +30,16 @@ class Logger:
             self._console = Console()
         return self._console
 
+    @property
+    def verbose(self) -> bool:
+        """Whether debug messages are shown."""
+        return self._verbose
+
+    @property
+    def quiet(self) -> bool:
+        """Whether non-error output is suppressed."""
+        return self._quiet
+
     def configure(self, verbose: bool = False, quiet: bool = False) -> None:
         """Configure verbosity level."""
         self._verbose = verbose
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from ghlang import constants
+from ghlang import log
+
+
+class AdaptiveConcurrency:
+    """AIMD controller for how many requests may be in flight at once.
+
+    Every successful response whose latency stays close to the fastest one
+    seen grows the limit by ``1 / limit`` (about one worker per round of
+    requests). A rate-limited, 5xx or failed request multiplies the limit by
+    ``ADAPTIVE_DECREASE``, at most once per smoothed round-trip so a single
+    burst of errors only backs off once. Slow but successful responses hold
+    the limit where it is.
+
+    Attributes
+    ----------
+    max_workers : int
+        Hard upper bound for the limit.
+    peak : int
+        Most requests that were ever in flight together.
+    backoffs : int
+        Number of multiplicative decreases.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        initial: int = constants.API_MAX_WORKERS,
+    ) -> None:
+        self.max_workers = max(constants.ADAPTIVE_MIN_WORKERS, max_workers)
+        self.peak = 0
+        self.backoffs = 0
+        self._limit = float(min(initial, self.max_workers))
+        self._in_flight = 0
+        self._min_latency: float | None = None
+        self._smoothed: float | None = None
+        self._hold_until = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def workers(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """Block until fewer than :attr:`workers` requests are in flight, then take a slot."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+            self.peak = max(self.peak, self._in_flight)
+
+    def _observe(self, latency: float) -> float:
+        """Track smoothed latency and return the fastest seen (caller holds the lock)"""
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+
+        alpha = constants.ADAPTIVE_LATENCY_SMOOTHING
+        if self._smoothed is None:
+            self._smoothed = latency
+        else:
+            self._smoothed += alpha * (latency - self._smoothed)
+
+        return self._min_latency
+
+    def release(self, latency: float, congested: bool) -> None:
+        """Free a slot and adjust the limit from the request's outcome.
+
+        Parameters
+        ----------
+        latency : float
+            Seconds the request took.
+        congested : bool
+            True if the request failed, was rate limited or got a 5xx.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            now = time.monotonic()
+
+            if congested:
+                if now >= self._hold_until:
+                    old = self.workers
+                    self._limit = max(
+                        float(constants.ADAPTIVE_MIN_WORKERS),
+                        self._limit * constants.ADAPTIVE_DECREASE,
+                    )
+                    self._hold_until = now + (self._smoothed or latency)
+                    self.backoffs += 1
+                    log.logger.debug(f"Backing off from {old} to {self.workers} workers")
+            else:
+                baseline = self._observe(latency)
+                if latency <= baseline * constants.ADAPTIVE_LATENCY_TOLERANCE:
+                    self._limit = min(float(self.max_workers), self._limit + 1 / self._limit)
+
+            self._cond.notify_all()
+
+    def summary(self) -> str:
+        """Return a one-line concurrency summary for verbose output."""
+        return (
+            f"Concurrency: settled at {self.workers} workers "
+            f"(peak {self.peak}, cap {self.max_workers}, {self.backoffs} backoffs)"
+        )
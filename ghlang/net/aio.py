@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from email.message import Message
+from email.parser import Parser
+from http.client import HTTPMessage
+import ssl
+from typing import Any
+from urllib.parse import urlencode
+
+from ghlang import constants
+from ghlang import exceptions
+from ghlang import log
+
+from . import client
+
+
+_Conn = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+_NETWORK_ERRORS = (OSError, ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError)
+
+
+class _ProtocolError(Exception):
+    """Malformed HTTP response from the server"""
+
+
+async def _read_body(
+    reader: asyncio.StreamReader, status: int, headers: Message[str, str]
+) -> bytes:
+    """Read a response body framed by chunked encoding, Content-Length, or EOF"""
+    if status in (204, 304) or 100 <= status < 200:
+        return b""
+
+    if "chunked" in headers.get("Transfer-Encoding", "").lower():
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            try:
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+            except ValueError as e:
+                raise _ProtocolError(f"bad chunk size {size_line!r}") from e
+
+            if size == 0:
+                # skip trailers up to the terminating blank line
+                while (await reader.readline()).strip():
+                    pass
+                return b"".join(chunks)
+
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    length = headers.get("Content-Length")
+    if length is not None:
+        try:
+            size = int(length)
+        except ValueError as e:
+            raise _ProtocolError(f"bad Content-Length {length!r}") from e
+        return await reader.readexactly(size)
+
+    return await reader.read()
+
+
+class AsyncSession(client.Session):
+    """Asyncio variant of :class:`client.Session` over a bounded keep-alive pool.
+
+    Shares headers, cache, rate limiter and retry policy semantics with the
+    threaded session. Requests beyond *max_connections* wait for a pooled
+    connection instead of opening new ones.
+
+    Attributes
+    ----------
+    max_connections : int
+        Upper bound on simultaneously open connections per origin.
+    """
+
+    def __init__(
+        self,
+        session: client.Session,
+        max_connections: int = constants.ASYNC_MAX_CONNECTIONS,
+    ) -> None:
+        super().__init__(cache=session.cache, limiter=session.limiter, retrier=session.retrier)
+        self.headers = dict(session.headers)
+        self.max_connections = max_connections
+        self._idle: dict[str, list[_Conn]] = {}
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._ssl = ssl.create_default_context()
+
+    async def _open(self, host: str) -> _Conn:
+        """Open a new connection to ``scheme://host[:port]``"""
+        scheme, _, netloc = host.partition("://")
+        hostname, _, port = netloc.partition(":")
+        https = scheme != "http"
+
+        return await asyncio.wait_for(
+            asyncio.open_connection(
+                hostname,
+                int(port) if port else (443 if https else 80),
+                ssl=self._ssl if https else None,
+            ),
+            timeout=constants.REQUEST_TIMEOUT,
+        )
+
+    def _close(self, conn: _Conn) -> None:
+        conn[1].close()
+
+    async def _exchange(
+        self,
+        conn: _Conn,
+        host: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+    ) -> tuple[client.Response, bool]:
+        """Send one request on *conn*; return the response and whether it can be reused"""
+        reader, writer = conn
+        netloc = host.partition("://")[2]
+
+        lines = [f"GET {path} HTTP/1.1", f"Host: {netloc}", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        parts = status_line.decode("latin-1").split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+            raise _ProtocolError(f"bad status line {status_line!r}")
+        status = int(parts[1])
+
+        raw_headers = []
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            raw_headers.append(line.decode("latin-1"))
+        parsed: HTTPMessage = Parser(_class=HTTPMessage).parsestr("".join(raw_headers))
+
+        body = await _read_body(reader, status, parsed)
+        framed = (
+            status in (204, 304)
+            or "Content-Length" in parsed
+            or "chunked" in parsed.get("Transfer-Encoding", "").lower()
+        )
+        reusable = framed and parsed.get("Connection", "").lower() != "close"
+
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise _ProtocolError(f"response body is not UTF-8: {e}") from e
+
+        return client.Response(status, parsed, text, url), reusable
+
+    async def _acquire(self, host: str) -> _Conn:
+        """Wait for a pool slot and return an idle or fresh connection"""
+        slots = self._slots.setdefault(host, asyncio.Semaphore(self.max_connections))
+        await slots.acquire()
+
+        idle = self._idle.setdefault(host, [])
+        if idle:
+            return idle.pop()
+
+        try:
+            return await self._open(host)
+        except BaseException:
+            slots.release()
+            raise
+
+    def _release(self, host: str, conn: _Conn | None) -> None:
+        """Return *conn* to the pool (or drop it when None) and free its slot"""
+        if conn is not None:
+            self._idle[host].append(conn)
+        self._slots[host].release()
+
+    async def _roundtrip(
+        self, host: str, conn: _Conn, path: str, url: str, headers: dict[str, str]
+    ) -> tuple[client.Response, bool]:
+        """Run one exchange on *conn* within the request timeout"""
+        return await asyncio.wait_for(
+            self._exchange(conn, host, path, url, headers),
+            timeout=constants.REQUEST_TIMEOUT,
+        )
+
+    async def _send_async(
+        self, host: str, path: str, url: str, headers: dict[str, str]
+    ) -> client.Response:
+        """Send a GET on a pooled connection, reconnecting once if it went stale"""
+        try:
+            conn = await self._acquire(host)
+        except _NETWORK_ERRORS as e:
+            raise exceptions.RequestError(str(e) or type(e).__name__) from e
+
+        # the slot goes back on every exit, including errors and cancellation
+        reusable = False
+        try:
+            try:
+                r, reusable = await self._roundtrip(host, conn, path, url, headers)
+                return r
+            except (*_NETWORK_ERRORS, _ProtocolError):
+                # stale keep-alive connection, reconnect once on the same slot
+                self._close(conn)
+
+            try:
+                conn = await self._open(host)
+                r, reusable = await self._roundtrip(host, conn, path, url, headers)
+                return r
+            except (*_NETWORK_ERRORS, _ProtocolError) as e:
+                raise exceptions.RequestError(str(e) or type(e).__name__) from e
+        finally:
+            if not reusable:
+                self._close(conn)
+            self._release(host, conn if reusable else None)
+
+    async def get_async(self, url: str, params: dict[str, Any] | None = None) -> client.Response:
+        """Async counterpart of :meth:`client.Session.get`.
+
+        Parameters
+        ----------
+        url : str
+            Request URL.
+        params : dict[str, Any] | None
+            Query parameters appended to the URL.
+
+        Returns
+        -------
+        client.Response
+            The HTTP response.
+        """
+        if params:
+            url = f"{url}?{urlencode(params)}"
+
+        host, path = client.split_url(url)
+        key, entry, headers = self._conditional(url)
+
+        attempt = 0
+        throttles = 0
+
+        while True:
+            if self.limiter is not None:
+                await self.limiter.acquire_async()
+
+            try:
+                r = await self._send_async(host, path, url, headers)
+            except exceptions.RequestError as e:
+                if self.limiter is not None:
+                    self.limiter.release()
+                if self.retrier is None or not self.retrier.can_retry(attempt):
+                    raise
+                await self.retrier.backoff_async(attempt, url, str(e))
+                attempt += 1
+                continue
+
+            self._log_rate_limit(r)
+
+            if self.limiter is not None:
+                self.limiter.update(r)
+                if throttles < constants.RATE_LIMIT_MAX_RETRIES and self.limiter.is_rate_limited(r):
+                    delay = self.limiter.backoff(r)
+                    log.logger.warning(f"Rate limited on {url}, retrying in {delay:.0f}s")
+                    throttles += 1
+                    continue
+
+            if (
+                self.retrier is not None
+                and self.retrier.is_transient(r.status_code)
+                and self.retrier.can_retry(attempt)
+            ):
+                await self.retrier.backoff_async(attempt, url, f"HTTP {r.status_code}")
+                attempt += 1
+                continue
+
+            break
+
+        r = self._apply_cache(r, key, entry)
+        r.raise_for_status()
+        return r
+
+    async def aclose(self) -> None:
+        """Close every pooled connection and wait for the transports to shut down."""
+        for conns in self._idle.values():
+            for conn in conns:
+                self._close(conn)
+                # the peer may already have dropped it
+                with contextlib.suppress(*_NETWORK_ERRORS):
+                    await conn[1].wait_closed()
+            conns.clear()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import contextlib
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+
+from ghlang import constants
+from ghlang import log
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body plus the validators needed to revalidate it.
+
+    Attributes
+    ----------
+    url : str
+        The request URL the entry was stored for.
+    etag : str | None
+        ``ETag`` header of the stored response.
+    last_modified : str | None
+        ``Last-Modified`` header of the stored response.
+    headers : list[tuple[str, str]]
+        Response headers, in original order.
+    body : str
+        Decoded response body.
+    """
+
+    url: str
+    etag: str | None
+    last_modified: str | None
+    headers: list[tuple[str, str]]
+    body: str
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return ``If-None-Match`` / ``If-Modified-Since`` headers for this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """On-disk conditional-request cache with LRU eviction.
+
+    Entries are stored one JSON file per key. Keys hash the URL together with
+    the caller's auth identity so responses are never shared across tokens.
+
+    Attributes
+    ----------
+    cache_dir : Path
+        Directory holding the entry files.
+    max_bytes : int
+        Size cap for all entries combined; least recently used go first.
+    hits : int
+        Requests answered from the cache after a ``304 Not Modified``.
+    misses : int
+        Requests that needed a full response body.
+    evictions : int
+        Entries dropped to stay under *max_bytes*.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = constants.HTTP_CACHE_MAX_BYTES) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> entry size, oldest first
+        self._index: OrderedDict[str, int] | None = None
+        self._total = 0
+
+    @staticmethod
+    def make_key(url: str, identity: str) -> str:
+        """Hash *url* and *identity* (e.g. the auth header) into a cache key."""
+        return hashlib.sha256(f"{identity}\0{url}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        """Scan the cache dir once, ordering entries by last access"""
+        if self._index is not None:
+            return self._index
+
+        entries: list[tuple[float, str, int]] = []
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, path.stem, st.st_size))
+
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._total = sum(self._index.values())
+        return self._index
+
+    def _discard(self, key: str) -> None:
+        """Drop *key* from disk and the index (caller holds the lock)"""
+        if self._index is not None:
+            self._total -= self._index.pop(key, 0)
+
+        with contextlib.suppress(OSError):
+            self._path(key).unlink()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the stored entry for *key*, or None if absent or unreadable.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from :meth:`make_key`.
+
+        Returns
+        -------
+        CacheEntry | None
+            The stored entry. Reading it marks it as most recently used.
+        """
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                return None
+
+            path = self._path(key)
+            try:
+                data = json.loads(path.read_text())
+                entry = CacheEntry(
+                    url=data["url"],
+                    etag=data.get("etag"),
+                    last_modified=data.get("last_modified"),
+                    headers=[(k, v) for k, v in data["headers"]],
+                    body=data["body"],
+                )
+                os.utime(path)
+
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError, OSError):
+                self._discard(key)
+                return None
+
+            index.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store *entry* under *key*, evicting old entries past the size cap.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from :meth:`make_key`.
+        entry : CacheEntry
+            Response data and validators to persist.
+        """
+        payload = json.dumps(
+            {
+                "url": entry.url,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "headers": entry.headers,
+                "body": entry.body,
+            }
+        )
+        size = len(payload.encode())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            index = self._load_index()
+            path = self._path(key)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(payload)
+                tmp.replace(path)
+            except OSError as e:
+                log.logger.debug(f"Couldn't write HTTP cache entry: {e}")
+                return
+
+            self._total += size - index.pop(key, 0)
+            index[key] = size
+
+            while self._total > self.max_bytes and index:
+                oldest = next(iter(index))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def record(self, hit: bool) -> None:
+        """Count a cache hit or miss."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def summary(self) -> str:
+        """Return a one-line hit/miss summary for verbose output."""
+        return f"HTTP cache: {self.hits} hits, {self.misses} misses, {self.evictions} evicted"
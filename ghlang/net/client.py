@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from email.message import Message
+from http.client import HTTPConnection
 from http.client import HTTPResponse
 from http.client import HTTPSConnection
 import json
 import threading
+import time
 from typing import Any
 from urllib.error import HTTPError as _UrllibHTTPError
 from urllib.error import URLError
@@ -17,6 +19,11 @@ from ghlang import constants
 from ghlang import exceptions
 from ghlang import log
 
+from . import adaptive
+from . import cache as http_cache
+from . import ratelimit
+from . import retry
+
 
 class Response:
     """Thin wrapper over an HTTP response.
@@ -27,11 +34,21 @@ class Response:
         HTTP status code.
     url : str
         The request URL.
+    from_cache : bool
+        True when the body was served from the response cache after a 304.
     """
 
-    def __init__(self, status_code: int, headers: Message[str, str], body: str, url: str) -> None:
+    def __init__(
+        self,
+        status_code: int,
+        headers: Message[str, str],
+        body: str,
+        url: str,
+        from_cache: bool = False,
+    ) -> None:
         self.status_code = status_code
         self.url = url
+        self.from_cache = from_cache
         self._headers = headers
         self._body = body
 
@@ -88,6 +105,26 @@ def get(url: str, *, timeout: int, headers: dict[str, str] | None = None) -> Res
     return Response.from_urllib(raw, url)
 
 
+def split_url(url: str) -> tuple[str, str]:
+    """Split *url* into a connection key (``scheme://host[:port]``) and request path.
+
+    Parameters
+    ----------
+    url : str
+        Absolute request URL.
+
+    Returns
+    -------
+    tuple[str, str]
+        ``(origin, path)`` where *path* includes the query string.
+    """
+    parsed = urlparse(url)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    return f"{parsed.scheme or 'https'}://{parsed.netloc}", path
+
+
 class Session:
     """HTTP session with persistent headers and per-thread connection reuse.
 
@@ -95,11 +132,33 @@ class Session:
     ----------
     headers : dict[str, str]
         Default headers sent with every request.
+    cache : http_cache.ResponseCache | None
+        Conditional-request cache; responses carrying an ``ETag`` or
+        ``Last-Modified`` are stored and revalidated on later requests.
+    limiter : ratelimit.RateLimiter | None
+        Scheduler shared by all threads; rate-limited responses are retried
+        once the limit resets instead of being returned.
+    retrier : retry.Retrier | None
+        Backoff policy for network errors and transient (5xx) responses.
+        Without one, failures surface on the first attempt.
+    concurrency : adaptive.AdaptiveConcurrency | None
+        Controller bounding how many requests are in flight across threads,
+        fed with each request's latency and outcome.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: http_cache.ResponseCache | None = None,
+        limiter: ratelimit.RateLimiter | None = None,
+        retrier: retry.Retrier | None = None,
+        concurrency: adaptive.AdaptiveConcurrency | None = None,
+    ) -> None:
         # github rejects requests without user-agent
         self.headers: dict[str, str] = {"User-Agent": "ghlang"}
+        self.cache = cache
+        self.limiter = limiter
+        self.retrier = retrier
+        self.concurrency = concurrency
         # each thread gets its own connection (HTTPSConnection is not thread-safe)
         self._local = threading.local()
 
@@ -107,14 +166,17 @@ class Session:
         """Merge headers into the session defaults."""
         self.headers.update(headers)
 
-    def _get_conn(self, host: str) -> HTTPSConnection:
+    def _get_conn(self, host: str) -> HTTPConnection:
         """Get or create a persistent connection"""
         if not hasattr(self._local, "conns"):
             self._local.conns = {}
 
-        conns: dict[str, HTTPSConnection] = self._local.conns
+        # plain http is only used against local stand-in servers
+        conns: dict[str, HTTPConnection] = self._local.conns
         if host not in conns:
-            conns[host] = HTTPSConnection(host, timeout=constants.REQUEST_TIMEOUT)
+            scheme, _, netloc = host.partition("://")
+            conn_cls = HTTPConnection if scheme == "http" else HTTPSConnection
+            conns[host] = conn_cls(netloc, timeout=constants.REQUEST_TIMEOUT)
 
         return conns[host]
 
@@ -123,13 +185,99 @@ class Session:
         if hasattr(self._local, "conns"):
             self._local.conns.pop(host, None)
 
-    def _do_get(self, conn: HTTPSConnection, path: str, url: str) -> Response:
+    def _do_get(
+        self,
+        conn: HTTPConnection,
+        path: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
         """Execute a GET on an existing connection"""
-        conn.request("GET", path, headers=self.headers)
+        conn.request("GET", path, headers=headers or self.headers)
         raw = conn.getresponse()
         body = raw.read().decode("utf-8")
         return Response(raw.status, raw.headers, body, url)
 
+    def _do_post(
+        self,
+        conn: HTTPConnection,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> Response:
+        """Execute a POST on an existing connection"""
+        conn.request("POST", path, body=body, headers=headers)
+        raw = conn.getresponse()
+        return Response(raw.status, raw.headers, raw.read().decode("utf-8"), url)
+
+    def _dispatch(
+        self,
+        conn: HTTPConnection,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+    ) -> Response:
+        if body is None:
+            return self._do_get(conn, path, url, headers)
+        return self._do_post(conn, path, url, headers, body)
+
+    def _send(
+        self,
+        host: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None = None,
+    ) -> Response:
+        """Send a GET (or POST with *body*), reconnecting once if the connection went stale"""
+        conn = self._get_conn(host)
+
+        try:
+            return self._dispatch(conn, path, url, headers, body)
+        except (OSError, ConnectionError):
+            # stale connection, reconnect once
+            self._drop_conn(host)
+            conn = self._get_conn(host)
+
+            try:
+                return self._dispatch(conn, path, url, headers, body)
+            except (OSError, ConnectionError) as e:
+                raise exceptions.RequestError(str(e)) from e
+
+    def _is_congested(self, r: Response) -> bool:
+        """Return True if *r* signals the API wants fewer concurrent requests"""
+        if r.status_code == 429 or (
+            self.retrier is not None and self.retrier.is_transient(r.status_code)
+        ):
+            return True
+        return self.limiter is not None and self.limiter.is_rate_limited(r)
+
+    def _send_observed(
+        self,
+        host: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None = None,
+    ) -> Response:
+        """Send inside a concurrency slot, reporting latency and outcome to the controller"""
+        if self.concurrency is None:
+            return self._send(host, path, url, headers, body)
+
+        self.concurrency.acquire()
+        start = time.monotonic()
+
+        try:
+            r = self._send(host, path, url, headers, body)
+        except Exception:
+            self.concurrency.release(time.monotonic() - start, congested=True)
+            raise
+
+        self.concurrency.release(time.monotonic() - start, congested=self._is_congested(r))
+        return r
+
     def _log_rate_limit(self, response: Response) -> None:
         """Log remaining API rate limit from response headers"""
         remaining = response.headers.get("X-RateLimit-Remaining")
@@ -138,8 +286,113 @@ class Session:
         if remaining and limit:
             log.logger.debug(f"Rate limit: {remaining}/{limit} remaining")
 
+    def _request(
+        self,
+        host: str,
+        path: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None = None,
+    ) -> Response:
+        """Send a request, retrying rate-limited and transient failures"""
+        attempt = 0
+        throttles = 0
+
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+
+            try:
+                r = self._send_observed(host, path, url, headers, body)
+            except exceptions.RequestError as e:
+                if self.limiter is not None:
+                    self.limiter.release()
+                if self.retrier is None or not self.retrier.can_retry(attempt):
+                    raise
+                self.retrier.backoff(attempt, url, str(e))
+                attempt += 1
+                continue
+
+            self._log_rate_limit(r)
+
+            if self.limiter is not None:
+                self.limiter.update(r)
+                if throttles < constants.RATE_LIMIT_MAX_RETRIES and self.limiter.is_rate_limited(r):
+                    delay = self.limiter.backoff(r)
+                    log.logger.warning(f"Rate limited on {url}, retrying in {delay:.0f}s")
+                    throttles += 1
+                    continue
+
+            if (
+                self.retrier is not None
+                and self.retrier.is_transient(r.status_code)
+                and self.retrier.can_retry(attempt)
+            ):
+                self.retrier.backoff(attempt, url, f"HTTP {r.status_code}")
+                attempt += 1
+                continue
+
+            return r
+
+    def _cache_key(self, url: str) -> str:
+        """Key cached responses by URL, auth identity and media type"""
+        identity = f"{self.headers.get('Authorization', '')}|{self.headers.get('Accept', '')}"
+        return http_cache.ResponseCache.make_key(url, identity)
+
+    def _conditional(self, url: str) -> tuple[str, http_cache.CacheEntry | None, dict[str, str]]:
+        """Look up *url* in the cache and build request headers with its validators"""
+        if self.cache is None:
+            return "", None, self.headers
+
+        key = self._cache_key(url)
+        entry = self.cache.get(key)
+        if entry is None:
+            return key, None, self.headers
+
+        return key, entry, {**self.headers, **entry.conditional_headers()}
+
+    def _apply_cache(self, r: Response, key: str, entry: http_cache.CacheEntry | None) -> Response:
+        """Serve a 304 from *entry*, or store a fresh 200 for revalidation"""
+        if self.cache is None:
+            return r
+
+        if r.status_code == 304 and entry is not None:
+            self.cache.record(hit=True)
+
+            # fresh headers (rate limit, etag) win over the stored ones
+            merged: Message[str, str] = Message()
+            for name, value in entry.headers:
+                merged[name] = value
+            for name, value in r.headers.items():
+                del merged[name]
+                merged[name] = value
+
+            return Response(200, merged, entry.body, r.url, from_cache=True)
+
+        self.cache.record(hit=False)
+
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        if r.status_code == 200 and (etag or last_modified):
+            self.cache.put(
+                key,
+                http_cache.CacheEntry(
+                    url=r.url,
+                    etag=etag,
+                    last_modified=last_modified,
+                    headers=list(r.headers.items()),
+                    body=r.text,
+                ),
+            )
+
+        return r
+
     def get(self, url: str, params: dict[str, Any] | None = None) -> Response:
-        """Send a GET request with connection reuse and rate-limit logging.
+        """Send a GET request with connection reuse and rate-limit handling.
+
+        When a cache is configured, stored validators are sent as
+        ``If-None-Match`` / ``If-Modified-Since`` and a ``304`` is answered
+        from the cache as a regular ``200`` response.
 
         Parameters
         ----------
@@ -156,26 +409,34 @@ class Session:
         if params:
             url = f"{url}?{urlencode(params)}"
 
-        parsed = urlparse(url)
-        host = parsed.hostname or ""
-        path = parsed.path
-        if parsed.query:
-            path = f"{path}?{parsed.query}"
+        host, path = split_url(url)
+        key, entry, headers = self._conditional(url)
 
-        conn = self._get_conn(host)
+        r = self._request(host, path, url, headers)
+        r = self._apply_cache(r, key, entry)
+        r.raise_for_status()
+        return r
 
-        try:
-            r = self._do_get(conn, path, url)
-        except (OSError, ConnectionError):
-            # stale connection, reconnect once
-            self._drop_conn(host)
-            conn = self._get_conn(host)
+    def post(self, url: str, payload: Any) -> Response:
+        """Send a JSON POST request with the same retry and rate-limit handling as GET.
 
-            try:
-                r = self._do_get(conn, path, url)
-            except (OSError, ConnectionError) as e:
-                raise exceptions.RequestError(str(e)) from e
+        POST responses are never cached.
+
+        Parameters
+        ----------
+        url : str
+            Request URL.
+        payload : Any
+            JSON-serializable request body.
+
+        Returns
+        -------
+        Response
+            The HTTP response.
+        """
+        host, path = split_url(url)
+        headers = {**self.headers, "Content-Type": "application/json"}
 
-        self._log_rate_limit(r)
+        r = self._request(host, path, url, headers, json.dumps(payload).encode())
         r.raise_for_status()
         return r
@@ -1,15 +1,73 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 import fnmatch
+from pathlib import Path
 import re
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
 
 from ghlang import constants
 from ghlang import exceptions
 from ghlang import log
 
+from . import adaptive
+from . import aio
+from . import cache as http_cache
 from . import client
+from . import ratelimit
+from . import retry
+
+
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+
+def _parse_link_header(value: str) -> dict[str, str]:
+    """Map rel names to URLs from an RFC 8288 ``Link`` header"""
+    return {rel: url for url, rel in _LINK_RE.findall(value)}
+
+
+def _page_number(url: str | None) -> int | None:
+    """Extract the ``page`` query parameter from a pagination URL"""
+    if not url:
+        return None
+
+    pages = parse_qs(urlparse(url).query).get("page")
+    if not pages or not pages[0].isdigit():
+        return None
+
+    return int(pages[0])
+
+
+_GRAPHQL_LANGUAGES_FRAGMENT = f"""
+fragment repoLanguages on Repository {{
+  languages(first: {constants.GRAPHQL_LANGUAGES_PER_REPO}) {{
+    totalCount
+    edges {{ size node {{ name }} }}
+  }}
+}}
+"""
+
+
+def _build_languages_query(full_names: list[str]) -> tuple[str, dict[str, str]]:
+    """Build one aliased GraphQL query fetching languages for every repo in *full_names*"""
+    params = []
+    fields = []
+    variables = {}
+
+    for i, full_name in enumerate(full_names):
+        owner, name = full_name.split("/", 1)
+        params += [f"$o{i}: String!", f"$n{i}: String!"]
+        fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...repoLanguages }}")
+        variables[f"o{i}"] = owner
+        variables[f"n{i}"] = name
+
+    body = "\n  ".join(fields)
+    query = f"query({', '.join(params)}) {{\n  {body}\n}}\n"
+    return query + _GRAPHQL_LANGUAGES_FRAGMENT, variables
 
 
 class GitHubClient:
-    """Client for interacting with the GitHub REST API.
+    """Client for interacting with the GitHub REST and GraphQL APIs.
 
     Attributes
     ----------
@@ -21,6 +79,17 @@ class GitHubClient:
         Repo visibility filter.
     _ignored_repos : list[str]
         Glob patterns for repos to skip.
+    cache : http_cache.ResponseCache | None
+        Conditional-request cache shared by all requests, if enabled.
+    limiter : ratelimit.RateLimiter
+        Rate-limit scheduler shared by all worker threads.
+    retrier : retry.Retrier
+        Backoff policy and counters for transient failures.
+    concurrency : adaptive.AdaptiveConcurrency | None
+        AIMD controller for in-flight REST requests, when *max_workers* is set.
+    graphql_concurrency : adaptive.AdaptiveConcurrency
+        AIMD controller for in-flight GraphQL queries, capped at
+        ``GRAPHQL_MAX_WORKERS``.
     """
 
     def __init__(
@@ -29,9 +98,21 @@ class GitHubClient:
         affiliation: str,
         visibility: str,
         ignored_repos: list[str],
+        cache_dir: Path | None = None,
+        retry_policy: retry.RetryPolicy | None = None,
+        max_workers: int | None = None,
     ) -> None:
         self._api = constants.API_URL
-        self._session = client.Session()
+        self.cache = http_cache.ResponseCache(cache_dir) if cache_dir else None
+        self.limiter = ratelimit.RateLimiter()
+        self.retrier = retry.Retrier(retry_policy)
+        self.concurrency = adaptive.AdaptiveConcurrency(max_workers) if max_workers else None
+        self._session = client.Session(
+            cache=self.cache,
+            limiter=self.limiter,
+            retrier=self.retrier,
+            concurrency=self.concurrency,
+        )
         self._session.update_headers(
             {
                 "Authorization": f"Bearer {token}",
@@ -39,6 +120,17 @@ class GitHubClient:
                 "X-GitHub-Api-Version": constants.API_VERSION,
             }
         )
+        # graphql has its own rate-limit budget and far heavier requests,
+        # so it gets its own limiter and a small concurrency controller
+        self.graphql_concurrency = adaptive.AdaptiveConcurrency(
+            constants.GRAPHQL_MAX_WORKERS, initial=constants.GRAPHQL_MAX_WORKERS // 2
+        )
+        self._graphql_session = client.Session(
+            limiter=ratelimit.RateLimiter(),
+            retrier=self.retrier,
+            concurrency=self.graphql_concurrency,
+        )
+        self._graphql_session.update_headers({"Authorization": f"Bearer {token}"})
         self._affiliation = affiliation
         self._visibility = visibility
         self._ignored_repos = ignored_repos
@@ -94,6 +186,81 @@ class GitHubClient:
         r = self._session.get(f"{self._api}/repos/{full_name}")
         return dict(r.json())
 
+    def _get_repos_page(self, page: int) -> client.Response:
+        """Fetch one page of /user/repos"""
+        return self._session.get(
+            f"{self._api}/user/repos",
+            params={
+                "per_page": self._per_page,
+                "page": page,
+                "affiliation": self._affiliation,
+                "visibility": self._visibility,
+                "sort": "pushed",
+                "direction": "desc",
+            },
+        )
+
+    def _iter_raw_pages(self) -> Iterator[list[dict[str, object]]]:
+        """Yield /user/repos page bodies in page order as they arrive"""
+        first = self._get_repos_page(1)
+        yield list(first.json())
+
+        links = _parse_link_header(first.headers.get("Link") or "")
+        last_page = _page_number(links.get("last"))
+
+        if last_page and last_page > 1:
+            # page 1 told us how many there are, fetch the rest at once
+            pages = range(2, last_page + 1)
+            num_workers = min(constants.API_MAX_WORKERS, len(pages))
+            log.logger.debug(f"Fetching {len(pages)} more repo pages with {num_workers} workers")
+
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                for r in executor.map(self._get_repos_page, pages):
+                    yield list(r.json())
+
+        else:
+            # no last-page hint, follow rel="next" one page at a time
+            page = 1
+            while "next" in links:
+                page += 1
+                r = self._get_repos_page(page)
+                yield list(r.json())
+                links = _parse_link_header(r.headers.get("Link") or "")
+
+    def iter_repo_pages(self) -> Iterator[list[dict[str, object]]]:
+        """Stream repos matching affiliation/visibility filters, one page at a time.
+
+        The ``Link: rel="last"`` header of the first page is used to fetch
+        the remaining pages concurrently. Each page is deduplicated against
+        the ones before it and filtered by the ignore patterns before it is
+        yielded, so callers can start work on it right away.
+
+        Yields
+        ------
+        list[dict]
+            Filtered repo dicts from one page (possibly empty).
+        """
+        seen: set[str] = set()
+
+        for batch in self._iter_raw_pages():
+            unique_repos = []
+
+            for repo in batch:
+                full_name = str(repo["full_name"])
+
+                if full_name in seen:
+                    continue
+
+                seen.add(full_name)
+
+                if self._should_ignore_repo(full_name):
+                    log.logger.debug(f"Ignoring repo: {full_name}")
+                    continue
+
+                unique_repos.append(repo)
+
+            yield unique_repos
+
     def list_repos(self) -> list[dict[str, object]]:
         """Paginate all repos matching affiliation/visibility filters.
 
@@ -102,53 +269,101 @@ class GitHubClient:
         list[dict]
             Deduplicated, filtered repo dicts.
         """
-        repos = []
-        page = 1
-
-        while True:
-            r = self._session.get(
-                f"{self._api}/user/repos",
-                params={
-                    "per_page": self._per_page,
-                    "page": page,
-                    "affiliation": self._affiliation,
-                    "visibility": self._visibility,
-                    "sort": "pushed",
-                    "direction": "desc",
-                },
-            )
-
-            batch = r.json()
-            if not batch:
-                break
-
-            repos.extend(batch)
-            page += 1
-
-        seen = set()
-        unique_repos = []
-
-        for repo in repos:
-            full_name = repo["full_name"]
-
-            if full_name in seen:
-                continue
+        return [repo for batch in self.iter_repo_pages() for repo in batch]
 
-            seen.add(full_name)
+    def get_repo_languages(self, full_name: str) -> dict[str, int]:
+        """Fetch byte-count language breakdown for a single repo.
+
+        Parameters
+        ----------
+        full_name : str
+            Repository in ``owner/repo`` format.
 
-            if self._should_ignore_repo(full_name):
-                log.logger.debug(f"Ignoring repo: {full_name}")
+        Returns
+        -------
+        dict[str, int]
+            Language name to byte count mapping.
+        """
+        r = self._session.get(f"{self._api}/repos/{full_name}/languages")
+        return dict(r.json())
+
+    def get_languages_batch(self, full_names: list[str]) -> dict[str, dict[str, int]]:
+        """Fetch language breakdowns for many repos in a single GraphQL query.
+
+        Parameters
+        ----------
+        full_names : list[str]
+            Repositories in ``owner/repo`` format, at most
+            ``GRAPHQL_BATCH_SIZE`` per call.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Repo name to language byte counts, same shape as
+            :meth:`get_repo_languages`. Repos GraphQL could not resolve are
+            left out.
+
+        Raises
+        ------
+        GraphQLError
+            If the query returned no data at all.
+        """
+        query, variables = _build_languages_query(full_names)
+        r = self._graphql_session.post(
+            f"{self._api}/graphql", {"query": query, "variables": variables}
+        )
+
+        payload = r.json()
+        data = payload.get("data")
+        if not data:
+            messages = [e.get("message", "") for e in payload.get("errors", [])]
+            raise exceptions.GraphQLError("; ".join(messages) or "empty GraphQL response")
+
+        results: dict[str, dict[str, int]] = {}
+        for i, full_name in enumerate(full_names):
+            repo = data.get(f"r{i}")
+            if repo is None:
+                log.logger.debug(f"GraphQL couldn't resolve {full_name}")
                 continue
 
-            unique_repos.append(repo)
+            languages = repo["languages"]
+            if languages["totalCount"] > len(languages["edges"]):
+                # more languages than one page holds, let REST do the long tail
+                results[full_name] = self.get_repo_languages(full_name)
+                continue
 
-        return unique_repos
+            results[full_name] = {
+                edge["node"]["name"]: int(edge["size"]) for edge in languages["edges"]
+            }
 
-    def get_repo_languages(self, full_name: str) -> dict[str, int]:
-        """Fetch byte-count language breakdown for a single repo.
+        return results
+
+    def async_session(
+        self, max_connections: int = constants.ASYNC_MAX_CONNECTIONS
+    ) -> aio.AsyncSession:
+        """Create an asyncio session sharing this client's auth, cache and limits.
+
+        Parameters
+        ----------
+        max_connections : int
+            Keep-alive connection pool size.
+
+        Returns
+        -------
+        aio.AsyncSession
+            Session for use with the ``*_async`` methods. Close with ``aclose()``.
+        """
+        return aio.AsyncSession(self._session, max_connections=max_connections)
+
+    async def get_repo_languages_async(
+        self, session: aio.AsyncSession, full_name: str
+    ) -> dict[str, int]:
+        """Async variant of :meth:`get_repo_languages`.
 
         Parameters
         ----------
+        session : aio.AsyncSession
+            Session from :meth:`async_session`.
         full_name : str
             Repository in ``owner/repo`` format.
 
@@ -157,12 +372,40 @@ class GitHubClient:
         dict[str, int]
             Language name to byte count mapping.
         """
-        r = self._session.get(f"{self._api}/repos/{full_name}/languages")
+        r = await session.get_async(f"{self._api}/repos/{full_name}/languages")
         return dict(r.json())
 
+    def _resolve_repo(self, repo_name: str) -> dict[str, object] | None:
+        """Fetch one specific repo, logging why it was skipped on failure"""
+        normalized = self._normalize_repo_pattern(repo_name)
+
+        try:
+            repo = self.get_repo_info(normalized)
+            log.logger.debug(f"Found repo: {normalized}")
+            return repo
+
+        except ValueError as e:
+            log.logger.warning(str(e))
+        except exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response else None
+
+            if status_code == 404:
+                log.logger.warning(f"Repository not found: {normalized}")
+            elif status_code == 403:
+                log.logger.warning(f"Access denied to {normalized} (check permissions)")
+            else:
+                log.logger.warning(f"Failed to fetch {normalized}: {e}")
+
+        except exceptions.RequestError as e:
+            log.logger.warning(f"Network error fetching {normalized}: {e}")
+
+        return None
+
     def fetch_specific_repos(self, specific_repos: list[str]) -> list[dict[str, object]]:
         """Resolve a list of owner/repo strings to repo dicts.
 
+        Repos are resolved concurrently on up to ``API_MAX_WORKERS`` threads.
+
         Parameters
         ----------
         specific_repos : list[str]
@@ -171,30 +414,14 @@ class GitHubClient:
         Returns
         -------
         list[dict]
-            Successfully fetched repo dicts. Failed repos are logged and skipped.
+            Successfully fetched repo dicts, in input order. Failed repos are
+            logged and skipped.
         """
-        repos = []
-        for repo_name in specific_repos:
-            normalized = self._normalize_repo_pattern(repo_name)
-
-            try:
-                repo = self.get_repo_info(normalized)
-                repos.append(repo)
-                log.logger.debug(f"Found repo: {normalized}")
-
-            except ValueError as e:
-                log.logger.warning(str(e))
-            except exceptions.HTTPError as e:
-                status_code = e.response.status_code if e.response else None
-
-                if status_code == 404:
-                    log.logger.warning(f"Repository not found: {normalized}")
-                elif status_code == 403:
-                    log.logger.warning(f"Access denied to {normalized} (check permissions)")
-                else:
-                    log.logger.warning(f"Failed to fetch {normalized}: {e}")
-
-            except exceptions.RequestError as e:
-                log.logger.warning(f"Network error fetching {normalized}: {e}")
-
-        return repos
+        if not specific_repos:
+            return []
+
+        num_workers = min(constants.API_MAX_WORKERS, len(specific_repos))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            resolved = list(executor.map(self._resolve_repo, specific_repos))
+
+        return [repo for repo in resolved if repo is not None]
@@ -1,74 +1,171 @@
+from datetime import datetime
 import json
 from pathlib import Path
 import re
+import threading
+from typing import Any
+from typing import cast
 
 from ghlang import constants
 from ghlang import exceptions
 from ghlang import log
+from ghlang.static import linguist_colors
 
 from . import client
+from . import refresh as background
 
 
-# linguist YAML structure: language at column 0, color on indented line
-_LANG_RE = re.compile(r"^([A-Za-z0-9][\w\s\+\#\-\.\'/\*\(\)]*):$", re.MULTILINE)
-_COLOR_RE = re.compile(r'^\s+color:\s*"(#[0-9A-Fa-f]{6})"', re.MULTILINE)
+# linguist YAML structure: language at column 0, color on an indented line of
+# its block. One pass over the text: a header, then lazily any indented,
+# comment or blank lines, then the first ``color:`` line before the next
+# top-level key.
+_LANG_COLOR_RE = re.compile(
+    r"""
+    ^([A-Za-z0-9][\w\ \t\+\#\-\.\'/\*\(\)]*):\r?\n    # language header
+    (?:(?:[\ \t\#].*)?\r?\n)*?                        # indented, comment or blank lines
+    [\ \t]+color:[\ \t]*"(\#[0-9A-Fa-f]{6})"          # color line
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
 
 
 def _parse_linguist_yaml(text: str) -> dict[str, str]:
     """Extract language -> color mappings from linguist YAML text"""
-    colors: dict[str, str] = {}
-    current_lang: str | None = None
-
-    for line in text.splitlines():
-        lang_match = _LANG_RE.match(line)
-        if lang_match:
-            current_lang = lang_match.group(1)
-            continue
-
-        if current_lang:
-            color_match = _COLOR_RE.match(line)
-            if color_match:
-                colors[current_lang] = color_match.group(1)
-                current_lang = None
-            elif not line.startswith(" ") and not line.startswith("#") and line.strip():
-                # new top-level key without color found
-                current_lang = None
+    return dict(_LANG_COLOR_RE.findall(text))
+
+
+def _read_cache(cache_path: Path) -> dict[str, Any] | None:
+    """Load the cached color map and its validators, or None if missing/corrupt"""
+    try:
+        cached = json.loads(cache_path.read_text())
+        datetime.fromisoformat(cached["timestamp"])
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError, OSError):
+        return None
+
+    if not isinstance(cached.get("colors"), dict):
+        return None
+    return cast(dict[str, Any], cached)
+
+
+def _write_cache(cache_path: Path, cached: dict[str, Any]) -> None:
+    """Write the color cache atomically"""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".tmp")
+
+    try:
+        tmp.write_text(json.dumps(cached, indent=2))
+        tmp.replace(cache_path)
+    except OSError as e:
+        log.logger.debug(f"Couldn't write color cache {cache_path}: {e}")
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _download_colors(cache_path: Path | None, cached: dict[str, Any] | None) -> dict[str, str]:
+    """Revalidate (or download) the linguist YAML and store the result in the cache"""
+    headers = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    r = client.get(constants.LINGUIST_URL, timeout=constants.REQUEST_TIMEOUT, headers=headers)
+    if r.status_code == 304 and cached is not None:
+        log.logger.debug("Language colors unchanged upstream")
+        colors = cast(dict[str, str], cached["colors"])
+    else:
+        r.raise_for_status()
+        colors = _parse_linguist_yaml(r.text)
+        cached = {
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "colors": colors,
+        }
+
+    if cache_path:
+        _write_cache(cache_path, {**cached, "timestamp": datetime.now().isoformat()})
 
     return colors
 
 
-def load_github_colors(output_file: Path | None = None) -> dict[str, str]:
-    """Fetch GitHub's language colors from the linguist YAML.
+def _refresh_in_background(
+    cache_path: Path,
+    cached: dict[str, Any] | None,
+) -> threading.Thread | None:
+    """Refresh the color cache on a tracked daemon thread, unless one is already running"""
+
+    def refresh() -> None:
+        try:
+            colors = _download_colors(cache_path, cached)
+            log.logger.debug(f"Refreshed {len(colors)} language colors in the background")
+        except (exceptions.RequestError, exceptions.HTTPError, OSError) as e:
+            log.logger.debug(f"Background color refresh failed: {e}")
+
+    return background.refresh_in_background(cache_path, refresh, "ghlang-color-refresh")
+
+
+def _is_fresh(cached: dict[str, Any]) -> bool:
+    """Return True if *cached* is within the TTL"""
+    age = datetime.now() - datetime.fromisoformat(cached["timestamp"])
+    return age < constants.LINGUIST_CACHE_TTL
+
+
+def load_github_colors(
+    output_file: Path | None = None,
+    cache_dir: Path | None = None,
+    force_refresh: bool = False,
+) -> dict[str, str]:
+    """Load GitHub's language colors, offline first.
+
+    The bundled snapshot (``static/linguist_colors.py``) is overlaid with the
+    map cached in ``linguist_colors.json`` under *cache_dir*. Without a cache
+    the full table is fetched synchronously once, falling back to the
+    snapshot when offline. A cache past its TTL is refreshed from the
+    linguist YAML on a background thread (revalidated with its ``ETag``), so
+    chart generation doesn't wait on the network; call
+    ``refresh.wait_for_refresh`` before the process exits to let it land.
 
     Parameters
     ----------
     output_file : Path | None
         If given, write the color map to this path as JSON.
+    cache_dir : Path | None
+        Directory for the persistent color cache. Snapshot only when *None*.
+    force_refresh : bool
+        Fetch the YAML synchronously, even if a cache exists and is within the TTL.
 
     Returns
     -------
     dict[str, str]
         Mapping of language name to hex color string (e.g. ``"#3572A5"``).
-        Empty dict on network failure.
     """
-    log.logger.info("Grabbing language colors from GitHub")
+    cache_path = cache_dir / constants.LINGUIST_CACHE_FILE if cache_dir else None
+    cached = _read_cache(cache_path) if cache_path else None
+    colors = {**linguist_colors.COLORS, **(cached["colors"] if cached else {})}
 
-    try:
-        r = client.get(constants.LINGUIST_URL, timeout=constants.REQUEST_TIMEOUT)
-        r.raise_for_status()
+    # the snapshot only covers common languages, so a first run waits for the full table
+    if force_refresh or (cache_path and cached is None):
+        log.logger.info("Grabbing language colors from GitHub")
+        try:
+            colors.update(_download_colors(cache_path, cached))
+        except (exceptions.RequestError, exceptions.HTTPError, OSError) as e:
+            log.logger.warning(f"Couldn't refresh GitHub colors, using bundled copy: {e}")
 
-        colors = _parse_linguist_yaml(r.text)
-        log.logger.success(f"Loaded {len(colors)} language colors")
+    elif cache_path and cached is not None and not _is_fresh(cached):
+        _refresh_in_background(cache_path, cached)
 
-        if output_file:
+    log.logger.success(f"Loaded {len(colors)} language colors")
+
+    if output_file:
+        try:
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
             with output_file.open("w") as f:
                 json.dump(colors, f, indent=2)
             log.logger.debug(f"Saved color data to {output_file}")
 
-        return colors
+        except OSError as e:
+            log.logger.warning(f"Couldn't save GitHub colors: {e}")
 
-    except (exceptions.RequestError, exceptions.HTTPError, OSError) as e:
-        log.logger.warning(f"Couldn't load GitHub colors: {e}")
-        return {}
+    return colors
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from ghlang import constants
+from ghlang import log
+
+
+if TYPE_CHECKING:
+    from .client import Response
+
+
+def _int_header(response: Response, name: str) -> int | None:
+    value = response.headers.get(name)
+    if value is None:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Process-wide request scheduler driven by GitHub's rate-limit headers.
+
+    Every worker calls :meth:`acquire` before a request and :meth:`update`
+    after it (or :meth:`release` if no response came back). The limiter
+    takes the primary budget the server last reported, less the requests
+    still in flight, blocks all threads once it runs dry until
+    ``X-RateLimit-Reset``, and pauses everyone after a secondary limit for
+    ``Retry-After`` seconds. Requests the server doesn't charge (such as
+    conditional 304s) therefore don't eat into the local budget.
+
+    Attributes
+    ----------
+    waited : float
+        Total seconds spent blocked across all threads.
+    throttled : int
+        Number of rate-limited responses that were retried.
+    """
+
+    def __init__(self) -> None:
+        self.waited = 0.0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._remaining: int | None = None
+        self._in_flight = 0
+        self._reset_at = 0.0
+        self._paused_until = 0.0
+
+    def _delay(self, now: float) -> float:
+        """Seconds the next request must wait (caller holds the lock)"""
+        if self._paused_until > now:
+            return self._paused_until - now
+
+        if self._remaining is not None and self._remaining - self._in_flight <= 0:
+            if self._reset_at > now:
+                return self._reset_at - now
+
+            # window rolled over, budget unknown until the next response
+            self._remaining = None
+
+        return 0.0
+
+    def _reserve(self) -> float:
+        """Count a request as in flight, or return how long to wait before trying again"""
+        with self._lock:
+            delay = self._delay(time.time())
+            if delay <= 0:
+                self._in_flight += 1
+            return delay
+
+    def _record_wait(self, delay: float) -> None:
+        with self._lock:
+            self.waited += delay
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, then reserve one unit of budget."""
+        while (delay := self._reserve()) > 0:
+            log.logger.debug(f"Rate limit reached, waiting {delay:.0f}s")
+            time.sleep(delay)
+            self._record_wait(delay)
+
+    async def acquire_async(self) -> None:
+        """Async variant of :meth:`acquire` that yields to the event loop while waiting."""
+        while (delay := self._reserve()) > 0:
+            log.logger.debug(f"Rate limit reached, waiting {delay:.0f}s")
+            await asyncio.sleep(delay)
+            self._record_wait(delay)
+
+    def release(self) -> None:
+        """Drop the reservation of a request that got no response."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def update(self, response: Response) -> None:
+        """Finish a request and record the budget reported by *response*."""
+        remaining = _int_header(response, "X-RateLimit-Remaining")
+        reset = _int_header(response, "X-RateLimit-Reset")
+
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if remaining is None:
+                return
+
+            if reset is not None and reset != self._reset_at:
+                # responses from a newer window replace the old budget outright
+                if reset > self._reset_at:
+                    self._reset_at = float(reset)
+                    self._remaining = remaining
+                return
+
+            # the server's count is authoritative, uncharged requests (304s) leave it flat
+            self._remaining = remaining
+
+    def is_rate_limited(self, response: Response) -> bool:
+        """Return True if *response* was rejected by a primary or secondary limit."""
+        if response.status_code not in (403, 429):
+            return False
+
+        if response.headers.get("Retry-After") is not None:
+            return True
+        if _int_header(response, "X-RateLimit-Remaining") == 0:
+            return True
+
+        return "rate limit" in response.text.lower()
+
+    def backoff(self, response: Response) -> float:
+        """Pause all threads after a rate-limited *response*.
+
+        Parameters
+        ----------
+        response : Response
+            A response for which :meth:`is_rate_limited` returned True.
+
+        Returns
+        -------
+        float
+            Seconds until requests resume.
+        """
+        now = time.time()
+        retry_after = _int_header(response, "Retry-After")
+        reset = _int_header(response, "X-RateLimit-Reset")
+
+        if retry_after is not None:
+            delay = float(retry_after)
+        elif _int_header(response, "X-RateLimit-Remaining") == 0 and reset is not None:
+            delay = max(0.0, reset - now)
+        else:
+            # secondary limit without a hint, github asks for at least a minute
+            delay = float(constants.RATE_LIMIT_SECONDARY_WAIT)
+
+        with self._lock:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, now + delay)
+
+        return delay
+
+    def summary(self) -> str:
+        """Return a one-line throttling summary for verbose output."""
+        return f"Rate limit: {self.throttled} throttled responses, waited {self.waited:.1f}s"
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import threading
+import time
+
+from ghlang import constants
+from ghlang import log
+
+
+# cache paths with a background refresh in flight, and the threads doing it
+_refreshing: set[Path] = set()
+_refreshing_lock = threading.Lock()
+_refresh_threads: list[threading.Thread] = []
+
+
+def refresh_in_background(
+    cache_path: Path,
+    refresh: Callable[[], object],
+    name: str,
+) -> threading.Thread | None:
+    """Run *refresh* for *cache_path* on a daemon thread, unless one is already running.
+
+    The thread is tracked so :func:`wait_for_refresh` can let it land before
+    the process exits. *refresh* handles (and logs) its own errors.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Cache file being refreshed, one refresh at a time per path.
+    refresh : Callable[[], object]
+        Downloads and stores the new cache contents.
+    name : str
+        Thread name.
+
+    Returns
+    -------
+    threading.Thread | None
+        The started thread, or None if a refresh for *cache_path* is in flight.
+    """
+    with _refreshing_lock:
+        if cache_path in _refreshing:
+            return None
+        _refreshing.add(cache_path)
+
+    def run() -> None:
+        try:
+            refresh()
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(cache_path)
+
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    with _refreshing_lock:
+        _refresh_threads.append(thread)
+    thread.start()
+    return thread
+
+
+def wait_for_refresh(timeout: float = constants.REFRESH_WAIT) -> None:
+    """Wait for background cache refreshes to finish, up to *timeout* seconds in total.
+
+    Refresh threads are daemons, so a one-shot CLI run calls this before
+    exiting; otherwise the process ends before a stale cache is ever updated.
+
+    Parameters
+    ----------
+    timeout : float
+        Overall time budget in seconds.
+    """
+    with _refreshing_lock:
+        threads = list(_refresh_threads)
+        _refresh_threads.clear()
+
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            log.logger.debug(f"Gave up waiting for {thread.name}")
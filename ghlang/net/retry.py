@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from dataclasses import field
+import random
+import threading
+import time
+
+from ghlang import constants
+from ghlang import log
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How transient request failures are retried.
+
+    Attributes
+    ----------
+    max_attempts : int
+        Total attempts per request, including the first one.
+    base_delay : float
+        Delay in seconds before the first retry; doubled on each retry.
+    max_delay : float
+        Upper bound for a single backoff delay.
+    jitter : float
+        Fraction of each delay that is randomized (0 = none, 1 = full jitter).
+    retry_statuses : frozenset[int]
+        Response status codes treated as transient.
+    """
+
+    max_attempts: int = constants.RETRY_MAX_ATTEMPTS
+    base_delay: float = constants.RETRY_BASE_DELAY
+    max_delay: float = constants.RETRY_MAX_DELAY
+    jitter: float = constants.RETRY_JITTER
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset(constants.RETRY_STATUSES)
+    )
+
+    def delay(self, attempt: int) -> float:
+        """Return the backoff delay before retry number *attempt* (0-based)."""
+        capped = min(self.max_delay, self.base_delay * 2**attempt)
+        return capped * (1 - self.jitter * random.random())  # noqa: S311
+
+
+class Retrier:
+    """Applies a :class:`RetryPolicy` and counts retries across threads.
+
+    Attributes
+    ----------
+    policy : RetryPolicy
+        The active retry policy.
+    retries : int
+        Number of retries performed so far.
+    waited : float
+        Total seconds spent backing off across all threads.
+    """
+
+    def __init__(self, policy: RetryPolicy | None = None) -> None:
+        self.policy = policy or RetryPolicy()
+        self.retries = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def can_retry(self, attempt: int) -> bool:
+        """Return True if another attempt is allowed after *attempt* (0-based)."""
+        return attempt + 1 < self.policy.max_attempts
+
+    def is_transient(self, status_code: int) -> bool:
+        """Return True if *status_code* is worth retrying."""
+        return status_code in self.policy.retry_statuses
+
+    def _schedule(self, attempt: int, url: str, reason: str) -> float:
+        """Pick the next delay and record the retry"""
+        delay = self.policy.delay(attempt)
+        log.logger.debug(f"Retrying {url} in {delay:.2f}s ({reason})")
+
+        with self._lock:
+            self.retries += 1
+            self.waited += delay
+
+        return delay
+
+    def backoff(self, attempt: int, url: str, reason: str) -> None:
+        """Sleep before retrying *url* and record the retry.
+
+        Parameters
+        ----------
+        attempt : int
+            0-based number of the attempt that just failed.
+        url : str
+            Request URL, for logging.
+        reason : str
+            Why the attempt failed, for logging.
+        """
+        time.sleep(self._schedule(attempt, url, reason))
+
+    async def backoff_async(self, attempt: int, url: str, reason: str) -> None:
+        """Async variant of :meth:`backoff`."""
+        await asyncio.sleep(self._schedule(attempt, url, reason))
+
+    def summary(self) -> str:
+        """Return a short retry summary for the run's summary line."""
+        return f"{self.retries} retries, {self.waited:.1f}s backing off"
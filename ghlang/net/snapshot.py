@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import threading
+from typing import TypedDict
+
+from ghlang import log
+
+
+class _Snapshot(TypedDict):
+    """One repo's stored entry in the snapshot file"""
+
+    full_name: str
+    pushed_at: str | None
+    languages: dict[str, int]
+
+
+class SnapshotStore:
+    """Per-repo language snapshots keyed by repo id, for incremental runs.
+
+    Each entry remembers the ``pushed_at`` a repo had when its languages were
+    last fetched. A repo whose ``pushed_at`` is unchanged has unchanged
+    languages, so its stored breakdown can be reused without a request.
+
+    Attributes
+    ----------
+    path : Path
+        JSON file holding the snapshots.
+    reused : int
+        Repos answered from the store this run.
+    refreshed : int
+        Repos whose languages were fetched and stored this run.
+    """
+
+    def _load(self) -> dict[str, _Snapshot]:
+        """Read the snapshot file, starting empty if it's missing or corrupt"""
+        if not self.path.exists():
+            return {}
+
+        try:
+            data = json.loads(self.path.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            log.logger.debug(f"Ignoring unreadable snapshot {self.path}: {e}")
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.reused = 0
+        self.refreshed = 0
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Snapshot] = self._load()
+
+    def lookup(self, repo: dict) -> dict[str, int] | None:
+        """Return stored languages for *repo* if it hasn't been pushed to since.
+
+        Parameters
+        ----------
+        repo : dict
+            Repo dict from the GitHub API (needs ``id`` and ``pushed_at``).
+
+        Returns
+        -------
+        dict[str, int] | None
+            Language byte counts, or None if the repo is new or changed.
+        """
+        pushed_at = repo.get("pushed_at")
+        if repo.get("id") is None or pushed_at is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(str(repo["id"]))
+            if entry is None or entry.get("pushed_at") != pushed_at:
+                return None
+
+            self.reused += 1
+            return dict(entry["languages"])
+
+    def record(self, repo: dict, languages: dict[str, int]) -> None:
+        """Store freshly fetched *languages* for *repo*."""
+        if repo.get("id") is None:
+            return
+
+        with self._lock:
+            self._entries[str(repo["id"])] = {
+                "full_name": repo["full_name"],
+                "pushed_at": repo.get("pushed_at"),
+                "languages": languages,
+            }
+            self.refreshed += 1
+
+    def prune(self, repo_ids: set[str]) -> None:
+        """Forget repos not in *repo_ids* (deleted, transferred or now ignored)."""
+        with self._lock:
+            for key in set(self._entries) - repo_ids:
+                del self._entries[key]
+
+    def save(self) -> None:
+        """Write the snapshots atomically so an interrupted run can't corrupt them."""
+        with self._lock:
+            payload = json.dumps(self._entries)
+
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(payload)
+            tmp.replace(self.path)
+        except OSError as e:
+            log.logger.warning(f"Couldn't save repo snapshot: {e}")
+
+    def summary(self) -> str:
+        """Return a one-line reuse summary for verbose output."""
+        return f"Snapshot: {self.reused} repos unchanged, {self.refreshed} refetched"
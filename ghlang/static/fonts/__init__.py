@@ -1,67 +1,123 @@
 """Cozette bitmap font loader and text renderer."""
 
+from dataclasses import dataclass
+from functools import cache
 from functools import lru_cache
+import mmap
 from pathlib import Path
-from typing import cast
+import struct
 
-from bdfparser import Font  # type: ignore[import-untyped]
 from PIL import Image
 
 
+# packed font layout, see scripts/build_font.py
+_MAGIC = b"CZF1"
+_HEADER = struct.Struct("<4sHHI")
+_ENTRY = struct.Struct("<IH")
+
+
+@dataclass(frozen=True)
+class PackedFont:
+    """A bitmap font packed by ``scripts/build_font.py``.
+
+    Attributes
+    ----------
+    width : int
+        Font bounding box width; every glyph tile has this width.
+    height : int
+        Font bounding box height (line height).
+    glyphs : dict[int, tuple[int, int]]
+        Codepoint to ``(bitmap offset, advance width)``.
+    data : mmap.mmap
+        The mapped font file.
+    """
+
+    width: int
+    height: int
+    glyphs: dict[int, tuple[int, int]]
+    data: mmap.mmap
+
+    @property
+    def tile_size(self) -> int:
+        """Bytes per glyph tile (1-bit rows padded to whole bytes)."""
+        return (self.width + 7) // 8 * self.height
+
+    def tile(self, offset: int) -> Image.Image:
+        """Return the glyph tile at *offset* as an ``L`` alpha image (0 or 255)."""
+        raw = self.data[offset : offset + self.tile_size]
+        return Image.frombytes("1", (self.width, self.height), raw).convert("L")
+
+
 @lru_cache(maxsize=1)
-def load_cozette() -> Font:
-    """Load the Cozette BDF bitmap font, cached after first call.
+def load_cozette() -> PackedFont:
+    """Map the packed Cozette font, cached after first call.
 
     Returns
     -------
-    Font
-        Parsed BDF font object.
+    PackedFont
+        Glyph index and memory-mapped bitmaps.
+
+    Raises
+    ------
+    ValueError
+        If ``cozette.bin`` is not a packed font.
     """
-    font_path = Path(__file__).parent / "cozette.bdf"
-    return Font(str(font_path))
+    font_path = Path(__file__).parent / "cozette.bin"
+    with font_path.open("rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
+    magic, width, height, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError(f"{font_path} is not a packed font, rerun scripts/build_font.py")
 
-def render_text(text: str, color: tuple[int, int, int], scale: int = 1) -> Image.Image:
-    """Render a text string as a PIL RGBA image using the Cozette font.
+    index_end = _HEADER.size + count * _ENTRY.size
+    tile_size = (width + 7) // 8 * height
+    glyphs = {
+        cp: (index_end + i * tile_size, advance)
+        for i, (cp, advance) in enumerate(_ENTRY.iter_unpack(data[_HEADER.size : index_end]))
+    }
 
-    Parameters
-    ----------
-    text : str
-        Text to render.
-    color : tuple[int, int, int]
-        Foreground RGB color.
-    scale : int
-        Integer scaling factor applied to the bitmap.
+    return PackedFont(width, height, glyphs, data)
 
-    Returns
-    -------
-    Image.Image
-        RGBA image with transparent background and colored glyphs.
+
+def _advance(cp: int) -> int:
+    """Return the advance width of *cp* from the glyph index, without touching its bitmap.
+
+    Missing glyphs advance 0, like bdfparser's empty glyph.
     """
+    entry = load_cozette().glyphs.get(cp)
+    return entry[1] if entry else 0
+
+
+@cache
+def _glyph(cp: int) -> tuple[Image.Image | None, int]:
+    """Return the alpha tile (font bounding box sized) and advance width for *cp*"""
     font = load_cozette()
-    bm = font.draw(text)
-    if scale > 1:
-        bm = bm * scale
+    entry = font.glyphs.get(cp)
+    if entry is None:
+        return None, 0
+
+    offset, advance = entry
+    return font.tile(offset), advance
 
-    w, h = bm.width(), bm.height()
 
-    # tobytes('RGBA') gives white fg + transparent bg
-    rgba_data = bm.tobytes("RGBA")
-    img = Image.frombytes("RGBA", (w, h), rgba_data)
+@lru_cache(maxsize=4096)
+def _glyph_tile(cp: int, scale: int) -> Image.Image | None:
+    """Return the alpha tile for *cp* enlarged to *scale* (nearest neighbor)"""
+    tile, _ = _glyph(cp)
+    if tile is None or scale == 1:
+        return tile
+    return tile.resize((tile.width * scale, tile.height * scale), Image.Resampling.NEAREST)
 
-    # replace white foreground pixels with the requested color
-    pixels = img.load()
-    if pixels is None:
-        raise ValueError("failed to load pixel data")
 
-    for py in range(h):
-        for px in range(w):
-            px_value = cast(tuple[int, int, int, int], pixels[px, py])
-            a = px_value[-1]
-            if a > 0:
-                pixels[px, py] = (*color, a)
+def _colorize(alpha: Image.Image, color: tuple[int, int, int]) -> Image.Image:
+    """Build an RGBA image of *color* with *alpha*"""
+    solid = Image.new("RGBA", alpha.size, (*color, 0))
+    solid.putalpha(alpha)
 
-    return img
+    # fully transparent pixels keep the white background bytes of bdfparser bitmaps
+    mask = alpha.point(lambda a: 255 if a > 0 else 0)
+    return Image.composite(solid, Image.new("RGBA", alpha.size, (255, 255, 255, 0)), mask)
 
 
 def text_width(text: str, scale: int = 1) -> int:
@@ -79,7 +135,12 @@ def text_width(text: str, scale: int = 1) -> int:
     int
         Width in pixels.
     """
-    return int(load_cozette().draw(text).width()) * scale
+    if not text:
+        return 0
+
+    # every glyph advances the pen; the last one also spans the full bounding box
+    advances = sum(_advance(ord(char)) for char in text[:-1])
+    return (advances + load_cozette().width) * scale
 
 
 def text_height(scale: int = 1) -> int:
@@ -95,4 +156,58 @@ def text_height(scale: int = 1) -> int:
     int
         Height in pixels.
     """
-    return int(load_cozette().headers["fbby"]) * scale
+    return load_cozette().height * scale
+
+
+def render_text(text: str, color: tuple[int, int, int], scale: int = 1) -> Image.Image:
+    """Render a text string as a PIL RGBA image using the Cozette font.
+
+    Glyphs are pasted from a per-(glyph, scale) atlas at their advance
+    offsets; overlapping tiles are merged like bdfparser's ``Font.draw``.
+
+    Parameters
+    ----------
+    text : str
+        Text to render.
+    color : tuple[int, int, int]
+        Foreground RGB color.
+    scale : int
+        Integer scaling factor applied to the bitmap.
+
+    Returns
+    -------
+    Image.Image
+        RGBA image with transparent background and colored glyphs.
+    """
+    alpha = Image.new("L", (text_width(text, scale), text_height(scale)), 0)
+
+    x = 0
+    for char in text:
+        cp = ord(char)
+        tile = _glyph_tile(cp, scale)
+        if tile is not None:
+            alpha.paste(255, (x, 0), mask=tile)
+        x += _advance(cp) * scale
+
+    return _colorize(alpha, color)
+
+
+def text_size(text: str, scale: int = 1) -> tuple[int, int]:
+    """Return the ``(width, height)`` *text* renders at, from glyph metrics alone.
+
+    No bitmaps are decoded or allocated; the width is a sum over the advance
+    table, so layout costs O(len(text)) integer additions.
+
+    Parameters
+    ----------
+    text : str
+        Text to measure.
+    scale : int
+        Integer scaling factor.
+
+    Returns
+    -------
+    tuple[int, int]
+        Width and height in pixels, equal to the size of ``render_text(text, ...)``.
+    """
+    return text_width(text, scale), text_height(scale)
@@ -0,0 +1,78 @@
+"""Seed language -> color map for common GitHub linguist languages.
+
+A hand-picked subset of linguist's languages.yml, not the full table;
+languages missing here use the theme's fallback color until a refreshed map
+is cached under the config dir. Run scripts/gen_linguist_colors.py to
+replace it with the complete generated table.
+"""
+
+from typing import Final
+
+
+COLORS: Final[dict[str, str]] = {
+    "Assembly": "#6E4C13",
+    "Astro": "#ff5a03",
+    "Batchfile": "#C1F12E",
+    "C": "#555555",
+    "C#": "#178600",
+    "C++": "#f34b7d",
+    "CMake": "#DA3434",
+    "CSS": "#663399",
+    "Clojure": "#db5855",
+    "CoffeeScript": "#244776",
+    "Common Lisp": "#3fb68b",
+    "Crystal": "#000100",
+    "Cuda": "#3A4E3A",
+    "D": "#ba595e",
+    "Dart": "#00B4AB",
+    "Dockerfile": "#384d54",
+    "Elixir": "#6e4a7e",
+    "Elm": "#60B5CC",
+    "Emacs Lisp": "#c065db",
+    "Erlang": "#B83998",
+    "F#": "#b845fc",
+    "Fortran": "#4d41b1",
+    "GLSL": "#5686a5",
+    "Gleam": "#ffaff3",
+    "Go": "#00ADD8",
+    "Groovy": "#4298b8",
+    "HCL": "#844FBA",
+    "HTML": "#e34c26",
+    "Haskell": "#5e5086",
+    "Java": "#b07219",
+    "JavaScript": "#f1e05a",
+    "Julia": "#a270ba",
+    "Jupyter Notebook": "#DA5B0B",
+    "Kotlin": "#A97BFF",
+    "Less": "#1d365d",
+    "Lua": "#000080",
+    "MATLAB": "#e16737",
+    "Makefile": "#427819",
+    "Markdown": "#083fa1",
+    "Nim": "#ffc200",
+    "Nix": "#7e7eff",
+    "OCaml": "#ef7a08",
+    "Objective-C": "#438eff",
+    "PHP": "#4F5D95",
+    "Perl": "#0298c3",
+    "PowerShell": "#012456",
+    "Python": "#3572A5",
+    "R": "#198CE7",
+    "Racket": "#3c5caa",
+    "Ruby": "#701516",
+    "Rust": "#dea584",
+    "SCSS": "#c6538c",
+    "Sass": "#a53b70",
+    "Scala": "#c22d40",
+    "Scheme": "#1e4aec",
+    "Shell": "#89e051",
+    "Svelte": "#ff3e00",
+    "Swift": "#F05138",
+    "TOML": "#9c4221",
+    "TeX": "#3D6117",
+    "TypeScript": "#3178c6",
+    "Vim Script": "#199f4b",
+    "Vue": "#41b883",
+    "YAML": "#cb171e",
+    "Zig": "#ec915c",
+}
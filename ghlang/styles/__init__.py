@@ -5,6 +5,7 @@ from typing import Final
 
 
 STYLES: Final[tuple[str, ...]] = ("pixel", "pie", "bar")
+FORMATS: Final[tuple[str, ...]] = ("png", "svg")
 
 
 def get_style_registry() -> dict[str, Callable[..., None]]:
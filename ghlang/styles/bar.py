@@ -1,7 +1,6 @@
 from pathlib import Path
 
 import matplotlib.patches as mpatches
-import matplotlib.pyplot as plt
 
 from ghlang import log
 from ghlang import themes
@@ -17,6 +16,9 @@ def generate_bar(
     title: str | None = None,
     theme: str = "light",
     top_n: int = constants.TOP_N,
+    *,
+    segments: list[tuple[str, float]] | None = None,
+    theme_colors: dict[str, str] | None = None,
 ) -> None:
     """Generate a horizontal segmented bar chart showing top N languages.
 
@@ -27,21 +29,27 @@ def generate_bar(
     colors : dict[str, str]
         Language name to hex color mapping.
     output : Path
-        Destination PNG file path.
+        Destination file path; a ``.svg`` suffix writes SVG, anything else PNG.
     title : str | None
         Chart title. Defaults to ``"Top {top_n} Languages"``.
     theme : str
         Theme name for background, text, and legend colors.
     top_n : int
         Maximum number of language segments before grouping into "Other".
+    segments : list[tuple[str, float]] | None
+        Precomputed ``build_display_segments`` output, built when *None*.
+    theme_colors : dict[str, str] | None
+        Resolved theme colors, looked up from *theme* when *None*.
     """
     title = title if title else f"Top {top_n} Languages"
     log.logger.debug(f"Generating segmented bar chart (top {top_n} languages)...")
 
-    theme_colors = themes.get_theme(theme)
-    segments = utils.build_display_segments(language_stats, top_n)
+    if theme_colors is None:
+        theme_colors = themes.get_theme(theme)
+    if segments is None:
+        segments = utils.build_display_segments(language_stats, top_n)
 
-    fig, ax = plt.subplots(figsize=constants.BAR_FIGSIZE)
+    fig, ax = utils.new_figure(constants.BAR_FIGSIZE)
     fig.patch.set_facecolor(theme_colors["background"])
     ax.set_facecolor(theme_colors["background"])
 
@@ -3,7 +3,10 @@ from typing import Final
 
 # shared rendering
 ROUNDED_CORNER_RADIUS: Final = 40
+ROUNDED_MASK_CACHE_SIZE: Final = 16  # (size, radius) corner masks kept
 PNG_DPI: Final = 200
+PNG_COMPRESS_LEVEL: Final = 6  # zlib level, 0 (fastest) to 9 (smallest)
+PNG_OPTIMIZE: Final = False  # extra encoder pass for smaller files
 TOP_N: Final = 5
 HIDE_THRESHOLD: Final = 5.0
 
@@ -2,7 +2,6 @@ from pathlib import Path
 from typing import cast
 
 from matplotlib.patches import Wedge
-import matplotlib.pyplot as plt
 from matplotlib.text import Text
 
 from ghlang import log
@@ -18,6 +17,8 @@ def generate_pie(
     output: Path,
     title: str | None = None,
     theme: str = "light",
+    *,
+    theme_colors: dict[str, str] | None = None,
     **_kwargs: object,
 ) -> None:
     """Generate a pie chart showing language distribution.
@@ -29,18 +30,21 @@ def generate_pie(
     colors : dict[str, str]
         Language name to hex color mapping.
     output : Path
-        Destination PNG file path.
+        Destination file path; a ``.svg`` suffix writes SVG, anything else PNG.
     title : str | None
         Chart title. Defaults to ``"Language Distribution"``.
     theme : str
         Theme name for background, text, and legend colors.
+    theme_colors : dict[str, str] | None
+        Resolved theme colors, looked up from *theme* when *None*.
     **_kwargs : object
         Ignored extra keyword arguments for signature compatibility.
     """
     title = title if title else "Language Distribution"
     log.logger.debug(f"Generating pie chart with {len(language_stats)} languages...")
 
-    theme_colors = themes.get_theme(theme)
+    if theme_colors is None:
+        theme_colors = themes.get_theme(theme)
     items = sorted(language_stats.items(), key=lambda x: x[1], reverse=True)
     total = sum(language_stats.values()) or 1
 
@@ -49,7 +53,7 @@ def generate_pie(
     fallback = theme_colors["fallback"]
     chart_colors = [colors.get(lang, fallback) for lang in labels]
 
-    fig, ax = plt.subplots(figsize=constants.PIE_FIGSIZE)
+    fig, ax = utils.new_figure(constants.PIE_FIGSIZE)
     fig.patch.set_facecolor(theme_colors["background"])
     ax.set_facecolor(theme_colors["background"])
 
@@ -18,13 +18,11 @@ def _shade(rgb: tuple[int, int, int], f: float) -> tuple[int, int, int]:
 
 
 def _build_segments(
-    language_stats: dict[str, int],
+    display: list[tuple[str, float]],
     colors: dict[str, str],
-    top_n: int,
     fallback: tuple[int, int, int],
 ) -> list[tuple[str, float, tuple[int, int, int], int, int]]:
-    """Build tower segments with pixel-grid y-offsets"""
-    display = utils.build_display_segments(language_stats, top_n)
+    """Build tower segments with pixel-grid y-offsets from display segments"""
 
     colored = [
         (
@@ -53,15 +51,17 @@ def _build_segments(
     return segs
 
 
-def _draw_iso_block(
-    draw: ImageDraw.ImageDraw,
+_Face = tuple[list[tuple[int, int]], tuple[int, int, int], tuple[int, int, int]]
+
+
+def _iso_faces(
     cx: int,
     base_y: int,
     w_real: int,
     h_real: int,
     color: tuple[int, int, int],
-) -> None:
-    """Draw a single isometric block with three shaded faces"""
+) -> list[_Face]:
+    """Return the left, right and top faces of an isometric block as (points, fill, outline)"""
     hw = w_real // 2
     qw = w_real // 4
     top_y = base_y - h_real - qw * 2
@@ -73,9 +73,105 @@ def _draw_iso_block(
     bot_right = (cx + hw, top_y + qw + h_real)
     bot_front = (cx, top_y + qw * 2 + h_real)
     ec = _shade(color, 0.22)
-    draw.polygon([left, front_top, bot_front, bot_left], fill=_shade(color, 0.70), outline=ec)
-    draw.polygon([front_top, right, bot_right, bot_front], fill=_shade(color, 0.42), outline=ec)
-    draw.polygon([back, right, front_top, left], fill=_shade(color, 1.28), outline=ec)
+    return [
+        ([left, front_top, bot_front, bot_left], _shade(color, 0.70), ec),
+        ([front_top, right, bot_right, bot_front], _shade(color, 0.42), ec),
+        ([back, right, front_top, left], _shade(color, 1.28), ec),
+    ]
+
+
+def _draw_iso_block(
+    draw: ImageDraw.ImageDraw,
+    cx: int,
+    base_y: int,
+    w_real: int,
+    h_real: int,
+    color: tuple[int, int, int],
+) -> None:
+    """Draw a single isometric block with three shaded faces"""
+    for points, fill, outline in _iso_faces(cx, base_y, w_real, h_real, color):
+        draw.polygon(points, fill=fill, outline=outline)
+
+
+def _pixel_runs(
+    img: Image.Image, background: tuple[int, int, int]
+) -> dict[tuple[int, int, int], list[tuple[int, int, int, int]]]:
+    """Cover the non-background pixels of *img* with ``(x, y, w, h)`` rects per color
+
+    Each row is split into runs of one color; a run repeated at the same
+    place on the following rows grows into a taller rect instead of a new one.
+    """
+    # numpy ships with matplotlib; deferred so PNG pixel charts don't pay its import
+    import numpy as np
+
+    rgb = np.asarray(img.convert("RGB"), dtype=np.uint32)
+    packed = rgb[..., 0] << 16 | rgb[..., 1] << 8 | rgb[..., 2]
+    bg = background[0] << 16 | background[1] << 8 | background[2]
+    height, width = packed.shape
+
+    rects: dict[int, list[tuple[int, int, int, int]]] = {}
+    open_runs: dict[tuple[int, int, int], int] = {}
+
+    prev = None
+    for y, row in enumerate(packed):
+        if prev is not None and np.array_equal(row, prev):
+            continue
+        prev = row
+
+        starts = np.flatnonzero(row[1:] != row[:-1]) + 1
+        bounds = [0, *starts.tolist(), width]
+        runs = {
+            (x0, x1, int(row[x0]))
+            for x0, x1 in zip(bounds, bounds[1:], strict=False)
+            if row[x0] != bg
+        }
+
+        for key in open_runs.keys() - runs:
+            x0, x1, color = key
+            y0 = open_runs.pop(key)
+            rects.setdefault(color, []).append((x0, y0, x1 - x0, y - y0))
+        for key in runs - open_runs.keys():
+            open_runs[key] = y
+
+    for (x0, x1, color), y0 in open_runs.items():
+        rects.setdefault(color, []).append((x0, y0, x1 - x0, height - y0))
+
+    return {
+        (c >> 16, c >> 8 & 255, c & 255): sorted(color_rects, key=lambda r: (r[1], r[0]))
+        for c, color_rects in sorted(rects.items())
+    }
+
+
+def _to_svg(
+    img: Image.Image,
+    background: tuple[int, int, int],
+    radius: int,
+    faces: list[_Face],
+) -> str:
+    """Encode a chart as tower polygons plus ``<rect>`` runs of *img* over a rounded background"""
+    w, h = img.size
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" '
+        f'viewBox="0 0 {w} {h}" shape-rendering="crispEdges">',
+        f'<rect width="{w}" height="{h}" rx="{radius}" fill="#{bytes(background).hex()}"/>',
+        # PIL polygon vertices sit on pixel centers, SVG coordinates on pixel corners
+        '<g transform="translate(.5 .5)">',
+    ]
+    parts.extend(
+        f'<polygon points="{" ".join(f"{x},{y}" for x, y in points)}" '
+        f'fill="#{bytes(fill).hex()}" stroke="#{bytes(outline).hex()}"/>'
+        for points, fill, outline in faces
+    )
+    parts.append("</g>")
+
+    for color, rects in _pixel_runs(img, background).items():
+        parts.append(f'<g fill="#{bytes(color).hex()}">')
+        parts.extend(
+            f'<rect x="{x}" y="{y}" width="{rw}" height="{rh}"/>' for x, y, rw, rh in rects
+        )
+        parts.append("</g>")
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
 
 
 def generate_pixel(
@@ -85,6 +181,9 @@ def generate_pixel(
     title: str | None = None,
     theme: str = "light",
     top_n: int = constants.TOP_N,
+    *,
+    segments: list[tuple[str, float]] | None = None,
+    theme_colors: dict[str, str] | None = None,
 ) -> None:
     """Generate a pixel-art isometric tower chart showing language distribution.
 
@@ -95,23 +194,30 @@ def generate_pixel(
     colors : dict[str, str]
         Language name to hex color mapping.
     output : Path
-        Destination PNG file path.
+        Destination file path; a ``.svg`` suffix writes SVG, anything else PNG.
     title : str | None
         Chart title. Defaults to ``"Lang Stats"``.
     theme : str
         Theme name for background and text colors.
     top_n : int
         Maximum number of language segments before grouping into "Other".
+    segments : list[tuple[str, float]] | None
+        Precomputed ``build_display_segments`` output, built when *None*.
+    theme_colors : dict[str, str] | None
+        Resolved theme colors, looked up from *theme* when *None*.
     """
     title = title if title else "Lang Stats"
     log.logger.debug(f"Generating pixel chart with {len(language_stats)} languages...")
 
-    theme_colors = themes.get_theme(theme)
+    if theme_colors is None:
+        theme_colors = themes.get_theme(theme)
+    if segments is None:
+        segments = utils.build_display_segments(language_stats, top_n)
     bg_rgb = utils.hex_to_rgb(theme_colors["background"])
     title_rgb = utils.hex_to_rgb(theme_colors["text"])
     fallback_rgb = utils.hex_to_rgb(theme_colors["fallback"])
 
-    segs = _build_segments(language_stats, colors, top_n, fallback_rgb)
+    segs = _build_segments(segments, colors, fallback_rgb)
 
     px = constants.PIXEL_PX
     fs = constants.PIXEL_FONTSIZE
@@ -123,10 +229,10 @@ def generate_pixel(
     qw = tw // 4
 
     label_strs = [f"{n}  {p:.1f}%" for n, p, *_ in segs]
-    max_label_w_real = max((fonts.text_width(s, scale=fs) for s in label_strs), default=0)
-    title_w_real = fonts.text_width(title, scale=tfs)
+    # layout from glyph metrics only, bitmaps are rendered once when drawing
+    max_label_w_real = max((fonts.text_size(s, scale=fs)[0] for s in label_strs), default=0)
+    title_w_real, title_h_real = fonts.text_size(title, scale=tfs)
     font_h_real = fonts.text_height(scale=fs)
-    title_h_real = fonts.text_height(scale=tfs)
 
     dot_area_real = (
         constants.PIXEL_LABEL_GAP + constants.PIXEL_LABEL_DOT + constants.PIXEL_LABEL_OFF
@@ -153,10 +259,18 @@ def generate_pixel(
     cx_real = constants.PIXEL_PAD + cx_log * px
     tower_base_real = constants.PIXEL_PAD + title_area_real + top_extra_real + th * px
 
-    for _, _, color, y_top, y_bot in segs:
-        blk_base_real = tower_base_real - y_top * px
-        blk_h_real = (y_bot - y_top) * px
-        _draw_iso_block(draw, cx_real, blk_base_real, tw * px, blk_h_real, color)
+    faces = [
+        face
+        for _, _, color, y_top, y_bot in segs
+        for face in _iso_faces(
+            cx_real, tower_base_real - y_top * px, tw * px, (y_bot - y_top) * px, color
+        )
+    ]
+    svg = output.suffix == ".svg"
+    # the tower's diagonal edges stay polygons in SVG, only the rest becomes rect runs
+    if not svg:
+        for points, fill, outline in faces:
+            draw.polygon(points, fill=fill, outline=outline)
 
     label_x0_real = cx_real + hw * px + constants.PIXEL_LABEL_GAP * px
 
@@ -189,8 +303,11 @@ def generate_pixel(
     ty = constants.PIXEL_PAD
     img.alpha_composite(title_img, dest=(tx, ty))
 
-    img = utils.add_rounded_corners(img, radius=constants.ROUNDED_CORNER_RADIUS)
-
     output.parent.mkdir(parents=True, exist_ok=True)
-    img.save(output)
+    if svg:
+        svg_text = _to_svg(img, bg_rgb, constants.ROUNDED_CORNER_RADIUS, faces)
+        output.write_text(svg_text, encoding="utf-8")
+    else:
+        img = utils.add_rounded_corners(img, radius=constants.ROUNDED_CORNER_RADIUS)
+        utils.save_png(img, output)
     log.logger.success(f"Saved pixel chart to {output}")
@@ -1,5 +1,11 @@
+from __future__ import annotations
+
+from functools import lru_cache
 import io
 from pathlib import Path
+import re
+from typing import TYPE_CHECKING
+from typing import cast
 
 import matplotlib.pyplot as plt
 from PIL import Image
@@ -8,6 +14,65 @@ from PIL import ImageDraw
 from . import constants
 
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from typing_extensions import Buffer
+
+
+class _FigureCache:
+    """Figures kept per size between charts once ``reuse_figures`` is called"""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.figures: dict[tuple[float, float], Figure] = {}
+
+
+_figure_cache = _FigureCache()
+
+
+def reuse_figures() -> None:
+    """Keep one matplotlib figure per size and clear it between charts.
+
+    Meant for long-lived render workers: charts draw into a cleared figure
+    (``clf()``) instead of creating one and closing it every time.
+    """
+    _figure_cache.enabled = True
+
+
+def new_figure(figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    """Return a current figure of *figsize* with a single axes.
+
+    Parameters
+    ----------
+    figsize : tuple[float, float]
+        Figure size in inches.
+
+    Returns
+    -------
+    tuple[Figure, Axes]
+        A fresh figure, or the cleared figure of that size when reusing.
+    """
+    if not _figure_cache.enabled:
+        return plt.subplots(figsize=figsize)
+
+    fig = _figure_cache.figures.get(figsize)
+    if fig is None:
+        fig = _figure_cache.figures[figsize] = plt.figure(figsize=figsize)
+    else:
+        fig.clf()
+        plt.figure(fig)  # savefig works on the current figure
+
+    return fig, fig.add_subplot()
+
+
+def _release_figure() -> None:
+    """Close the current figure unless it is kept for reuse"""
+    fig = plt.gcf()
+    if fig not in _figure_cache.figures.values():
+        plt.close(fig)
+
+
 def build_display_segments(
     language_stats: dict[str, int],
     top_n: int,
@@ -65,15 +130,45 @@ def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
 
 
+_Box = tuple[int, int, int, int]
+
+
+@lru_cache(maxsize=constants.ROUNDED_MASK_CACHE_SIZE)
+def _corner_masks(size: tuple[int, int], radius: int) -> tuple[tuple[_Box, Image.Image], ...]:
+    """Return ``(box, alpha)`` tiles covering every pixel the rounded mask makes transparent"""
+    width, height = size
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle([(0, 0), size], radius=radius, fill=255)
+
+    if radius <= 0:
+        return ()
+    if 2 * radius > min(width, height):
+        # corners overlap, keep the whole mask
+        return (((0, 0, width, height), mask),)
+
+    # the arcs never reach past radius pixels from their corner
+    boxes = [
+        (0, 0, radius, radius),
+        (width - radius, 0, width, radius),
+        (0, height - radius, radius, height),
+        (width - radius, height - radius, width, height),
+    ]
+    return tuple((box, mask.crop(box)) for box in boxes)
+
+
 def add_rounded_corners(
     img: Image.Image, radius: int = constants.ROUNDED_CORNER_RADIUS
 ) -> Image.Image:
-    """Return a copy of *img* with rounded-corner alpha masking applied.
+    """Round the corners of *img* by masking their alpha.
+
+    RGBA images are updated in place; other modes are converted first. Only
+    the four corner regions are touched, using masks cached per size and
+    radius, so alpha elsewhere is left as it is.
 
     Parameters
     ----------
     img : Image.Image
-        Source image (converted to RGBA internally).
+        Source image.
     radius : int
         Corner radius in pixels.
 
@@ -82,16 +177,90 @@ def add_rounded_corners(
     Image.Image
         RGBA image with transparent corners.
     """
-    img = img.convert("RGBA")
-    mask = Image.new("L", img.size, 0)
-    draw = ImageDraw.Draw(mask)
-    draw.rounded_rectangle([(0, 0), img.size], radius=radius, fill=255)
-    img.putalpha(mask)
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+
+    for box, alpha in _corner_masks(img.size, radius):
+        corner = img.crop(box)
+        corner.putalpha(alpha)
+        img.paste(corner, box)
+
     return img
 
 
-def save_matplotlib_chart(output: Path, background_color: str) -> None:
-    """Save the current matplotlib figure to PNG with rounded corners.
+def round_svg_corners(svg: str, radius: float) -> str:
+    """Clip a matplotlib SVG figure to a rounded rectangle.
+
+    Parameters
+    ----------
+    svg : str
+        SVG document written by matplotlib's SVG backend.
+    radius : float
+        Corner radius in viewBox units (points).
+
+    Returns
+    -------
+    str
+        The document with ``figure_1`` clipped to its rounded viewBox.
+    """
+    view_box = re.search(r'viewBox="0 0 ([\d.]+) ([\d.]+)"', svg)
+    if view_box is None:
+        return svg
+
+    width, height = view_box.groups()
+    clip = (
+        '<defs><clipPath id="ghlang-corners">'
+        f'<rect width="{width}" height="{height}" rx="{radius:g}"/>'
+        "</clipPath></defs>\n "
+    )
+    return svg.replace(
+        '<g id="figure_1">', f'{clip}<g id="figure_1" clip-path="url(#ghlang-corners)">', 1
+    )
+
+
+class _AggBuffer(io.BytesIO):
+    """Sink for ``savefig(format="rgba")`` that keeps the Agg buffer instead of copying it"""
+
+    view: memoryview | None = None
+
+    def write(self, buffer: Buffer, /) -> int:
+        self.view = memoryview(buffer)
+        return self.view.nbytes
+
+
+def save_png(
+    img: Image.Image,
+    output: Path,
+    compress_level: int = constants.PNG_COMPRESS_LEVEL,
+    optimize: bool = constants.PNG_OPTIMIZE,
+) -> None:
+    """Encode *img* to *output* as PNG.
+
+    Parameters
+    ----------
+    img : Image.Image
+        Image to save.
+    output : Path
+        Destination file path.
+    compress_level : int
+        zlib compression level, 0 (fastest) to 9 (smallest).
+    optimize : bool
+        Run the encoder's extra size-optimizing pass.
+    """
+    img.save(output, format="PNG", compress_level=compress_level, optimize=optimize)
+
+
+def save_matplotlib_chart(
+    output: Path,
+    background_color: str,
+    compress_level: int = constants.PNG_COMPRESS_LEVEL,
+    optimize: bool = constants.PNG_OPTIMIZE,
+) -> None:
+    """Save the current matplotlib figure with rounded corners.
+
+    A ``.svg`` *output* is written as vector SVG with the corners clipped;
+    any other suffix is rasterized to PNG. PNGs are taken straight from the
+    Agg canvas buffer and encoded once, with no intermediate PNG.
 
     Parameters
     ----------
@@ -99,18 +268,46 @@ def save_matplotlib_chart(output: Path, background_color: str) -> None:
         Destination file path. Parent directories are created if needed.
     background_color : str
         Hex color used as the figure face color.
+    compress_level : int
+        PNG zlib compression level, 0 (fastest) to 9 (smallest).
+    optimize : bool
+        Run the PNG encoder's extra size-optimizing pass.
     """
-    # TODO: re-enable SVG support once PNG pipeline is stable
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    buf = io.BytesIO()
+    if output.suffix == ".svg":
+        buf = io.StringIO()
+        # fixed ids and no date so re-rendering unchanged stats gives the same file
+        with plt.rc_context({"svg.hashsalt": "ghlang"}):
+            plt.savefig(
+                buf,
+                format="svg",
+                bbox_inches="tight",
+                facecolor=background_color,
+                metadata={"Date": None},
+            )
+        _release_figure()
+
+        # the PNG corner radius is in pixels at PNG_DPI, SVG units are points
+        radius = constants.ROUNDED_CORNER_RADIUS * 72 / constants.PNG_DPI
+        output.write_text(round_svg_corners(buf.getvalue(), radius), encoding="utf-8")
+        return
+
+    # savefig still applies the tight bbox, "rgba" just hands over the rendered buffer
+    agg = _AggBuffer()
     plt.savefig(
-        buf, format="png", dpi=constants.PNG_DPI, bbox_inches="tight", facecolor=background_color
+        agg, format="rgba", dpi=constants.PNG_DPI, bbox_inches="tight", facecolor=background_color
     )
-    plt.close()
-    buf.seek(0)
+    _release_figure()
+
+    view = agg.view
+    if view is None or view.shape is None:
+        raise RuntimeError("matplotlib did not render an RGBA buffer")
 
-    img = Image.open(buf)
+    height, width = view.shape[:2]
+    # frombuffer takes any buffer without copying, PIL only annotates bytes
+    data = cast("bytes", view)
+    img = Image.frombuffer("RGBA", (width, height), data, "raw", "RGBA", 0, 1)
 
     rounded = add_rounded_corners(img)
-    rounded.save(output)
+    save_png(rounded, output, compress_level=compress_level, optimize=optimize)
@@ -1,6 +1,8 @@
 from datetime import datetime
 import json
 from pathlib import Path
+import threading
+from typing import NamedTuple
 from typing import cast
 
 from . import config
@@ -8,40 +10,111 @@ from . import constants
 from . import exceptions
 from . import log
 from .net import client as net_client
+from .net import refresh as net_refresh
 from .static import themes as static_themes
 
 
-def _fetch_remote_themes(cache_path: Path, force: bool = False) -> dict[str, dict[str, str]]:
-    """Fetch remote theme manifest with local cache"""
+class _Loaded(NamedTuple):
+    """A merged theme registry and the file state it was built from"""
+
+    signature: tuple[int | None, ...]
+    loaded_at: datetime
+    themes: dict[str, dict[str, str]]
+
+
+# process-wide registry, keyed by config dir
+_registry: dict[Path, _Loaded] = {}
+_registry_lock = threading.Lock()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write *text* to *path* via a temp file so readers never see a partial file"""
+    tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+
+    try:
+        tmp.write_text(text)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _read_cached_themes(cache_path: Path) -> tuple[dict[str, dict[str, str]] | None, bool]:
+    """Return the cached manifest (None if unreadable) and whether it is within the TTL"""
     cache_meta = cache_path.with_suffix(".json.meta")
 
-    if not force and cache_path.exists() and cache_meta.exists():
+    try:
+        themes = cast(dict[str, dict[str, str]], json.loads(cache_path.read_text()))
+    except (json.JSONDecodeError, OSError):
+        return None, False
+
+    try:
+        meta = json.loads(cache_meta.read_text())
+        cached_time = datetime.fromisoformat(meta["timestamp"])
+    except (json.JSONDecodeError, KeyError, ValueError, OSError):
+        return themes, False
+
+    return themes, datetime.now() - cached_time < constants.THEME_CACHE_TTL
+
+
+def _download_themes(cache_path: Path) -> dict[str, dict[str, str]]:
+    """Fetch the remote manifest and store it (and its timestamp) in the cache"""
+    r = net_client.get(constants.MANIFEST_URL, timeout=constants.REQUEST_TIMEOUT)
+    r.raise_for_status()
+    themes = cast(dict[str, dict[str, str]], r.json())
+
+    _write_atomic(cache_path, json.dumps(themes, indent=2))
+    _write_atomic(
+        cache_path.with_suffix(".json.meta"),
+        json.dumps(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "url": constants.MANIFEST_URL,
+            }
+        ),
+    )
+
+    return themes
+
+
+def _refresh_in_background(cache_path: Path) -> threading.Thread | None:
+    """Start refreshing a stale manifest on a tracked daemon thread, unless one is running.
+
+    ``net.refresh.wait_for_refresh`` lets it land before the CLI exits; if it
+    still hasn't, the stale cache is served again (and refreshed) next time.
+    """
+
+    def refresh() -> None:
         try:
-            meta = json.loads(cache_meta.read_text())
-            cached_time = datetime.fromisoformat(meta["timestamp"])
+            _download_themes(cache_path)
+            log.logger.debug("Refreshed remote themes in the background")
+        except (
+            exceptions.RequestError,
+            exceptions.HTTPError,
+            json.JSONDecodeError,
+            OSError,
+        ) as e:
+            log.logger.debug(f"Background theme refresh failed: {e}")
 
-            if datetime.now() - cached_time < constants.THEME_CACHE_TTL:
-                return cast(dict[str, dict[str, str]], json.loads(cache_path.read_text()))
+    return net_refresh.refresh_in_background(cache_path, refresh, "ghlang-theme-refresh")
 
-        except (json.JSONDecodeError, KeyError, ValueError, OSError):
-            pass
 
-    try:
-        r = net_client.get(constants.MANIFEST_URL, timeout=constants.REQUEST_TIMEOUT)
-        r.raise_for_status()
-        themes = cast(dict[str, dict[str, str]], r.json())
-
-        cache_path.write_text(json.dumps(themes, indent=2))
-        cache_meta.write_text(
-            json.dumps(
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "url": constants.MANIFEST_URL,
-                }
-            )
-        )
+def _fetch_remote_themes(cache_path: Path, force: bool = False) -> dict[str, dict[str, str]]:
+    """Fetch remote theme manifest with local cache.
 
-        return themes
+    A stale cache is served as-is while a background thread revalidates it
+    (stale-while-revalidate); only a missing cache or *force* blocks on the
+    network.
+    """
+    if not force:
+        cached, fresh = _read_cached_themes(cache_path)
+
+        if cached is not None:
+            if not fresh:
+                _refresh_in_background(cache_path)
+            return cached
+
+    try:
+        return _download_themes(cache_path)
 
     except (exceptions.RequestError, exceptions.HTTPError, json.JSONDecodeError, OSError) as e:
         log.logger.warning(f"Couldn't fetch remote themes: {e}")
@@ -81,6 +154,60 @@ def load_all_themes(config_dir: Path, force_refresh: bool = False) -> dict[str,
     return themes
 
 
+def _mtime(path: Path) -> int | None:
+    """Return the mtime of *path* in nanoseconds, None if it's missing"""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _signature(config_dir: Path) -> tuple[int | None, ...]:
+    """Return the mtimes of every file the registry is built from (None if missing)"""
+    names = ("themes.json", "themes.json.meta", "custom_themes.json")
+    return tuple(_mtime(config_dir / name) for name in names)
+
+
+def get_registry(config_dir: Path) -> dict[str, dict[str, str]]:
+    """Return the merged themes for *config_dir*, loading them at most once per change.
+
+    The registry is rebuilt only when ``themes.json``, its ``.meta`` file or
+    ``custom_themes.json`` change on disk, or once the remote cache TTL has
+    lapsed; otherwise lookups are served from memory.
+
+    Parameters
+    ----------
+    config_dir : Path
+        Config directory containing ``themes.json`` and ``custom_themes.json``.
+
+    Returns
+    -------
+    dict[str, dict[str, str]]
+        Merged theme registry keyed by theme name.
+    """
+    with _registry_lock:
+        loaded = _registry.get(config_dir)
+        signature = _signature(config_dir)
+
+        if (
+            loaded is not None
+            and loaded.signature == signature
+            and datetime.now() - loaded.loaded_at < constants.THEME_CACHE_TTL
+        ):
+            return loaded.themes
+
+        themes = load_all_themes(config_dir)
+        # loading may have rewritten the remote cache
+        _registry[config_dir] = _Loaded(_signature(config_dir), datetime.now(), themes)
+        return themes
+
+
+def invalidate_registry() -> None:
+    """Drop every loaded theme registry so the next lookup reloads from disk"""
+    with _registry_lock:
+        _registry.clear()
+
+
 def get_theme(theme: str) -> dict[str, str]:
     """Look up a theme by name, falling back to light if not found.
 
@@ -96,7 +223,7 @@ def get_theme(theme: str) -> dict[str, str]:
     """
     config_dir = config.get_config_path().parent
 
-    all_themes = load_all_themes(config_dir)
+    all_themes = get_registry(config_dir)
     if theme not in all_themes:
         log.logger.warning(f"No '{theme}' theme exists, using light instead")
         return static_themes.THEMES["light"]
@@ -0,0 +1,74 @@
+"""Compare render-batch's warm worker pool with one process per chart.
+
+Usage: python scripts/bench_batch.py [charts] [workers]
+"""
+
+import os
+from pathlib import Path
+import subprocess
+from sys import argv
+from sys import executable
+import tempfile
+import time
+
+
+STATS = {"Python": 45000, "Rust": 30000, "JavaScript": 20000, "TypeScript": 15000, "Go": 10000}
+COLORS = {"Python": "#3572A5", "Rust": "#dea584", "JavaScript": "#f1e05a", "Go": "#00ADD8"}
+STYLES = ("pixel", "pie", "bar")
+
+# a cold process per chart, like calling the CLI once per chart
+ONE_SHOT = """
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from ghlang.static import themes
+from ghlang.styles import get_style_registry
+
+with patch("ghlang.themes.get_theme", side_effect=lambda t: themes.THEMES[t]):
+    get_style_registry()[sys.argv[1]]({stats}, {colors}, Path(sys.argv[2]), "Bench", "light")
+"""
+
+
+def main() -> None:
+    from ghlang import log
+    from ghlang.cli import batch
+    from ghlang.static import themes
+
+    log.logger.configure(quiet=True)
+    charts = int(argv[1]) if len(argv) > 1 else 60
+    workers = int(argv[2]) if len(argv) > 2 else None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = [
+            batch.BatchJob(
+                line=i + 1,
+                stats=STATS,
+                output=Path(tmp) / f"chart_{i}.png",
+                style=STYLES[i % len(STYLES)],
+            )
+            for i in range(charts)
+        ]
+
+        start = time.perf_counter()
+        batch.render_jobs(jobs, COLORS, {"light": themes.THEMES["light"]}, workers)
+        pooled = charts / (time.perf_counter() - start)
+
+        script = ONE_SHOT.format(stats=STATS, colors=COLORS)
+        start = time.perf_counter()
+        for style in STYLES:
+            out = Path(tmp) / f"one_shot_{style}.png"
+            subprocess.run(
+                [executable, "-c", script, style, out],
+                check=True,
+                capture_output=True,
+                env={**os.environ, "MPLBACKEND": "Agg"},
+            )
+        one_shot = len(STYLES) / (time.perf_counter() - start)
+
+    print(f"render-batch pool  {pooled:6.2f} charts/s  ({charts} charts)")
+    print(f"process per chart  {one_shot:6.2f} charts/s  ({pooled / one_shot:.1f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
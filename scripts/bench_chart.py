@@ -6,6 +6,7 @@ from sys import argv
 def main() -> None:
     style = argv[1]
     data_dir = Path(argv[2])
+    fmt = argv[3] if len(argv) > 3 else "png"
 
     stats = json.loads((data_dir / "stats.json").read_text())
     colors = json.loads((data_dir / "colors.json").read_text())
@@ -13,7 +14,7 @@ def main() -> None:
     from ghlang.styles import get_style_registry
 
     registry = get_style_registry()
-    registry[style](stats, colors, data_dir / f"{style}.png", "Benchmark", "light")
+    registry[style](stats, colors, data_dir / f"{style}.{fmt}", "Benchmark", "light")
 
 
 if __name__ == "__main__":
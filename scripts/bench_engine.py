@@ -0,0 +1,94 @@
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+from sys import argv
+import threading
+import time
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+
+PER_PAGE = 100
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 65536
+    latency = 0.05
+    num_repos = 1000
+
+    def _repos_page(self, page: int) -> tuple[bytes, str | None]:
+        start = (page - 1) * PER_PAGE
+        names = range(start, min(start + PER_PAGE, self.num_repos))
+        body = json.dumps([{"full_name": f"bench/repo-{i}"} for i in names]).encode()
+
+        last = -(-self.num_repos // PER_PAGE)
+        base = f"http://{self.headers['Host']}/user/repos"
+        link = f'<{base}?page={last}>; rel="last"' if page == 1 and last > 1 else None
+        return body, link
+
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(self.latency)
+
+        parsed = urlparse(self.path)
+        link = None
+        if parsed.path == "/user/repos":
+            page = int(parse_qs(parsed.query).get("page", ["1"])[0])
+            payload, link = self._repos_page(page)
+        else:
+            payload = json.dumps({"Python": 45000, "Rust": 30000}).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if link:
+            self.send_header("Link", link)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def main() -> None:
+    _Handler.num_repos = int(argv[1]) if len(argv) > 1 else 1000
+    _Handler.latency = (int(argv[2]) if len(argv) > 2 else 50) / 1000
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 512
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    from ghlang import log
+    from ghlang.cli.github import _aggregate_languages
+    from ghlang.net.github import GitHubClient
+
+    log.logger.configure(quiet=True)
+
+    def make_client() -> GitHubClient:
+        client = GitHubClient(
+            token="bench", affiliation="owner", visibility="all", ignored_repos=[]
+        )
+        client._api = f"http://127.0.0.1:{server.server_address[1]}"
+        return client
+
+    print(f"{_Handler.num_repos} repos, {_Handler.latency * 1000:.0f} ms simulated latency")
+    for engine in ("thread", "async"):
+        client = make_client()
+        start = time.perf_counter()
+        repos = client.list_repos()
+        _aggregate_languages(client, [repos], stats_output=None, engine=engine)
+        serial = time.perf_counter() - start
+
+        client = make_client()
+        start = time.perf_counter()
+        _aggregate_languages(client, client.iter_repo_pages(), stats_output=None, engine=engine)
+        pipelined = time.perf_counter() - start
+
+        print(f"  {engine:<7} list+fetch {serial:6.2f}s  pipelined {pipelined:6.2f}s")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare bdfparser string drawing + per-pixel recolor against the glyph atlas.
+
+Also times font cold start: parsing cozette.bdf with bdfparser versus
+mapping the packed cozette.bin.
+
+Usage: python scripts/bench_fonts.py [rounds]
+"""
+
+from functools import lru_cache
+from pathlib import Path
+import subprocess
+from sys import argv
+from sys import executable
+import timeit
+
+from bdfparser import Font  # type: ignore[import-untyped]
+from PIL import Image
+
+
+FONT_DIR = Path(__file__).resolve().parent.parent / "ghlang" / "static" / "fonts"
+
+
+@lru_cache(maxsize=1)
+def load_bdf() -> Font:
+    return Font(str(FONT_DIR / "cozette.bdf"))
+
+
+LABELS = ("Python  45.0%", "JavaScript  20.0%", "Other  1.2%")
+TITLE = "LANG STATS"
+COLOR = (53, 114, 165)
+
+
+def render_by_pixel(text: str, color: tuple[int, int, int], scale: int) -> Image.Image:
+    """Previous renderer: draw the string with bdfparser, then recolor pixel by pixel"""
+    bm = load_bdf().draw(text)
+    if scale > 1:
+        bm = bm * scale
+
+    img = Image.frombytes("RGBA", (bm.width(), bm.height()), bm.tobytes("RGBA"))
+    pixels = img.load()
+    assert pixels is not None
+
+    for py in range(img.height):
+        for px in range(img.width):
+            a = pixels[px, py][-1]  # type: ignore[index]
+            if a > 0:
+                pixels[px, py] = (*color, a)
+
+    return img
+
+
+def cold_start(statement: str) -> float:
+    """Best wall time of *statement* plus its first label render in a fresh interpreter"""
+    code = (
+        "import time; from PIL import Image; t = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - t)"
+    )
+    runs = [
+        float(
+            subprocess.run(
+                [executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(3)
+    ]
+    return min(runs) * 1000
+
+
+def main() -> None:
+    from ghlang.static import fonts
+    from ghlang.styles import constants
+
+    rounds = int(argv[1]) if len(argv) > 1 else 20
+
+    for text, scale in [(s, constants.PIXEL_FONTSIZE) for s in LABELS] + [
+        (TITLE, constants.PIXEL_TITLE_FONTSIZE)
+    ]:
+        old, new = render_by_pixel(text, COLOR, scale), fonts.render_text(text, COLOR, scale)
+        if old.tobytes() != new.tobytes():
+            raise SystemExit(f"outputs differ for {text!r} at scale {scale}")
+
+        timings = {}
+        for name, fn in (("by pixel", render_by_pixel), ("atlas", fonts.render_text)):
+            best = min(
+                timeit.repeat(
+                    lambda fn=fn, text=text, scale=scale: fn(text, COLOR, scale),
+                    number=rounds,
+                    repeat=3,
+                )
+            )
+            timings[name] = best / rounds * 1000
+
+        width = min(
+            timeit.repeat(lambda text=text: load_bdf().draw(text).width(), number=rounds, repeat=3)
+        )
+        atlas_width = min(
+            timeit.repeat(
+                lambda text=text, scale=scale: fonts.text_width(text, scale),
+                number=rounds,
+                repeat=3,
+            )
+        )
+
+        print(
+            f"{text!r:<20} x{scale} {new.width}x{new.height}: "
+            f"render {timings['by pixel']:6.2f} -> {timings['atlas']:5.2f} ms, "
+            f"width {width / rounds * 1000:5.2f} -> {atlas_width / rounds * 1000:5.3f} ms"
+        )
+
+    bdf = cold_start(
+        "from bdfparser import Font; "
+        f"Font({str(FONT_DIR / 'cozette.bdf')!r}).draw('Python  45.0%').width()"
+    )
+    packed = cold_start(
+        "from ghlang.static import fonts; fonts.render_text('Python  45.0%', (0, 0, 0), 4)"
+    )
+    print(f"cold start to first label: bdfparser {bdf:6.1f} ms, packed {packed:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare PNG and SVG output of every chart style by render time and file size.
+
+Usage: python scripts/bench_formats.py [rounds]
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from sys import argv
+import tempfile
+import time
+from unittest.mock import patch
+
+
+STATS = {"Python": 45000, "Rust": 30000, "JavaScript": 20000, "TypeScript": 15000, "Go": 10000}
+COLORS = {"Python": "#3572A5", "Rust": "#dea584", "JavaScript": "#f1e05a", "Go": "#00ADD8"}
+
+
+def best_ms(fn: Callable[[], object], rounds: int) -> float:
+    """Best of three averaged runs of *fn*, in milliseconds"""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        timings.append((time.perf_counter() - start) / rounds)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    from ghlang import log
+    from ghlang.static import themes
+    from ghlang.styles import FORMATS
+    from ghlang.styles import get_style_registry
+
+    log.logger.configure(quiet=True)
+    rounds = int(argv[1]) if len(argv) > 1 else 5
+
+    print(f"{'style':<6} {'format':<6} {'ms':>8} {'bytes':>9}")
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        patch("ghlang.themes.get_theme", side_effect=lambda t: themes.THEMES[t]),
+    ):
+        for style, generate in get_style_registry().items():
+            sizes = {}
+            for fmt in FORMATS:
+                out = Path(tmp) / f"{style}.{fmt}"
+                ms = best_ms(
+                    lambda generate=generate, out=out: generate(
+                        STATS, COLORS, out, "Bench", "light"
+                    ),
+                    rounds,
+                )
+                sizes[fmt] = out.stat().st_size
+                print(f"{style:<6} {fmt:<6} {ms:8.1f} {sizes[fmt]:9,}")
+            print(f"{'':<6} svg/png size {sizes['svg'] / sizes['png']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
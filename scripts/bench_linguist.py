@@ -0,0 +1,86 @@
+"""Compare the single-pass linguist parser against the previous line-by-line one.
+
+Usage: python scripts/bench_linguist.py [languages.yml | -] [rounds]
+
+Always runs against linguist's real languages.yml. Without a path (or with
+``-``) it uses the copy kept in the ghlang config directory, downloading it
+from linguist's master branch on the first run so later runs time the same file.
+"""
+
+from pathlib import Path
+import re
+from sys import argv
+import timeit
+
+
+CACHED_YAML = "languages.yml"
+# the real file has several hundred colored languages, anything far below is not it
+MIN_COLORS = 400
+
+_LANG_RE = re.compile(r"^([A-Za-z0-9][\w\s\+\#\-\.\'/\*\(\)]*):$", re.MULTILINE)
+_COLOR_RE = re.compile(r'^\s+color:\s*"(#[0-9A-Fa-f]{6})"', re.MULTILINE)
+
+
+def parse_by_line(text: str) -> dict[str, str]:
+    """Previous parser: two regexes per line over splitlines()"""
+    colors: dict[str, str] = {}
+    current_lang: str | None = None
+
+    for line in text.splitlines():
+        lang_match = _LANG_RE.match(line)
+        if lang_match:
+            current_lang = lang_match.group(1)
+            continue
+
+        if current_lang:
+            color_match = _COLOR_RE.match(line)
+            if color_match:
+                colors[current_lang] = color_match.group(1)
+                current_lang = None
+            elif not line.startswith(" ") and not line.startswith("#") and line.strip():
+                current_lang = None
+
+    return colors
+
+
+def load_languages_yml(arg: str | None) -> tuple[str, Path]:
+    """Read the real languages.yml from *arg*, else the config dir copy, fetching it once"""
+    from ghlang import constants
+    from ghlang import utils
+    from ghlang.net import client
+
+    if arg is not None and arg != "-":
+        path = Path(arg)
+        return path.read_text(), path
+
+    path = utils.get_config_dir() / CACHED_YAML
+    if not path.exists():
+        r = client.get(constants.LINGUIST_URL, timeout=constants.REQUEST_TIMEOUT)
+        r.raise_for_status()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(r.text)
+
+    return path.read_text(), path
+
+
+def main() -> None:
+    from ghlang.net.linguist import _parse_linguist_yaml
+
+    text, source = load_languages_yml(argv[1] if len(argv) > 1 else None)
+    rounds = int(argv[2]) if len(argv) > 2 else 50
+
+    old, new = parse_by_line(text), _parse_linguist_yaml(text)
+    if old != new:
+        diff = set(old.items()) ^ set(new.items())
+        raise SystemExit(f"parsers disagree on {len(diff)} entries: {sorted(diff)[:5]}")
+    if len(new) < MIN_COLORS:
+        raise SystemExit(f"{source} has only {len(new)} colors, is it linguist's languages.yml?")
+
+    print(f"{source}: {len(text) / 1024:.0f} KiB, {len(new)} colors, {rounds} rounds")
+    for name, fn in (("by line", parse_by_line), ("single pass", _parse_linguist_yaml)):
+        best = min(timeit.repeat(lambda fn=fn: fn(text), number=rounds, repeat=5)) / rounds
+        print(f"  {name:<12} {best * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Time the phases of generate_pixel and check a logical-resolution tower rasterizer.
+
+The logical variant draws the tower at one pixel per grid cell and upscales
+it with nearest neighbor; the script reports how many pixels it changes
+relative to the full-resolution tower the chart draws today.
+
+Usage: python scripts/bench_pixel.py [rounds]
+"""
+
+from pathlib import Path
+from sys import argv
+import tempfile
+import time
+from unittest.mock import patch
+
+from PIL import Image
+from PIL import ImageDraw
+
+
+STATS = {"Python": 45000, "Rust": 30000, "JavaScript": 20000, "TypeScript": 15000, "Go": 10000}
+COLORS = {"Python": "#3572A5", "Rust": "#dea584", "JavaScript": "#f1e05a", "Go": "#00ADD8"}
+
+
+def best_ms(fn: object, rounds: int) -> float:
+    """Best of three averaged runs of *fn*, in milliseconds"""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()  # type: ignore[operator]
+        timings.append((time.perf_counter() - start) / rounds)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    from ghlang import log
+    from ghlang.static import fonts
+    from ghlang.static import themes
+    from ghlang.styles import constants
+    from ghlang.styles import pixel
+    from ghlang.styles import utils
+
+    log.logger.configure(quiet=True)
+    rounds = int(argv[1]) if len(argv) > 1 else 10
+
+    px, tw, th = constants.PIXEL_PX, constants.PIXEL_TOWER_W, constants.PIXEL_TOWER_H
+    qw = tw // 4
+    display = utils.build_display_segments(STATS, constants.TOP_N)
+    segs = pixel._build_segments(display, COLORS, (204, 204, 204))
+    w, h = (tw + 2) * px, (th + qw * 2 + 2) * px
+
+    def tower(scale: int) -> Image.Image:
+        img = Image.new("RGBA", (w // scale, h // scale), (255, 255, 255, 255))
+        draw = ImageDraw.Draw(img)
+        unit = px // scale
+        for _, _, color, y_top, y_bot in segs:
+            base = h // scale - unit - y_top * unit
+            blk_h = (y_bot - y_top) * unit
+            pixel._draw_iso_block(draw, w // scale // 2, base, tw * unit, blk_h, color)
+        return img
+
+    def tower_logical() -> Image.Image:
+        return tower(px).resize((w, h), Image.Resampling.NEAREST)
+
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        patch("ghlang.themes.get_theme", side_effect=lambda t: themes.THEMES[t]),
+    ):
+        out = Path(tmp) / "pixel.png"
+        total = best_ms(lambda: pixel.generate_pixel(STATS, COLORS, out, "Bench"), rounds)
+        chart = Image.open(out)
+        chart.load()
+
+        phases = {
+            "tower": best_ms(lambda: tower(1), rounds),
+            "labels + title": best_ms(
+                lambda: [
+                    fonts.render_text(f"{n} {p:.1f}%", c, constants.PIXEL_FONTSIZE)
+                    for n, p, c, *_ in segs
+                ],
+                rounds,
+            ),
+            "rounded corners": best_ms(lambda: utils.add_rounded_corners(chart), rounds),
+            "png encode": best_ms(lambda: chart.save(Path(tmp) / "re.png"), rounds),
+        }
+
+    print(f"generate_pixel {total:7.2f} ms  ({chart.width}x{chart.height})")
+    for name, ms in phases.items():
+        print(f"  {name:<16} {ms:7.2f} ms  {ms / total:6.1%}")
+
+    full, logical = tower(1), tower_logical()
+    changed = sum(a != b for a, b in zip(full.tobytes(), logical.tobytes(), strict=True)) // 4
+    print(
+        f"logical tower {best_ms(tower_logical, rounds):.2f} ms, "
+        f"~{changed} of {w * h} pixels differ from the full-resolution tower"
+    )
+
+
+if __name__ == "__main__":
+    main()
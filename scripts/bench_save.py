@@ -0,0 +1,87 @@
+"""Time save_matplotlib_chart against the old PNG round trip, and sweep PNG settings.
+
+The round trip renders a PNG into memory, decodes it, rounds the corners
+and encodes again; the current path rounds the Agg buffer and encodes once.
+
+Usage: python scripts/bench_save.py [rounds]
+"""
+
+import io
+from pathlib import Path
+from sys import argv
+import tempfile
+import time
+
+import matplotlib
+
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from PIL import Image  # noqa: E402
+
+
+def best_ms(fn: object, rounds: int) -> float:
+    """Best of three averaged runs of *fn*, in milliseconds"""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()  # type: ignore[operator]
+        timings.append((time.perf_counter() - start) / rounds)
+    return min(timings) * 1000
+
+
+def figure() -> None:
+    """Build a pie-sized figure like generate_pie's"""
+    fig, ax = plt.subplots(figsize=(14, 10))
+    fig.patch.set_facecolor("#ffffff")
+    ax.pie([45, 30, 20, 15, 10], startangle=90)
+    ax.legend(
+        ["Python", "Rust", "JavaScript", "TypeScript", "Go"],
+        loc="center left",
+        bbox_to_anchor=(1, 0, 0.5, 1),
+    )
+    ax.set_title("Benchmark", fontsize=24)
+
+
+def main() -> None:
+    from ghlang.styles import constants
+    from ghlang.styles import utils
+
+    rounds = int(argv[1]) if len(argv) > 1 else 3
+
+    def round_trip(output: Path) -> None:
+        buf = io.BytesIO()
+        plt.savefig(
+            buf, format="png", dpi=constants.PNG_DPI, bbox_inches="tight", facecolor="#ffffff"
+        )
+        plt.close()
+        buf.seek(0)
+        utils.add_rounded_corners(Image.open(buf)).save(output)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old, new = Path(tmp) / "old.png", Path(tmp) / "new.png"
+        old_ms = best_ms(lambda: (figure(), round_trip(old)), rounds)
+        new_ms = best_ms(lambda: (figure(), utils.save_matplotlib_chart(new, "#ffffff")), rounds)
+        same = old.read_bytes() == new.read_bytes()
+
+        print(f"png round trip    {old_ms:7.1f} ms")
+        print(f"agg buffer        {new_ms:7.1f} ms  ({old_ms / new_ms:.2f}x, identical: {same})")
+        print()
+
+        print(f"{'level':>5} {'optimize':>8} {'ms':>8} {'bytes':>9}")
+        for level in (1, constants.PNG_COMPRESS_LEVEL, 9):
+            for optimize in (False, True):
+                out = Path(tmp) / f"{level}_{optimize}.png"
+
+                def save(out: Path = out, level: int = level, optimize: bool = optimize) -> None:
+                    figure()
+                    utils.save_matplotlib_chart(out, "#ffffff", level, optimize)
+
+                ms = best_ms(save, rounds)
+                print(f"{level:>5} {optimize!s:>8} {ms:8.1f} {out.stat().st_size:9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,10 @@ Usage:
 Options:
   --imports    Profile import costs.
   --startup    Profile startup time.
-  --charts     Profile chart generation.
+  --charts     Profile chart generation (PNG and SVG).
+  --engines    Compare GitHub fetch engines against a local stand-in API.
+  --linguist   Compare linguist YAML parsers on the real languages.yml.
+  --batch      Compare render-batch's worker pool with one process per chart.
   -h, --help   Show this help message.
 
 Requires: hyperfine, python3, uv.
@@ -28,6 +31,9 @@ for arg in "$@"; do
     --imports) MODE="imports" ;;
     --startup) MODE="startup" ;;
     --charts)  MODE="charts" ;;
+    --engines) MODE="engines" ;;
+    --linguist) MODE="linguist" ;;
+    --batch)   MODE="batch" ;;
     -h|--help) usage; exit 0 ;;
   esac
 done
@@ -119,13 +125,54 @@ run_charts() {
     echo "--- $style style ---"
     hyperfine --warmup 2 --runs 10 \
       --export-json "$RESULTS_DIR/chart_${style}.json" \
-      "uv run python $SCRIPT_DIR/bench_chart.py $style $BENCH_TMPDIR"
+      "uv run python $SCRIPT_DIR/bench_chart.py $style $BENCH_TMPDIR png" \
+      "uv run python $SCRIPT_DIR/bench_chart.py $style $BENCH_TMPDIR svg"
     echo ""
   done
 
+  echo "--- PNG vs SVG (in-process render time, file size) ---"
+  uv run python "$SCRIPT_DIR/bench_formats.py"
+  echo ""
+
+  echo "--- matplotlib PNG save path and compression settings ---"
+  uv run python "$SCRIPT_DIR/bench_save.py"
+  echo ""
+
   echo "Results saved to $RESULTS_DIR/"
 }
 
+run_engines() {
+  echo "=== Fetch engine benchmarks ==="
+  echo ""
+
+  cd "$PROJECT_ROOT"
+
+  for repos in 200 2000; do
+    uv run python "$SCRIPT_DIR/bench_engine.py" "$repos" 50
+    echo ""
+  done
+}
+
+run_linguist() {
+  echo "=== Linguist parser benchmarks ==="
+  echo ""
+
+  cd "$PROJECT_ROOT"
+
+  uv run python "$SCRIPT_DIR/bench_linguist.py"
+  echo ""
+}
+
+run_batch() {
+  echo "=== Batch rendering benchmarks ==="
+  echo ""
+
+  cd "$PROJECT_ROOT"
+
+  uv run python "$SCRIPT_DIR/bench_batch.py"
+  echo ""
+}
+
 echo "ghlang benchmark suite"
 echo "────────────────────────────────────────────────────────────"
 echo ""
@@ -134,12 +181,21 @@ case "$MODE" in
   imports) run_imports ;;
   startup) run_startup ;;
   charts)  run_charts ;;
+  engines) run_engines ;;
+  linguist) run_linguist ;;
+  batch)   run_batch ;;
   all)
     run_imports
     echo "────────────────────────────────────────────────────────────"
     run_startup
     echo "────────────────────────────────────────────────────────────"
     run_charts
+    echo "────────────────────────────────────────────────────────────"
+    run_engines
+    echo "────────────────────────────────────────────────────────────"
+    run_linguist
+    echo "────────────────────────────────────────────────────────────"
+    run_batch
     ;;
 esac
 
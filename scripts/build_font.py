@@ -0,0 +1,56 @@
+"""Pack ghlang/static/fonts/cozette.bdf into the binary font loaded at runtime.
+
+Usage: python scripts/build_font.py
+
+Requires bdfparser (``pip install -e .[dev]``). Layout of ``cozette.bin``,
+all little-endian:
+
+- header: ``b"CZF1"``, bounding box width and height (u16 each), glyph count (u32)
+- index: per glyph, codepoint (u32) and advance width (u16), sorted by codepoint
+- bitmaps: per glyph in index order, the bounding-box tile as 1-bit rows,
+  each row padded to a whole byte (PIL mode ``"1"`` raw layout)
+"""
+
+from pathlib import Path
+import struct
+
+from bdfparser import Font  # type: ignore[import-untyped]
+
+
+FONT_DIR = Path(__file__).resolve().parent.parent / "ghlang" / "static" / "fonts"
+
+
+def pack(font: Font) -> bytes:
+    """Return the packed binary for a parsed BDF *font*"""
+    fbbx, fbby = font.headers["fbbx"], font.headers["fbby"]
+    index = bytearray()
+    bitmaps = bytearray()
+
+    for cp in sorted(font.glyphs):
+        glyph = font.glyphbycp(cp)
+        advance = glyph.meta["dwx0"] or glyph.meta["dwy0"]
+        if advance is None:
+            advance = fbbx
+
+        # same tile Font.draw concatenates: the glyph drawn in its font bounding box
+        rows = glyph.draw().bindata
+        for row in rows:
+            padded = row.ljust(-(-len(row) // 8) * 8, "0")
+            bitmaps += int(padded, 2).to_bytes(len(padded) // 8, "big")
+
+        index += struct.pack("<IH", cp, advance)
+
+    header = struct.pack("<4sHHI", b"CZF1", fbbx, fbby, len(font.glyphs))
+    return bytes(header + index + bitmaps)
+
+
+def main() -> None:
+    font = Font(str(FONT_DIR / "cozette.bdf"))
+    data = pack(font)
+    (FONT_DIR / "cozette.bin").write_bytes(data)
+
+    print(f"Packed {len(font.glyphs)} glyphs into {len(data) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Regenerate ghlang/static/linguist_colors.py from GitHub linguist's languages.yml.
+
+Usage: python scripts/gen_linguist_colors.py [languages.yml]
+
+Without an argument the YAML is downloaded from linguist's master branch.
+"""
+
+import json
+from pathlib import Path
+from sys import argv
+
+from ghlang import constants
+from ghlang.net import client
+from ghlang.net.linguist import _parse_linguist_yaml
+
+
+OUTPUT = Path(__file__).resolve().parent.parent / "ghlang" / "static" / "linguist_colors.py"
+
+HEADER = '''"""Language -> color snapshot of GitHub linguist's languages.yml.
+
+Generated by scripts/gen_linguist_colors.py, do not edit by hand. Used as-is
+until a refreshed map is cached under the config dir.
+"""
+
+from typing import Final
+
+
+COLORS: Final[dict[str, str]] = {
+'''
+
+
+def main() -> None:
+    if len(argv) > 1:
+        text = Path(argv[1]).read_text()
+    else:
+        r = client.get(constants.LINGUIST_URL, timeout=constants.REQUEST_TIMEOUT)
+        r.raise_for_status()
+        text = r.text
+
+    colors = _parse_linguist_yaml(text)
+    lines = [
+        f"    {json.dumps(name)}: {json.dumps(color)},\n" for name, color in sorted(colors.items())
+    ]
+    OUTPUT.write_text(HEADER + "".join(lines) + "}\n")
+
+    print(f"Wrote {len(colors)} colors to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
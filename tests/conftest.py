@@ -1,9 +1,17 @@
+from collections.abc import Iterator
+from email.message import Message
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
 from pathlib import Path
 import sys
+import threading
 from typing import cast
 
 import pytest
 
+from ghlang.net.client import Response
+
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -12,6 +20,7 @@ else:
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
+URL = "https://api.github.com/repos/user/repo/languages"
 
 
 @pytest.fixture
@@ -37,3 +46,81 @@ def minimal_config_content() -> str:
         dict[str, dict[str, str]], tomllib.loads((FIXTURES_DIR / "configs.toml").read_text())
     )
     return configs["minimal"]["content"]
+
+
+def make_response(status: int, body: str = "", url: str = URL, **headers: str) -> Response:
+    """Build a canned Response, header names spelled with ``_`` for ``-``"""
+    msg: Message[str, str] = Message()
+    for name, value in headers.items():
+        msg[name.replace("_", "-")] = value
+    return Response(status, msg, body, url)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler serving ``{path: (status, body)}`` from the server's routes"""
+
+    protocol_version = "HTTP/1.1"
+    # buffer writes so headers and body go out in one segment
+    wbufsize = 65536
+    server: "StandInServer"
+
+    def _reply(self) -> None:
+        status, body = self.server.routes.get(self.path.split("?")[0], (404, "{}"))
+        payload = body.encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if self.server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(payload), 7):
+                chunk = payload[i : i + 7]
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.requests.append(self.path)
+        self._reply()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.server.requests.append(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.posted.append(json.loads(self.rfile.read(length)))
+        self._reply()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Local HTTP server standing in for the GitHub API"""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+        self.routes: dict[str, tuple[int, str]] = {}
+        self.requests: list[str] = []
+        self.posted: list[dict] = []
+        self.chunked = False
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def stand_in_api() -> Iterator[StandInServer]:
+    """Run a local stand-in API server for the duration of a test"""
+    server = StandInServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+
+from PIL import Image
+import pytest
+import typer
+
+from ghlang import exceptions
+from ghlang.cli import batch
+from ghlang.static.themes import THEMES
+
+
+STATS = {"Python": 45000, "Rust": 30000, "Go": 10000}
+
+
+def _write_jobs(path: Path, *jobs: object) -> Path:
+    path.write_text("\n".join(json.dumps(job) for job in jobs) + "\n")
+    return path
+
+
+@pytest.fixture
+def offline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep colors and themes off the network"""
+    monkeypatch.setattr("ghlang.utils.get_config_dir", lambda: tmp_path)
+    monkeypatch.setattr("ghlang.net.linguist.load_github_colors", lambda **_: {"Python": "#3572A5"})
+    monkeypatch.setattr("ghlang.themes.get_theme", lambda name: THEMES[name])
+
+
+class TestLoadJobs:
+    """Tests for reading JSONL batch files"""
+
+    def test_defaults(self, tmp_path: Path) -> None:
+        path = _write_jobs(tmp_path / "jobs.jsonl", {"stats": STATS, "output": "a.png"})
+
+        assert batch.load_jobs(path) == [batch.BatchJob(line=1, stats=STATS, output=Path("a.png"))]
+
+    def test_all_fields_and_blank_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "jobs.jsonl"
+        job = {"stats": STATS, "title": "T", "theme": "dark", "style": "pie", "output": "b.svg"}
+        path.write_text(f"\n{json.dumps(job)}\n\n")
+
+        [loaded] = batch.load_jobs(path)
+
+        assert (loaded.line, loaded.style, loaded.theme, loaded.title) == (2, "pie", "dark", "T")
+        assert loaded.output == Path("b.svg")
+
+    @pytest.mark.parametrize(
+        ("line", "message"),
+        [
+            ("{not json", "invalid JSON"),
+            ("[1, 2]", "expected a JSON object"),
+            ('{"output": "a.png"}', "'stats'"),
+            ('{"stats": {"Python": "many"}, "output": "a.png"}', "'stats'"),
+            ('{"stats": {}, "output": "a.gif"}', "'output'"),
+            ('{"stats": {}, "output": "a.png", "style": "donut"}', "unknown style"),
+        ],
+    )
+    def test_invalid_line(self, tmp_path: Path, line: str, message: str) -> None:
+        """Should report the offending line number"""
+        path = tmp_path / "jobs.jsonl"
+        path.write_text(f'{{"stats": {{}}, "output": "ok.png"}}\n{line}\n')
+
+        with pytest.raises(exceptions.BatchJobError, match=f"line 2: .*{message}"):
+            batch.load_jobs(path)
+
+
+@pytest.mark.usefixtures("offline")
+class TestRenderBatch:
+    """Tests for rendering jobs in the worker pool"""
+
+    def test_renders_every_job(self, tmp_path: Path) -> None:
+        """Should render each style and format to its output"""
+        jobs = [
+            {"stats": STATS, "style": style, "theme": "dark", "output": str(tmp_path / name)}
+            for style, name in [("pixel", "a.png"), ("pie", "b.png"), ("bar", "c.svg")]
+        ]
+        path = _write_jobs(tmp_path / "jobs.jsonl", *jobs)
+
+        batch.render_batch(jobs_file=path, workers=2, quiet=True, verbose=False)
+
+        for name in ("a.png", "b.png"):
+            with Image.open(tmp_path / name) as img:
+                assert img.mode == "RGBA"
+        assert (tmp_path / "c.svg").read_text().startswith("<?xml")
+
+    def test_invalid_file_exits(self, tmp_path: Path) -> None:
+        path = _write_jobs(tmp_path / "jobs.jsonl", {"stats": STATS})
+
+        with pytest.raises(typer.Exit):
+            batch.render_batch(jobs_file=path, workers=1, quiet=True, verbose=False)
+
+    def test_failed_job_exits(self, tmp_path: Path) -> None:
+        """Should render the other jobs and exit non-zero"""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        path = _write_jobs(
+            tmp_path / "jobs.jsonl",
+            {"stats": STATS, "output": str(blocker / "a.png")},
+            {"stats": STATS, "output": str(tmp_path / "b.png")},
+        )
+
+        with pytest.raises(typer.Exit):
+            batch.render_batch(jobs_file=path, workers=1, quiet=True, verbose=False)
+
+        assert (tmp_path / "b.png").exists()
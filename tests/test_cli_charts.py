@@ -0,0 +1,86 @@
+from pathlib import Path
+from xml.etree import ElementTree
+
+from PIL import Image
+import pytest
+import typer
+
+from ghlang.cli import charts
+from ghlang.config import Config
+from ghlang.static.themes import THEMES
+
+
+STATS = {"Python": 45000, "Rust": 30000, "Go": 10000}
+
+
+@pytest.fixture
+def chart_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Config:
+    """Offline chart environment writing into tmp_path"""
+    monkeypatch.setattr("ghlang.utils.get_config_dir", lambda: tmp_path)
+    monkeypatch.setattr(
+        "ghlang.net.linguist.load_github_colors",
+        lambda **_: {"Python": "#3572A5", "Rust": "#dea584"},
+    )
+    monkeypatch.setattr("ghlang.themes.get_theme", lambda name: THEMES[name])
+    return Config(output_dir=tmp_path)
+
+
+class TestParseStyles:
+    """Tests for --style value parsing"""
+
+    def test_single(self) -> None:
+        assert charts.parse_styles("pie") == ["pie"]
+
+    def test_list_dedupes_in_order(self) -> None:
+        assert charts.parse_styles("bar, pixel,bar") == ["bar", "pixel"]
+
+    def test_all(self) -> None:
+        assert charts.parse_styles("all") == ["pixel", "pie", "bar"]
+
+    def test_unknown_exits(self) -> None:
+        with pytest.raises(typer.Exit):
+            charts.parse_styles("pixel,donut")
+
+
+class TestGenerateCharts:
+    """Tests for rendering one or several styles"""
+
+    def test_single_style(self, chart_env: Config) -> None:
+        """Should render just the requested style in-process"""
+        charts.generate_charts(STATS, chart_env, style="pixel")
+
+        assert [p.name for p in chart_env.output_dir.glob("*.png")] == ["language_pixel.png"]
+
+    def test_all_styles(self, chart_env: Config) -> None:
+        """Should render every style from one call"""
+        charts.generate_charts(STATS, chart_env, style="all")
+
+        for name in ("pixel", "pie", "bar"):
+            with Image.open(chart_env.output_dir / f"language_{name}.png") as img:
+                assert img.mode == "RGBA"
+
+    def test_svg_format(self, chart_env: Config) -> None:
+        """Should write every style as a well-formed SVG document"""
+        charts.generate_charts(STATS, chart_env, style="all", fmt="svg")
+
+        assert not list(chart_env.output_dir.glob("*.png"))
+        for name in ("pixel", "pie", "bar"):
+            root = ElementTree.parse(chart_env.output_dir / f"language_{name}.svg").getroot()
+            assert root.tag == "{http://www.w3.org/2000/svg}svg"
+
+    def test_refresh_colors(self, chart_env: Config, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should force a synchronous color refresh when asked"""
+        calls: list[bool] = []
+
+        def fake_load(**kwargs: object) -> dict[str, str]:
+            calls.append(bool(kwargs["force_refresh"]))
+            return {"Python": "#3572A5"}
+
+        monkeypatch.setattr("ghlang.net.linguist.load_github_colors", fake_load)
+        charts.generate_charts(STATS, chart_env, style="pixel", refresh_colors=True)
+
+        assert calls == [True]
+
+    def test_unknown_format_exits(self, chart_env: Config) -> None:
+        with pytest.raises(typer.Exit):
+            charts.generate_charts(STATS, chart_env, fmt="gif")
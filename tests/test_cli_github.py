@@ -0,0 +1,116 @@
+from collections.abc import Iterator
+from pathlib import Path
+import threading
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from ghlang import exceptions
+from ghlang.cli.github import _aggregate_languages
+from ghlang.net.github import GitHubClient
+from ghlang.net.snapshot import SnapshotStore
+
+
+@pytest.fixture
+def fetches() -> dict[str, MagicMock]:
+    """Language fetch stubs, keyed by engine"""
+    return {
+        "thread": MagicMock(side_effect=lambda name: {"Python": len(name)}),
+        "async": AsyncMock(side_effect=lambda _session, name: {"Python": len(name)}),
+    }
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch, fetches: dict[str, MagicMock]) -> GitHubClient:
+    """GitHubClient with language fetches stubbed out"""
+    client = GitHubClient(
+        token="test_token", affiliation="owner", visibility="all", ignored_repos=[]
+    )
+    monkeypatch.setattr(client, "get_repo_languages", fetches["thread"])
+    monkeypatch.setattr(client, "async_session", MagicMock(return_value=AsyncMock()))
+    monkeypatch.setattr(client, "get_repo_languages_async", fetches["async"])
+    return client
+
+
+def _pages(first_fetched: threading.Event) -> Iterator[list[dict]]:
+    yield [{"full_name": "user/a"}, {"full_name": "user/bb"}]
+    # the second page only arrives once work on the first one has started
+    assert first_fetched.wait(timeout=5)
+    yield [{"full_name": "user/ccc"}]
+
+
+class TestAggregateLanguages:
+    """Tests for the pipelined language aggregation"""
+
+    @pytest.mark.parametrize("engine", ["thread", "async"])
+    def test_fetches_while_listing(
+        self, client: GitHubClient, fetches: dict[str, MagicMock], engine: str
+    ) -> None:
+        """Should start fetching languages before the repo listing finishes."""
+        first_fetched = threading.Event()
+        fetch = fetches[engine]
+        inner = fetch.side_effect
+
+        def tracking(*args: object) -> dict[str, int]:
+            first_fetched.set()
+            return inner(*args)
+
+        fetch.side_effect = tracking
+
+        totals = _aggregate_languages(client, _pages(first_fetched), None, engine=engine)
+
+        assert totals == {"Python": len("user/a") + len("user/bb") + len("user/ccc")}
+
+    @pytest.mark.parametrize("engine", ["thread", "async"])
+    def test_skips_failed_repos(
+        self, client: GitHubClient, fetches: dict[str, MagicMock], engine: str
+    ) -> None:
+        """Should skip repos whose languages fail to load."""
+        fetches[engine].side_effect = [{"C": 1}, exceptions.RequestError("boom")]
+
+        totals = _aggregate_languages(
+            client, [[{"full_name": "user/a"}, {"full_name": "user/b"}]], None, engine=engine
+        )
+
+        assert totals == {"C": 1}
+
+    @pytest.mark.parametrize("engine", ["thread", "async"])
+    def test_graphql_backend_batches(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        client: GitHubClient,
+        fetches: dict[str, MagicMock],
+        engine: str,
+    ) -> None:
+        """Should fetch whole groups per request and skip repos GraphQL can't resolve."""
+        batch = MagicMock(
+            side_effect=lambda names: {n: {"Go": len(n)} for n in names if n != "user/gone"}
+        )
+        monkeypatch.setattr(client, "get_languages_batch", batch)
+        page = [{"full_name": f"user/r{i}"} for i in range(60)] + [{"full_name": "user/gone"}]
+
+        totals = _aggregate_languages(client, [page], None, engine=engine, backend="graphql")
+
+        assert totals == {"Go": sum(len(f"user/r{i}") for i in range(60))}
+        assert batch.call_count == 2
+        fetches["thread"].assert_not_called()
+
+    @pytest.mark.parametrize("engine", ["thread", "async"])
+    def test_incremental_fetches_only_changed(
+        self, client: GitHubClient, fetches: dict[str, MagicMock], engine: str, tmp_path: Path
+    ) -> None:
+        """Should merge unchanged repos from the snapshot and fetch only the rest."""
+        snapshot = SnapshotStore(tmp_path / "snap.json")
+        snapshot.record({"id": 1, "full_name": "user/a", "pushed_at": "t1"}, {"C": 5})
+        snapshot.record({"id": 2, "full_name": "user/bb", "pushed_at": "t1"}, {"C": 7})
+        page = [
+            {"id": 1, "full_name": "user/a", "pushed_at": "t1"},
+            {"id": 2, "full_name": "user/bb", "pushed_at": "t2"},
+            {"id": 3, "full_name": "user/ccc", "pushed_at": "t1"},
+        ]
+        totals = _aggregate_languages(client, [page], None, engine=engine, snapshot=snapshot)
+
+        assert totals == {"C": 5, "Python": len("user/bb") + len("user/ccc")}
+        assert fetches[engine].call_count == 2
+        assert snapshot.lookup(page[1]) == {"Python": len("user/bb")}
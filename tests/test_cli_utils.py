@@ -1,4 +1,5 @@
 from ghlang.cli.utils import _format_autocomplete
+from ghlang.cli.utils import process_pool
 from ghlang.cli.utils import themes_autocomplete
 from ghlang.static.themes import THEMES
 
@@ -28,3 +29,13 @@ class TestThemesAutocomplete:
 
     def test_no_match_returns_empty(self) -> None:
         assert themes_autocomplete("zzz") == []
+
+
+class TestProcessPool:
+    def test_does_not_fork(self) -> None:
+        """Should start workers from a forkserver or spawn, never by forking the CLI"""
+        with process_pool(1, print, ()) as pool:
+            context = pool._mp_context
+            assert context is not None
+            assert context.get_start_method() in ("forkserver", "spawn")
+            assert pool.submit(abs, -3).result() == 3
@@ -0,0 +1,105 @@
+from functools import lru_cache
+from pathlib import Path
+
+from bdfparser import Font  # type: ignore[import-untyped]
+from PIL import Image
+import pytest
+
+from ghlang.static import fonts
+
+
+@lru_cache(maxsize=1)
+def _bdf() -> Font:
+    """The source BDF font, parsed with bdfparser"""
+    return Font(str(Path(fonts.__file__).parent / "cozette.bdf"))
+
+
+def _render_reference(text: str, color: tuple[int, int, int], scale: int) -> Image.Image:
+    """Reference render: bdfparser draws the string, then every inked pixel is recolored"""
+    bm = _bdf().draw(text)
+    if scale > 1:
+        bm = bm * scale
+
+    img = Image.frombytes("RGBA", (bm.width(), bm.height()), bm.tobytes("RGBA"))
+    pixels = img.load()
+    assert pixels is not None
+
+    for i, a in enumerate(img.getchannel("A").tobytes()):
+        if a > 0:
+            pixels[i % img.width, i // img.width] = (*color, a)
+
+    return img
+
+
+TEXTS = ["Python  45.0%", "LANG STATS", "C++ 3.2%", "é€✓ ~!@#", "ab\U0010ffff"]
+
+
+class TestPackedFont:
+    """Tests for the packed binary font built from cozette.bdf"""
+
+    def test_metrics_match_bdf(self) -> None:
+        """Should keep the BDF bounding box and glyph set"""
+        font = fonts.load_cozette()
+
+        assert (font.width, font.height) == (_bdf().headers["fbbx"], _bdf().headers["fbby"])
+        assert set(font.glyphs) == set(_bdf().glyphs)
+
+    def test_glyphs_match_bdf(self) -> None:
+        """Should store every glyph's tile and advance exactly as bdfparser draws them"""
+        for cp in _bdf().glyphs:
+            glyph = _bdf().glyphbycp(cp)
+            bm = glyph.draw()
+            expected = Image.frombytes("RGBA", (bm.width(), bm.height()), bm.tobytes("RGBA"))
+
+            tile, advance = fonts._glyph(cp)
+
+            assert tile is not None
+            assert tile.tobytes() == expected.getchannel("A").tobytes(), chr(cp)
+            assert advance == glyph.meta["dwx0"], chr(cp)
+
+
+class TestRenderText:
+    """Tests for atlas-based Cozette text rendering"""
+
+    @pytest.mark.parametrize("scale", [1, 4, 6])
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_matches_reference(self, text: str, scale: int) -> None:
+        """Should produce the same bytes as drawing the whole string with bdfparser"""
+        expected = _render_reference(text, (53, 114, 165), scale)
+        actual = fonts.render_text(text, (53, 114, 165), scale=scale)
+
+        assert actual.mode == "RGBA"
+        assert actual.size == expected.size
+        assert actual.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_width_matches_draw(self, text: str) -> None:
+        """Should measure the same width bdfparser draws, from advances alone"""
+        assert fonts.text_width(text, scale=4) == _bdf().draw(text).width() * 4
+
+    def test_measuring_decodes_no_bitmaps(self) -> None:
+        """Should size text from the advance table without decoding glyph tiles"""
+        fonts._glyph.cache_clear()
+
+        size = fonts.text_size("Python  45.0%", scale=4)
+
+        assert fonts._glyph.cache_info().currsize == 0
+        assert size == fonts.render_text("Python  45.0%", (0, 0, 0), scale=4).size
+
+    def test_empty_text(self) -> None:
+        """Should measure empty text as zero width"""
+        assert fonts.text_width("") == 0
+        assert fonts.render_text("", (0, 0, 0)).width == 0
+
+    def test_keeps_partial_alpha(self) -> None:
+        """Should keep each pixel's alpha when colorizing"""
+        alpha = Image.new("L", (3, 1))
+        alpha.putdata([255, 128, 0])
+
+        out = fonts._colorize(alpha, (10, 20, 30))
+
+        assert [out.getpixel((x, 0)) for x in range(3)] == [
+            (10, 20, 30, 255),
+            (10, 20, 30, 128),
+            (255, 255, 255, 0),
+        ]
@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+import threading
 from typing import cast
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -7,7 +8,10 @@ from unittest.mock import patch
 import pytest
 
 from ghlang import exceptions
+from ghlang import log
 from ghlang.net.github import GitHubClient
+from ghlang.net.github import _page_number
+from ghlang.net.github import _parse_link_header
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -195,3 +199,95 @@ class TestMockedAPIRequests:
 
         assert len(repos) == 1
         assert repos[0]["full_name"] == "user/good"
+
+    def test_fetch_specific_repos_concurrent_keeps_order_and_warnings(
+        self, client: GitHubClient
+    ) -> None:
+        """Should resolve repos concurrently, in input order, warning on 404/403"""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def get(url: str) -> MagicMock:
+            name = url.split("/repos/", 1)[1]
+            # every request must be in flight at once to get past here
+            barrier.wait()
+            if name == "user/gone":
+                raise exceptions.HTTPError(MagicMock(status_code=404, url=url))
+            if name == "org/secret":
+                raise exceptions.HTTPError(MagicMock(status_code=403, url=url))
+            return MagicMock(json=MagicMock(return_value={"full_name": name}))
+
+        names = ["user/b", "user/gone", "user/a", "org/secret"]
+        with (
+            patch.object(client._session, "get", side_effect=get),
+            patch.object(log.logger, "warning") as warning,
+        ):
+            repos = client.fetch_specific_repos(names)
+
+        assert [r["full_name"] for r in repos] == ["user/b", "user/a"]
+        messages = {call.args[0] for call in warning.call_args_list}
+        assert messages == {
+            "Repository not found: user/gone",
+            "Access denied to org/secret (check permissions)",
+        }
+
+    def test_list_repos_fetches_pages_from_last_link(self, client: GitHubClient) -> None:
+        """Should fetch every page named by rel="last" and skip the empty-page probe"""
+        link = (
+            '<https://api.github.com/user/repos?page=2>; rel="next", '
+            '<https://api.github.com/user/repos?page=3>; rel="last"'
+        )
+        pages = {
+            1: [{"full_name": "user/a"}],
+            2: [{"full_name": "user/b"}],
+            3: [{"full_name": "user/c"}],
+        }
+        requested: list[int] = []
+
+        def fake_get(_url: str, params: dict) -> MagicMock:
+            requested.append(params["page"])
+            response = MagicMock()
+            response.json.return_value = pages[params["page"]]
+            response.headers = {"Link": link} if params["page"] == 1 else {}
+            return response
+
+        with patch.object(client._session, "get", side_effect=fake_get):
+            repos = client.list_repos()
+
+        assert sorted(requested) == [1, 2, 3]
+        assert [r["full_name"] for r in repos] == ["user/a", "user/b", "user/c"]
+
+    def test_list_repos_follows_next_without_last(self, client: GitHubClient) -> None:
+        """Should follow rel="next" page by page when no last-page hint is given"""
+        responses = []
+        for i, link in enumerate(['<https://x/user/repos?page=2>; rel="next"', None]):
+            response = MagicMock()
+            response.json.return_value = [{"full_name": f"user/repo-{i}"}]
+            response.headers = {"Link": link} if link else {}
+            responses.append(response)
+
+        with patch.object(client._session, "get", side_effect=responses) as mock_get:
+            repos = client.list_repos()
+
+        assert mock_get.call_count == 2
+        assert len(repos) == 2
+
+
+class TestLinkHeader:
+    """Tests for pagination Link header parsing"""
+
+    def test_parse_link_header(self) -> None:
+        """Should map rel names to URLs"""
+        value = '<https://a/x?page=2>; rel="next", <https://a/x?page=40>; rel="last"'
+        assert _parse_link_header(value) == {
+            "next": "https://a/x?page=2",
+            "last": "https://a/x?page=40",
+        }
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [("https://a/x?per_page=100&page=40", 40), ("https://a/x", None), (None, None)],
+        ids=["page", "no-page", "missing"],
+    )
+    def test_page_number(self, url: str | None, expected: int | None) -> None:
+        """Should extract the page query parameter"""
+        assert _page_number(url) == expected
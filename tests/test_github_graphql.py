@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+import pytest
+
+from ghlang import constants
+from ghlang import exceptions
+from ghlang.net.github import GitHubClient
+from ghlang.net.github import _build_languages_query
+
+from .conftest import StandInServer
+
+
+LANGUAGES = {
+    "user/a": {"Python": 1200, "Shell": 34},
+    "user/b": {"Rust": 9000},
+}
+
+
+def _node(languages: dict[str, int], total: int | None = None) -> dict:
+    return {
+        "languages": {
+            "totalCount": len(languages) if total is None else total,
+            "edges": [{"size": size, "node": {"name": name}} for name, size in languages.items()],
+        }
+    }
+
+
+@pytest.fixture
+def client(stand_in_api: StandInServer) -> GitHubClient:
+    """GitHubClient pointed at the stand-in server"""
+    client = GitHubClient(
+        token="test_token", affiliation="owner", visibility="all", ignored_repos=[]
+    )
+    client._api = stand_in_api.url
+    for name, langs in LANGUAGES.items():
+        stand_in_api.routes[f"/repos/{name}/languages"] = (200, json.dumps(langs))
+    return client
+
+
+class TestLanguagesQuery:
+    """Tests for the aliased GraphQL query builder"""
+
+    def test_one_alias_per_repo(self) -> None:
+        """Should alias each repo and pass owner/name as variables."""
+        query, variables = _build_languages_query(["user/a", "org/b.c"])
+
+        assert "r0: repository(owner: $o0, name: $n0)" in query
+        assert "r1: repository(owner: $o1, name: $n1)" in query
+        assert variables == {"o0": "user", "n0": "a", "o1": "org", "n1": "b.c"}
+
+
+class TestLanguagesBatch:
+    """Tests for GitHubClient.get_languages_batch against a stand-in API"""
+
+    def test_matches_rest_output(self, client: GitHubClient, stand_in_api: StandInServer) -> None:
+        """Should return the same mapping as one REST call per repo, in one request."""
+        data = {"r0": _node(LANGUAGES["user/a"]), "r1": _node(LANGUAGES["user/b"])}
+        stand_in_api.routes["/graphql"] = (200, json.dumps({"data": data}))
+
+        batch = client.get_languages_batch(["user/a", "user/b"])
+
+        assert batch == {name: client.get_repo_languages(name) for name in LANGUAGES}
+        assert stand_in_api.requests.count("/graphql") == 1
+        assert stand_in_api.posted[0]["variables"]["n1"] == "b"
+
+    def test_unresolved_repos_left_out(
+        self, client: GitHubClient, stand_in_api: StandInServer
+    ) -> None:
+        """Should drop repos GraphQL resolved to null and keep the rest."""
+        body = {
+            "data": {"r0": _node(LANGUAGES["user/a"]), "r1": None},
+            "errors": [{"type": "NOT_FOUND", "message": "Could not resolve user/gone"}],
+        }
+        stand_in_api.routes["/graphql"] = (200, json.dumps(body))
+
+        batch = client.get_languages_batch(["user/a", "user/gone"])
+
+        assert batch == {"user/a": LANGUAGES["user/a"]}
+
+    def test_truncated_languages_fall_back_to_rest(
+        self, client: GitHubClient, stand_in_api: StandInServer
+    ) -> None:
+        """Should refetch over REST when a repo has more languages than one page."""
+        data = {"r0": _node({"Rust": 1}, total=150)}
+        stand_in_api.routes["/graphql"] = (200, json.dumps({"data": data}))
+
+        batch = client.get_languages_batch(["user/b"])
+
+        assert batch == {"user/b": LANGUAGES["user/b"]}
+        assert "/repos/user/b/languages" in stand_in_api.requests
+
+    def test_errors_without_data_raise(
+        self, client: GitHubClient, stand_in_api: StandInServer
+    ) -> None:
+        """Should raise GraphQLError when the query produced no data."""
+        body = {"errors": [{"message": "Something went wrong"}]}
+        stand_in_api.routes["/graphql"] = (200, json.dumps(body))
+
+        with pytest.raises(exceptions.GraphQLError, match="Something went wrong"):
+            client.get_languages_batch(["user/a"])
+
+    def test_concurrent_queries_capped(
+        self, client: GitHubClient, stand_in_api: StandInServer
+    ) -> None:
+        """Should keep at most GRAPHQL_MAX_WORKERS queries in flight across threads."""
+        data = {"r0": _node(LANGUAGES["user/a"]), "r1": _node(LANGUAGES["user/b"])}
+        stand_in_api.routes["/graphql"] = (200, json.dumps({"data": data}))
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            batches = list(
+                executor.map(lambda _: client.get_languages_batch(list(LANGUAGES)), range(32))
+            )
+
+        assert all(batch == LANGUAGES for batch in batches)
+        assert client.graphql_concurrency.peak <= constants.GRAPHQL_MAX_WORKERS
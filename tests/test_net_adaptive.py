@@ -0,0 +1,125 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from ghlang import exceptions
+from ghlang.net.adaptive import AdaptiveConcurrency
+from ghlang.net.client import Session
+
+from .conftest import URL
+from .conftest import make_response
+
+
+class TestAdaptiveConcurrency:
+    """Tests for the AIMD worker-count controller"""
+
+    def test_grows_on_stable_latency(self) -> None:
+        """Should add workers while responses stay fast and successful."""
+        ctl = AdaptiveConcurrency(max_workers=32, initial=4)
+
+        for _ in range(40):
+            ctl.acquire()
+            ctl.release(0.1, congested=False)
+
+        assert ctl.workers > 4
+
+    def test_capped_at_max_workers(self) -> None:
+        """Should never grow past max_workers."""
+        ctl = AdaptiveConcurrency(max_workers=6, initial=4)
+
+        for _ in range(500):
+            ctl.acquire()
+            ctl.release(0.1, congested=False)
+
+        assert ctl.workers == 6
+
+    def test_holds_on_slow_responses(self) -> None:
+        """Should not grow when latency rises well above the fastest seen."""
+        ctl = AdaptiveConcurrency(max_workers=32, initial=4)
+        ctl.acquire()
+        ctl.release(0.1, congested=False)
+        before = ctl._limit
+
+        for _ in range(20):
+            ctl.acquire()
+            ctl.release(1.0, congested=False)
+
+        assert ctl._limit == before
+
+    def test_halves_on_congestion(self) -> None:
+        """Should cut the limit multiplicatively on a congested response."""
+        ctl = AdaptiveConcurrency(max_workers=32, initial=16)
+        ctl.acquire()
+        ctl.release(0.1, congested=True)
+
+        assert ctl.workers == 8
+        assert ctl.backoffs == 1
+
+    def test_burst_backs_off_once(self) -> None:
+        """Should only back off once for errors within the same round-trip."""
+        ctl = AdaptiveConcurrency(max_workers=32, initial=16)
+
+        for _ in range(5):
+            ctl.acquire()
+        for _ in range(5):
+            ctl.release(60.0, congested=True)
+
+        assert ctl.workers == 8
+        assert ctl.backoffs == 1
+
+    def test_never_below_one(self) -> None:
+        """Should keep at least one worker no matter how many backoffs."""
+        ctl = AdaptiveConcurrency(max_workers=4, initial=1)
+        ctl.acquire()
+        ctl.release(0.0, congested=True)
+
+        assert ctl.workers == 1
+
+    def test_bounds_in_flight(self) -> None:
+        """Should never let more than the limit run at once."""
+        ctl = AdaptiveConcurrency(max_workers=2, initial=2)
+        gate = threading.Event()
+
+        def worker() -> None:
+            ctl.acquire()
+            gate.wait()
+            ctl.release(0.1, congested=False)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        gate.set()
+        for t in threads:
+            t.join()
+
+        assert ctl.peak == 2
+
+
+class TestSessionConcurrency:
+    """Tests for feeding request outcomes into the controller"""
+
+    def test_success_reported(self) -> None:
+        """Should release the slot without backing off on a 200."""
+        ctl = AdaptiveConcurrency(max_workers=8, initial=4)
+        session = Session(concurrency=ctl)
+
+        with patch.object(session, "_do_get", return_value=make_response(200, "{}")):
+            session.get(URL)
+
+        assert ctl.backoffs == 0
+        assert ctl._in_flight == 0
+
+    def test_rate_limit_backs_off(self) -> None:
+        """Should back off when the API answers 429."""
+        ctl = AdaptiveConcurrency(max_workers=8, initial=4)
+        session = Session(concurrency=ctl)
+
+        with (
+            patch.object(session, "_do_get", return_value=make_response(429, "{}")),
+            pytest.raises(exceptions.HTTPError),
+        ):
+            session.get(URL)
+
+        assert ctl.backoffs == 1
+        assert ctl.workers == 2
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+
+from ghlang import exceptions
+from ghlang.net.aio import AsyncSession
+from ghlang.net.client import Session
+from ghlang.net.github import GitHubClient
+
+from .conftest import StandInServer
+
+
+@pytest.fixture
+def client(stand_in_api: StandInServer) -> GitHubClient:
+    """GitHubClient pointed at the local stand-in API"""
+    client = GitHubClient(
+        token="test_token", affiliation="owner", visibility="all", ignored_repos=[]
+    )
+    client._api = stand_in_api.url
+    return client
+
+
+def _add_repos(server: StandInServer, count: int) -> list[str]:
+    names = [f"user/repo-{i}" for i in range(count)]
+    for i, name in enumerate(names):
+        server.routes[f"/repos/{name}/languages"] = (200, json.dumps({"Python": i, "C": 1}))
+    return names
+
+
+async def _fetch_all(client: GitHubClient, names: list[str], max_connections: int) -> list:
+    session = client.async_session(max_connections=max_connections)
+    try:
+        return await asyncio.gather(
+            *(client.get_repo_languages_async(session, name) for name in names),
+            return_exceptions=True,
+        )
+    finally:
+        await session.aclose()
+
+
+class TestAsyncSession:
+    """Tests for the asyncio fetch engine"""
+
+    @pytest.mark.parametrize("chunked", [False, True], ids=["content-length", "chunked"])
+    def test_fetches_languages(
+        self, client: GitHubClient, stand_in_api: StandInServer, chunked: bool
+    ) -> None:
+        """Should match the threaded client's output for both body framings."""
+        stand_in_api.chunked = chunked
+        names = _add_repos(stand_in_api, 20)
+
+        results = asyncio.run(_fetch_all(client, names, max_connections=4))
+
+        assert results == [client.get_repo_languages(name) for name in names]
+
+    def test_http_errors_raise(self, client: GitHubClient, stand_in_api: StandInServer) -> None:
+        """Should surface 404s as HTTPError like the threaded engine."""
+        names = _add_repos(stand_in_api, 2) + ["user/gone"]
+
+        results = asyncio.run(_fetch_all(client, names, max_connections=2))
+
+        assert isinstance(results[2], exceptions.HTTPError)
+        assert results[2].response.status_code == 404
+
+    def test_connection_pool_is_bounded(
+        self, client: GitHubClient, stand_in_api: StandInServer
+    ) -> None:
+        """Should never hold more connections than the pool allows."""
+        names = _add_repos(stand_in_api, 50)
+
+        async def run() -> int:
+            session = client.async_session(max_connections=3)
+            try:
+                await asyncio.gather(
+                    *(client.get_repo_languages_async(session, name) for name in names)
+                )
+                return sum(len(conns) for conns in session._idle.values())
+            finally:
+                await session.aclose()
+
+        assert asyncio.run(run()) <= 3
+        assert len(stand_in_api.requests) == 50
+
+    @pytest.mark.parametrize(
+        "reply",
+        [
+            b"HTTP/1.1 abc OK\r\nContent-Length: 0\r\n\r\n",
+            b"HTTP/1.1 200 OK\r\nContent-Length: many\r\n\r\n",
+            b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n\xff\xfe",
+        ],
+        ids=["status", "content-length", "body-encoding"],
+    )
+    def test_malformed_response_frees_slot(self, reply: bytes) -> None:
+        """Should raise RequestError and hand the pool slot back on a malformed response."""
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(reply)
+            await writer.drain()
+            writer.close()
+
+        async def fails(session: AsyncSession, url: str) -> bool:
+            try:
+                await asyncio.wait_for(session.get_async(url), timeout=5)
+            except exceptions.RequestError:
+                return True
+            return False
+
+        async def run() -> list[bool]:
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/x"
+            session = AsyncSession(Session(), max_connections=1)
+            try:
+                # more requests than slots, a leaked slot would hang the next one
+                return [await fails(session, url) for _ in range(3)]
+            finally:
+                await session.aclose()
+                server.close()
+                await server.wait_closed()
+
+        assert asyncio.run(run()) == [True, True, True]
@@ -0,0 +1,105 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ghlang.net.cache import CacheEntry
+from ghlang.net.cache import ResponseCache
+from ghlang.net.client import Response
+from ghlang.net.client import Session
+
+from .conftest import URL
+from .conftest import make_response
+
+
+def _entry(body: str = "{}") -> CacheEntry:
+    return CacheEntry(url=URL, etag='"abc"', last_modified=None, headers=[], body=body)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    """Empty response cache in a temp dir"""
+    return ResponseCache(tmp_path / "http_cache")
+
+
+class TestResponseCache:
+    """Tests for the on-disk response cache"""
+
+    def test_roundtrip(self, cache: ResponseCache) -> None:
+        """Should return what was stored."""
+        cache.put("k", _entry('{"Python": 10}'))
+        entry = cache.get("k")
+
+        assert entry is not None
+        assert entry.body == '{"Python": 10}'
+        assert entry.conditional_headers() == {"If-None-Match": '"abc"'}
+
+    def test_persists_across_instances(self, cache: ResponseCache) -> None:
+        """Should reload entries written by a previous run."""
+        cache.put("k", _entry())
+        assert ResponseCache(cache.cache_dir).get("k") is not None
+
+    def test_key_depends_on_identity(self) -> None:
+        """Should never share entries between tokens."""
+        assert ResponseCache.make_key(URL, "token-a") != ResponseCache.make_key(URL, "token-b")
+
+    def test_evicts_least_recently_used(self, cache: ResponseCache) -> None:
+        """Should drop the oldest entry once the size cap is exceeded."""
+        body = "x" * 100
+        cache.put("a", _entry(body))
+        cache.max_bytes = 2 * len(cache._path("a").read_bytes())
+
+        cache.put("b", _entry(body))
+        cache.get("a")
+        cache.put("c", _entry(body))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.evictions == 1
+
+    def test_corrupt_entry_is_a_miss(self, cache: ResponseCache) -> None:
+        """Should treat unreadable entries as absent."""
+        cache.put("k", _entry())
+        cache._path("k").write_text("{broken")
+
+        assert cache.get("k") is None
+
+
+class TestSessionCache:
+    """Tests for conditional requests in Session.get"""
+
+    def test_stores_and_revalidates(self, cache: ResponseCache) -> None:
+        """Should send If-None-Match and serve a 304 from the cache."""
+        session = Session(cache=cache)
+        sent: list[dict[str, str]] = []
+        responses = [
+            make_response(200, '{"Python": 10}', ETag='"abc"'),
+            make_response(304, X_RateLimit_Remaining="4999"),
+        ]
+
+        def fake_get(_conn: object, _path: str, _url: str, headers: dict[str, str]) -> Response:
+            sent.append(headers)
+            return responses.pop(0)
+
+        with patch.object(session, "_do_get", side_effect=fake_get):
+            first = session.get(URL)
+            second = session.get(URL)
+
+        assert "If-None-Match" not in sent[0]
+        assert sent[1]["If-None-Match"] == '"abc"'
+        assert first.from_cache is False
+        assert second.status_code == 200
+        assert second.from_cache is True
+        assert second.json() == {"Python": 10}
+        assert second.headers["X-RateLimit-Remaining"] == "4999"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_skips_responses_without_validators(self, cache: ResponseCache) -> None:
+        """Should not store responses that cannot be revalidated."""
+        session = Session(cache=cache)
+
+        with patch.object(session, "_do_get", return_value=make_response(200, "[]")):
+            session.get(URL)
+
+        assert cache.get(session._cache_key(URL)) is None
@@ -63,12 +63,14 @@ class TestSession:
         call_count = 0
         original_do_get = session._do_get
 
-        def flaky_get(conn: HTTPSConnection, path: str, url: str) -> Response:
+        def flaky_get(
+            conn: HTTPSConnection, path: str, url: str, headers: dict[str, str]
+        ) -> Response:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
                 raise OSError("connection reset")
-            return original_do_get(conn, path, url)
+            return original_do_get(conn, path, url, headers)
 
         with patch.object(session, "_do_get", side_effect=flaky_get):
             r = session.get("https://api.github.com")
@@ -0,0 +1,207 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from ghlang import constants
+from ghlang import exceptions
+from ghlang.net.linguist import _parse_linguist_yaml
+from ghlang.net.linguist import _refresh_in_background
+from ghlang.net.linguist import load_github_colors
+from ghlang.net.refresh import wait_for_refresh
+from ghlang.static.linguist_colors import COLORS
+
+from .conftest import make_response
+
+
+YAML = """---
+Python:
+  type: programming
+  color: "#3572A5"
+Rust:
+  type: programming
+  color: "#dea584"
+"""
+# a language the bundled snapshot doesn't carry
+BEFUNGE = """Befunge:
+  type: programming
+  color: "#000002"
+"""
+
+
+def _write_cache(config_dir: Path, timestamp: str, etag: str | None = '"abc"') -> Path:
+    cache_path = config_dir / constants.LINGUIST_CACHE_FILE
+    cache_path.write_text(
+        json.dumps(
+            {
+                "timestamp": timestamp,
+                "etag": etag,
+                "last_modified": None,
+                "colors": {"Python": "#000001"},
+            }
+        )
+    )
+    return cache_path
+
+
+class TestParseLinguistYaml:
+    """Tests for the single-pass linguist YAML parser"""
+
+    def test_basic(self) -> None:
+        """Should map each language header to its color"""
+        assert _parse_linguist_yaml(YAML) == {"Python": "#3572A5", "Rust": "#dea584"}
+
+    def test_color_after_other_keys(self) -> None:
+        """Should find the color past lists, comments and blank lines in the block"""
+        text = (
+            "C++:\n"
+            "  type: programming\n"
+            "  aliases:\n"
+            "  - cpp\n"
+            "\n"
+            "# trailing comment\n"
+            '  color: "#f34b7d"\n'
+        )
+        assert _parse_linguist_yaml(text) == {"C++": "#f34b7d"}
+
+    def test_language_without_color(self) -> None:
+        """Should not borrow the next language's color"""
+        text = 'Text:\n  type: prose\nGo:\n  color: "#00ADD8"\n'
+        assert _parse_linguist_yaml(text) == {"Go": "#00ADD8"}
+
+    def test_special_names(self) -> None:
+        """Should keep names with spaces, punctuation and apostrophes"""
+        text = 'Ren\'Py:\n  color: "#ff7f7f"\nObjective-C++:\n  color: "#6866fb"\n'
+        assert _parse_linguist_yaml(text) == {"Ren'Py": "#ff7f7f", "Objective-C++": "#6866fb"}
+
+    def test_crlf(self) -> None:
+        """Should handle CRLF line endings"""
+        assert _parse_linguist_yaml(YAML.replace("\n", "\r\n")) == {
+            "Python": "#3572A5",
+            "Rust": "#dea584",
+        }
+
+    def test_crlf_blank_line_in_block(self) -> None:
+        """Should skip blank CRLF lines inside a block, as with LF"""
+        text = 'Python:\r\n  type: programming\r\n\r\n  color: "#3572A5"\r\n'
+        assert _parse_linguist_yaml(text) == {"Python": "#3572A5"}
+
+
+class TestOfflineFirst:
+    """Tests for serving colors without waiting on the network"""
+
+    def test_snapshot_without_cache_dir(self) -> None:
+        """Should return the bundled snapshot and never touch the network"""
+        with patch("ghlang.net.client.get") as get:
+            colors = load_github_colors()
+
+        get.assert_not_called()
+        assert colors == COLORS
+
+    def test_first_run_fetches_full_table(self, tmp_path: Path) -> None:
+        """Should fetch the full table synchronously when no cache exists yet"""
+        with (
+            patch(
+                "ghlang.net.client.get",
+                return_value=make_response(200, YAML + BEFUNGE, constants.LINGUIST_URL),
+            ),
+            patch("ghlang.net.linguist._refresh_in_background") as refresh,
+        ):
+            colors = load_github_colors(cache_dir=tmp_path)
+
+        refresh.assert_not_called()
+        assert colors["Befunge"] == "#000002"
+        assert (tmp_path / constants.LINGUIST_CACHE_FILE).exists()
+
+    def test_first_run_offline_uses_snapshot(self, tmp_path: Path) -> None:
+        """Should fall back to the snapshot when the first fetch fails"""
+        with patch("ghlang.net.client.get", side_effect=exceptions.RequestError("offline")):
+            colors = load_github_colors(cache_dir=tmp_path)
+
+        assert colors == COLORS
+
+    def test_fresh_cache_overlays_snapshot(self, tmp_path: Path) -> None:
+        """Should prefer cached colors over the snapshot without refreshing"""
+        _write_cache(tmp_path, "2099-01-01T00:00:00")
+
+        with patch("ghlang.net.linguist._refresh_in_background") as refresh:
+            colors = load_github_colors(cache_dir=tmp_path)
+
+        refresh.assert_not_called()
+        assert colors["Python"] == "#000001"
+        assert colors["Rust"] == COLORS["Rust"]
+
+    def test_stale_cache_served_then_refreshed(self, tmp_path: Path) -> None:
+        """Should serve a stale cache and revalidate it in the background"""
+        _write_cache(tmp_path, "2000-01-01T00:00:00")
+
+        with patch("ghlang.net.linguist._refresh_in_background") as refresh:
+            colors = load_github_colors(cache_dir=tmp_path)
+
+        assert colors["Python"] == "#000001"
+        refresh.assert_called_once()
+
+    def test_force_refresh_offline(self, tmp_path: Path) -> None:
+        """Should keep the bundled colors when a forced refresh fails"""
+        with patch("ghlang.net.client.get", side_effect=exceptions.RequestError("offline")):
+            colors = load_github_colors(cache_dir=tmp_path, force_refresh=True)
+
+        assert colors == COLORS
+
+
+class TestColorCache:
+    """Tests for refreshing the persistent linguist color cache"""
+
+    def test_download_populates_cache(self, tmp_path: Path) -> None:
+        """Should parse the YAML and store colors with their ETag"""
+        cache_path = tmp_path / constants.LINGUIST_CACHE_FILE
+
+        with patch(
+            "ghlang.net.client.get",
+            return_value=make_response(200, YAML, constants.LINGUIST_URL, ETag='"v1"'),
+        ):
+            thread = _refresh_in_background(cache_path, None)
+            assert thread is not None
+            thread.join()
+
+        cached = json.loads(cache_path.read_text())
+        assert cached["etag"] == '"v1"'
+        assert cached["colors"] == {"Python": "#3572A5", "Rust": "#dea584"}
+
+    def test_wait_for_refresh(self, tmp_path: Path) -> None:
+        """Should block until a background refresh has written the cache"""
+        cache_path = _write_cache(tmp_path, "2000-01-01T00:00:00")
+
+        with patch(
+            "ghlang.net.client.get",
+            return_value=make_response(200, YAML, constants.LINGUIST_URL, ETag='"v1"'),
+        ):
+            load_github_colors(cache_dir=tmp_path)
+            wait_for_refresh(timeout=5)
+
+        assert json.loads(cache_path.read_text())["etag"] == '"v1"'
+
+    def test_stale_cache_revalidates(self, tmp_path: Path) -> None:
+        """Should send If-None-Match and keep the cached map on 304"""
+        _write_cache(tmp_path, "2000-01-01T00:00:00")
+
+        with patch(
+            "ghlang.net.client.get", return_value=make_response(304, url=constants.LINGUIST_URL)
+        ) as get:
+            colors = load_github_colors(cache_dir=tmp_path, force_refresh=True)
+
+        assert get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        assert colors["Python"] == "#000001"
+        cached = json.loads((tmp_path / constants.LINGUIST_CACHE_FILE).read_text())
+        assert not cached["timestamp"].startswith("2000")
+
+    def test_corrupt_cache_refetches(self, tmp_path: Path) -> None:
+        """Should ignore an unreadable cache file"""
+        (tmp_path / constants.LINGUIST_CACHE_FILE).write_text("not json")
+
+        with patch(
+            "ghlang.net.client.get", return_value=make_response(200, YAML, constants.LINGUIST_URL)
+        ) as get:
+            colors = load_github_colors(cache_dir=tmp_path, force_refresh=True)
+
+        assert get.call_args.kwargs["headers"] == {}
+        assert colors["Rust"] == "#dea584"
@@ -0,0 +1,131 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ghlang import exceptions
+from ghlang.net.client import Session
+from ghlang.net.ratelimit import RateLimiter
+
+from .conftest import URL
+from .conftest import make_response
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record sleeps on a fake clock instead of blocking"""
+    calls: list[float] = []
+    now = [1_000_000.0]
+
+    def fake_sleep(seconds: float) -> None:
+        calls.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr("ghlang.net.ratelimit.time.time", lambda: now[0])
+    monkeypatch.setattr("ghlang.net.ratelimit.time.sleep", fake_sleep)
+    return calls
+
+
+class TestRateLimiter:
+    """Tests for the shared rate-limit scheduler"""
+
+    def test_no_wait_with_budget(self, sleeps: list[float]) -> None:
+        """Should not block while budget remains."""
+        limiter = RateLimiter()
+        limiter.update(
+            make_response(200, X_RateLimit_Remaining="10", X_RateLimit_Reset="9999999999")
+        )
+        limiter.acquire()
+
+        assert sleeps == []
+
+    def test_waits_for_reset_when_exhausted(self, sleeps: list[float]) -> None:
+        """Should block until reset once in-flight requests use up the budget."""
+        reset = int(time.time()) + 30
+        limiter = RateLimiter()
+        limiter.update(make_response(200, X_RateLimit_Remaining="1", X_RateLimit_Reset=str(reset)))
+
+        limiter.acquire()
+        assert sleeps == []
+
+        limiter.acquire()
+        assert sleeps == [pytest.approx(30)]
+
+    def test_uncharged_responses_keep_budget(self, sleeps: list[float]) -> None:
+        """Should not run dry while 304s leave the server's remaining count flat."""
+        reset = str(int(time.time()) + 3000)
+        limiter = RateLimiter()
+        limiter.update(make_response(200, X_RateLimit_Remaining="100", X_RateLimit_Reset=reset))
+
+        for _ in range(500):
+            limiter.acquire()
+            limiter.update(make_response(304, X_RateLimit_Remaining="100", X_RateLimit_Reset=reset))
+
+        assert sleeps == []
+        assert limiter._remaining == 100
+
+    def test_release_returns_reservation(self, sleeps: list[float]) -> None:
+        """Should give back the budget of a request that failed without a response."""
+        reset = str(int(time.time()) + 30)
+        limiter = RateLimiter()
+        limiter.update(make_response(200, X_RateLimit_Remaining="1", X_RateLimit_Reset=reset))
+
+        limiter.acquire()
+        limiter.release()
+        limiter.acquire()
+
+        assert sleeps == []
+
+    def test_ignores_stale_window(self) -> None:
+        """Should not let a late response from an old window reset the budget."""
+        limiter = RateLimiter()
+        limiter.update(make_response(200, X_RateLimit_Remaining="4000", X_RateLimit_Reset="200"))
+        limiter.update(make_response(200, X_RateLimit_Remaining="5", X_RateLimit_Reset="100"))
+
+        assert limiter._remaining == 4000
+
+    @pytest.mark.parametrize(
+        ("status", "body", "headers", "expected"),
+        [
+            (429, "", {"Retry_After": "5"}, True),
+            (403, "", {"X_RateLimit_Remaining": "0"}, True),
+            (403, "You have exceeded a secondary rate limit", {}, True),
+            (403, "Resource not accessible by integration", {}, False),
+            (500, "", {"Retry_After": "5"}, False),
+        ],
+        ids=["retry-after", "primary", "secondary", "forbidden", "server-error"],
+    )
+    def test_is_rate_limited(
+        self, status: int, body: str, headers: dict[str, str], expected: bool
+    ) -> None:
+        """Should only treat rate-limit rejections as throttling."""
+        assert RateLimiter().is_rate_limited(make_response(status, body, **headers)) is expected
+
+
+class TestSessionRateLimit:
+    """Tests for rate-limit retries in Session.get"""
+
+    def test_retries_after_secondary_limit(self, sleeps: list[float]) -> None:
+        """Should pause for Retry-After and retry instead of failing."""
+        limiter = RateLimiter()
+        session = Session(limiter=limiter)
+        responses = [make_response(429, Retry_After="7"), make_response(200, "{}")]
+
+        with patch.object(session, "_do_get", side_effect=lambda *_: responses.pop(0)):
+            r = session.get(URL)
+
+        assert r.status_code == 200
+        assert sleeps == [pytest.approx(7)]
+        assert limiter.throttled == 1
+
+    def test_gives_up_after_max_retries(self, sleeps: list[float]) -> None:
+        """Should raise HTTPError once retries are exhausted."""
+        session = Session(limiter=RateLimiter())
+
+        with (
+            patch.object(session, "_do_get", return_value=make_response(429, Retry_After="1")),
+            pytest.raises(exceptions.HTTPError),
+        ):
+            session.get(URL)
+
+        assert len(sleeps) == 3
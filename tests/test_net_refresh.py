@@ -0,0 +1,45 @@
+from pathlib import Path
+import threading
+
+from ghlang.net.refresh import refresh_in_background
+from ghlang.net.refresh import wait_for_refresh
+
+
+class TestBackgroundRefresh:
+    """Tests for the shared background cache refresh"""
+
+    def test_one_refresh_per_path(self, tmp_path: Path) -> None:
+        """Should not start a second refresh while one for the same path is running"""
+        release = threading.Event()
+        path = tmp_path / "cache.json"
+
+        first = refresh_in_background(path, release.wait, "test-refresh")
+        second = refresh_in_background(path, release.wait, "test-refresh")
+        release.set()
+        wait_for_refresh(timeout=5)
+
+        assert first is not None
+        assert second is None
+        assert not first.is_alive()
+
+    def test_waits_for_every_refresh(self, tmp_path: Path) -> None:
+        """Should join refreshes started for different caches"""
+        done: list[str] = []
+
+        for name in ("colors", "themes"):
+            refresh_in_background(tmp_path / name, lambda name=name: done.append(name), name)
+        wait_for_refresh(timeout=5)
+
+        assert sorted(done) == ["colors", "themes"]
+
+    def test_gives_up_after_timeout(self, tmp_path: Path) -> None:
+        """Should stop waiting on a refresh that outlives the timeout"""
+        release = threading.Event()
+        thread = refresh_in_background(tmp_path / "slow", release.wait, "slow")
+
+        wait_for_refresh(timeout=0.01)
+
+        assert thread is not None
+        assert thread.is_alive()
+        release.set()
+        thread.join()
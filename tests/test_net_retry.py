@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+import pytest
+
+from ghlang import exceptions
+from ghlang.net.client import Response
+from ghlang.net.client import Session
+from ghlang.net.retry import Retrier
+from ghlang.net.retry import RetryPolicy
+
+from .conftest import URL
+from .conftest import make_response
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record backoff sleeps instead of blocking"""
+    calls: list[float] = []
+    monkeypatch.setattr("ghlang.net.retry.time.sleep", calls.append)
+    return calls
+
+
+class TestRetryPolicy:
+    """Tests for backoff delay computation"""
+
+    def test_exponential_growth(self) -> None:
+        """Should double the delay on each attempt without jitter."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=100, jitter=0)
+        assert [policy.delay(i) for i in range(4)] == [0.5, 1.0, 2.0, 4.0]
+
+    def test_capped_at_max_delay(self) -> None:
+        """Should never exceed max_delay."""
+        policy = RetryPolicy(base_delay=1, max_delay=3, jitter=0)
+        assert policy.delay(10) == 3
+
+    def test_jitter_bounds(self) -> None:
+        """Should stay within the jittered range."""
+        policy = RetryPolicy(base_delay=1, max_delay=100, jitter=0.5)
+        delays = [policy.delay(2) for _ in range(50)]
+        assert all(2.0 <= d <= 4.0 for d in delays)
+
+
+class TestSessionRetry:
+    """Tests for transient-failure retries in Session.get"""
+
+    def test_retries_server_error(self, sleeps: list[float]) -> None:
+        """Should retry a 502 and return the eventual success."""
+        retrier = Retrier(RetryPolicy(jitter=0))
+        session = Session(retrier=retrier)
+        responses = [make_response(502), make_response(200, "{}")]
+
+        with patch.object(session, "_do_get", side_effect=lambda *_: responses.pop(0)):
+            r = session.get(URL)
+
+        assert r.status_code == 200
+        assert sleeps == [retrier.policy.base_delay]
+        assert retrier.retries == 1
+        assert retrier.waited == retrier.policy.base_delay
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_retries_network_error(self) -> None:
+        """Should retry when the connection cannot be re-established."""
+        retrier = Retrier(RetryPolicy(jitter=0))
+        session = Session(retrier=retrier)
+        outcomes: list[Exception | Response] = [
+            OSError("reset"),
+            OSError("refused"),
+            make_response(200, "{}"),
+        ]
+
+        def flaky(*_: object) -> Response:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch.object(session, "_do_get", side_effect=flaky):
+            r = session.get(URL)
+
+        assert r.status_code == 200
+        assert retrier.retries == 1
+
+    def test_gives_up_after_max_attempts(self, sleeps: list[float]) -> None:
+        """Should raise HTTPError once attempts are exhausted."""
+        session = Session(retrier=Retrier(RetryPolicy(max_attempts=3)))
+
+        with (
+            patch.object(session, "_do_get", return_value=make_response(503)),
+            pytest.raises(exceptions.HTTPError),
+        ):
+            session.get(URL)
+
+        assert len(sleeps) == 2
+
+    def test_client_errors_not_retried(self, sleeps: list[float]) -> None:
+        """Should not retry a 404."""
+        session = Session(retrier=Retrier())
+
+        with (
+            patch.object(session, "_do_get", return_value=make_response(404)),
+            pytest.raises(exceptions.HTTPError),
+        ):
+            session.get(URL)
+
+        assert sleeps == []
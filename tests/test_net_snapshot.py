@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+
+from ghlang.net.snapshot import SnapshotStore
+
+
+def _repo(repo_id: int, pushed_at: str) -> dict:
+    return {"id": repo_id, "full_name": f"user/r{repo_id}", "pushed_at": pushed_at}
+
+
+class TestSnapshotStore:
+    """Tests for the per-repo incremental snapshot store"""
+
+    def test_reuses_unchanged_repo(self, tmp_path: Path) -> None:
+        """Should return stored languages while pushed_at is unchanged."""
+        store = SnapshotStore(tmp_path / "snap.json")
+        store.record(_repo(1, "2026-01-01T00:00:00Z"), {"Python": 10})
+        store.save()
+
+        reloaded = SnapshotStore(tmp_path / "snap.json")
+
+        assert reloaded.lookup(_repo(1, "2026-01-01T00:00:00Z")) == {"Python": 10}
+        assert reloaded.reused == 1
+
+    def test_changed_or_new_repo_misses(self, tmp_path: Path) -> None:
+        """Should miss for repos pushed since the snapshot and for unknown repos."""
+        store = SnapshotStore(tmp_path / "snap.json")
+        store.record(_repo(1, "2026-01-01T00:00:00Z"), {"Python": 10})
+
+        assert store.lookup(_repo(1, "2026-02-01T00:00:00Z")) is None
+        assert store.lookup(_repo(2, "2026-01-01T00:00:00Z")) is None
+        assert store.lookup({"full_name": "user/no-id"}) is None
+
+    def test_prune_drops_missing_repos(self, tmp_path: Path) -> None:
+        """Should forget repos that are no longer listed."""
+        store = SnapshotStore(tmp_path / "snap.json")
+        store.record(_repo(1, "a"), {"C": 1})
+        store.record(_repo(2, "b"), {"C": 2})
+
+        store.prune({"2"})
+        store.save()
+
+        assert set(json.loads((tmp_path / "snap.json").read_text())) == {"2"}
+
+    def test_corrupt_file_starts_empty(self, tmp_path: Path) -> None:
+        """Should ignore an unreadable snapshot file."""
+        path = tmp_path / "snap.json"
+        path.write_text("{not json")
+
+        assert SnapshotStore(path).lookup(_repo(1, "a")) is None
@@ -0,0 +1,181 @@
+import io
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+from PIL import Image
+from PIL import ImageDraw
+import pytest
+
+from ghlang.styles import pixel
+from ghlang.styles import utils
+
+
+BG = (255, 255, 255)
+
+
+def _paint(size: tuple[int, int], runs: dict) -> Image.Image:
+    """Rasterize pixel runs back onto a background"""
+    img = Image.new("RGB", size, BG)
+    draw = ImageDraw.Draw(img)
+    for color, rects in runs.items():
+        for x, y, w, h in rects:
+            draw.rectangle([x, y, x + w - 1, y + h - 1], fill=color)
+    return img
+
+
+class TestPixelRuns:
+    """Tests for the pixel chart's SVG rect runs"""
+
+    def test_runs_reproduce_image(self) -> None:
+        """Should cover exactly the non-background pixels with their colors"""
+        img = Image.new("RGB", (40, 30), BG)
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([2, 2, 20, 9], fill=(255, 0, 0))
+        draw.rectangle([10, 5, 30, 25], fill=(0, 0, 255))
+        draw.polygon([(5, 28), (35, 12), (35, 28)], fill=(0, 128, 0))
+
+        assert _paint(img.size, pixel._pixel_runs(img, BG)).tobytes() == img.tobytes()
+
+    def test_repeated_rows_merge(self) -> None:
+        """Should emit one rect for a solid block instead of one per row"""
+        img = Image.new("RGB", (16, 16), BG)
+        ImageDraw.Draw(img).rectangle([4, 4, 11, 11], fill=(1, 2, 3))
+
+        assert pixel._pixel_runs(img, BG) == {(1, 2, 3): [(4, 4, 8, 8)]}
+
+    def test_background_only(self) -> None:
+        assert pixel._pixel_runs(Image.new("RGB", (8, 8), BG), BG) == {}
+
+
+class TestRoundSvgCorners:
+    """Tests for clipping matplotlib SVG output"""
+
+    def test_clips_figure(self) -> None:
+        svg = '<svg viewBox="0 0 100.5 50"><g id="figure_1"><path/></g></svg>'
+
+        result = utils.round_svg_corners(svg, 14.4)
+
+        assert '<rect width="100.5" height="50" rx="14.4"/>' in result
+        assert '<g id="figure_1" clip-path="url(#ghlang-corners)">' in result
+
+    def test_without_viewbox_unchanged(self) -> None:
+        svg = '<svg><g id="figure_1"/></svg>'
+        assert utils.round_svg_corners(svg, 10) == svg
+
+
+def _full_mask_rounding(img: Image.Image, radius: int) -> Image.Image:
+    """Round corners with a full-size mask, as add_rounded_corners used to"""
+    img = img.convert("RGBA")
+    mask = Image.new("L", img.size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle([(0, 0), img.size], radius=radius, fill=255)
+    img.putalpha(mask)
+    return img
+
+
+class TestAddRoundedCorners:
+    """Tests for corner-only rounded alpha masking"""
+
+    @pytest.mark.parametrize(
+        ("size", "radius"),
+        [((300, 200), 40), ((1001, 1503), 40), ((81, 81), 40), ((50, 30), 40), ((64, 64), 0)],
+    )
+    def test_matches_full_mask(self, size: tuple[int, int], radius: int) -> None:
+        """Should give the same pixels as masking the whole image"""
+        img = Image.new("RGBA", size, (10, 20, 30, 255))
+
+        expected = _full_mask_rounding(img, radius)
+
+        assert utils.add_rounded_corners(img, radius).tobytes() == expected.tobytes()
+
+    def test_rgba_in_place(self) -> None:
+        img = Image.new("RGBA", (200, 100), (1, 2, 3, 255))
+
+        assert utils.add_rounded_corners(img) is img
+        assert img.getchannel("A").getpixel((0, 0)) == 0
+
+    def test_converts_rgb(self) -> None:
+        img = Image.new("RGB", (200, 100), (1, 2, 3))
+
+        rounded = utils.add_rounded_corners(img)
+
+        assert rounded.mode == "RGBA"
+        assert rounded.tobytes() == _full_mask_rounding(img, 40).tobytes()
+
+    def test_masks_cached_per_size(self) -> None:
+        utils._corner_masks.cache_clear()
+
+        for _ in range(3):
+            utils.add_rounded_corners(Image.new("RGBA", (120, 90)))
+        utils.add_rounded_corners(Image.new("RGBA", (90, 120)))
+
+        info = utils._corner_masks.cache_info()
+        assert (info.hits, info.misses) == (2, 2)
+
+
+def _figure() -> None:
+    fig, ax = plt.subplots(figsize=(4, 3))
+    ax.pie([3, 2, 1])
+    ax.set_title("Test")
+
+
+class TestSaveMatplotlibChart:
+    """Tests for saving matplotlib figures as PNG"""
+
+    def test_matches_png_round_trip(self, tmp_path: Path) -> None:
+        """Should encode the same bytes as rendering, decoding and re-encoding a PNG"""
+        _figure()
+        buf = io.BytesIO()
+        plt.savefig(buf, format="png", dpi=200, bbox_inches="tight", facecolor="#ffffff")
+        plt.close()
+        buf.seek(0)
+        utils.add_rounded_corners(Image.open(buf)).save(tmp_path / "old.png")
+
+        _figure()
+        utils.save_matplotlib_chart(tmp_path / "new.png", "#ffffff")
+
+        assert (tmp_path / "new.png").read_bytes() == (tmp_path / "old.png").read_bytes()
+
+    def test_rounded_corners(self, tmp_path: Path) -> None:
+        _figure()
+        utils.save_matplotlib_chart(tmp_path / "chart.png", "#ffffff")
+
+        with Image.open(tmp_path / "chart.png") as img:
+            assert img.mode == "RGBA"
+            alpha = img.getchannel("A")
+            assert alpha.getpixel((0, 0)) == 0
+            assert alpha.getpixel((img.width // 2, img.height // 2)) == 255
+
+    def test_compress_level(self, tmp_path: Path) -> None:
+        """Should trade size for speed with the compression level"""
+        for level in (0, 9):
+            _figure()
+            utils.save_matplotlib_chart(tmp_path / f"{level}.png", "#ffffff", compress_level=level)
+
+        assert (tmp_path / "9.png").stat().st_size < (tmp_path / "0.png").stat().st_size
+
+
+class TestReuseFigures:
+    """Tests for clearing and reusing figures between charts"""
+
+    def test_reused_figure_same_output(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Should render the same bytes into a cleared figure as into a new one"""
+        _figure()
+        utils.save_matplotlib_chart(tmp_path / "fresh.png", "#ffffff")
+
+        monkeypatch.setattr(utils, "_figure_cache", utils._FigureCache())
+        utils.reuse_figures()
+        fig = None
+        for name in ("first.png", "reused.png"):
+            fig, ax = utils.new_figure((4, 3))
+            ax.pie([3, 2, 1])
+            ax.set_title("Test")
+            utils.save_matplotlib_chart(tmp_path / name, "#ffffff")
+
+        assert len(utils._figure_cache.figures) == 1
+        assert fig is not None
+        assert plt.fignum_exists(fig.number)
+        plt.close(fig)
+        fresh = (tmp_path / "fresh.png").read_bytes()
+        assert (tmp_path / "reused.png").read_bytes() == fresh
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -7,7 +8,11 @@ import pytest
 import typer
 
 from ghlang.cli.theme import theme
+from ghlang.net.refresh import wait_for_refresh
 from ghlang.static.themes import THEMES
+from ghlang.themes import _refresh_in_background
+from ghlang.themes import get_registry
+from ghlang.themes import invalidate_registry
 from ghlang.themes import load_all_themes
 from ghlang.utils import load_themes_by_source
 
@@ -138,6 +143,96 @@ class TestLoadAllThemes:
         assert set(themes.keys()) == set(THEMES.keys())
 
 
+class TestStaleWhileRevalidate:
+    """Tests for serving a stale manifest while refreshing it in the background"""
+
+    def test_serves_stale_cache(self, config_dir_with_remote: Path) -> None:
+        """Should return the stale cache without waiting on the network"""
+        (config_dir_with_remote / "themes.json.meta").write_text(
+            json.dumps({"timestamp": "2000-01-01T00:00:00"})
+        )
+
+        with (
+            patch("ghlang.themes._refresh_in_background") as refresh,
+            patch("ghlang.net.client.get") as get,
+        ):
+            themes = load_all_themes(config_dir_with_remote)
+
+        assert "nord" in themes
+        refresh.assert_called_once_with(config_dir_with_remote / "themes.json")
+        get.assert_not_called()
+
+    def test_fresh_cache_skips_refresh(self, config_dir_with_remote: Path) -> None:
+        """Should not start a refresh while the cache is within the TTL"""
+        with patch("ghlang.themes._refresh_in_background") as refresh:
+            load_all_themes(config_dir_with_remote)
+
+        refresh.assert_not_called()
+
+    def test_background_refresh_writes_cache(self, config_dir: Path) -> None:
+        """Should replace the cache and its timestamp once the fetch lands"""
+        cache_path = config_dir / "themes.json"
+        cache_path.write_text(json.dumps({"old": {}}))
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"dracula": {"background": "#282a36"}}
+
+        with patch("ghlang.net.client.get", return_value=mock_response):
+            thread = _refresh_in_background(cache_path)
+            assert thread is not None
+            thread.join()
+
+        assert "dracula" in json.loads(cache_path.read_text())
+        assert (config_dir / "themes.json.meta").exists()
+        assert list(config_dir.glob("*.tmp")) == []
+
+    def test_wait_for_refresh(self, config_dir_with_remote: Path) -> None:
+        """Should let a stale manifest refresh land before the run exits"""
+        (config_dir_with_remote / "themes.json.meta").write_text(
+            json.dumps({"timestamp": "2000-01-01T00:00:00"})
+        )
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"dracula": {"background": "#282a36"}}
+
+        with patch("ghlang.net.client.get", return_value=mock_response):
+            load_all_themes(config_dir_with_remote)
+            wait_for_refresh(timeout=5)
+
+        assert "dracula" in json.loads((config_dir_with_remote / "themes.json").read_text())
+
+
+class TestRegistry:
+    """Tests for the process-wide theme registry"""
+
+    def test_loads_once(self, config_dir_with_remote: Path) -> None:
+        """Should serve repeat lookups from memory"""
+        with patch("ghlang.themes.load_all_themes", wraps=load_all_themes) as load:
+            first = get_registry(config_dir_with_remote)
+            second = get_registry(config_dir_with_remote)
+
+        assert load.call_count == 1
+        assert first is second
+
+    def test_reloads_on_file_change(self, config_dir_with_custom: Path) -> None:
+        """Should rebuild when custom_themes.json changes on disk"""
+        get_registry(config_dir_with_custom)
+
+        custom_path = config_dir_with_custom / "custom_themes.json"
+        custom_path.write_text(json.dumps({"fresh": {"background": "#000000"}}))
+        os.utime(custom_path, ns=(0, 0))
+
+        assert "fresh" in get_registry(config_dir_with_custom)
+
+    def test_invalidate(self, config_dir_with_remote: Path) -> None:
+        """Should reload after explicit invalidation"""
+        get_registry(config_dir_with_remote)
+        invalidate_registry()
+
+        with patch("ghlang.themes.load_all_themes", wraps=load_all_themes) as load:
+            get_registry(config_dir_with_remote)
+
+        assert load.call_count == 1
+
+
 class TestLoadBySource:
     """Tests for load_themes_by_source helper"""
 